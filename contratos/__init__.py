@@ -0,0 +1,7 @@
+"""
+Núcleo do gerador de contratos musicais.
+
+Os módulos deste pacote não dependem da interface gráfica: contexto, extenso,
+template_docx, geracao e lote podem ser usados sem tkinter/customtkinter.
+A interface fica isolada em contratos.gui.
+"""
@@ -0,0 +1,220 @@
+"""Consulta de endereços por CEP (ViaCEP), com base offline e cache local persistente."""
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+import json
+import sqlite3
+import threading
+import time
+
+from .cep_offline import BaseCepOffline
+
+VIACEP_URL = "https://viacep.com.br/ws/{cep}/json/"
+
+# campo de CEP do formulário -> campos preenchidos com logradouro/bairro/localidade/uf
+ENDERECOS_CEP = {
+    "contratante_endereco_cep": (
+        "contratante_endereco_logradouro",
+        "contratante_endereco_bairro",
+        "contratante_endereco_cidade",
+        "contratante_endereco_uf",
+    ),
+    "contratado_endereco_cep": (
+        "contratado_endereco_logradouro",
+        "contratado_endereco_bairro",
+        "contratado_endereco_cidade",
+        "contratado_endereco_uf",
+    ),
+    "evento_local_cep": (
+        "evento_local_logradouro",
+        "evento_local_bairro",
+        "evento_local_cidade",
+        "evento_local_uf",
+    ),
+}
+CAMPOS_VIACEP = ("logradouro", "bairro", "localidade", "uf")
+
+
+def normalizar_cep(texto: str) -> str:
+    """Mantém só os dígitos do CEP, ex.: '50000-000' -> '50000000'."""
+    return "".join(c for c in (texto or "") if c.isdigit())
+
+
+def campos_do_endereco(dados: dict, destinos: tuple) -> dict:
+    """Valores não vazios da resposta do ViaCEP, já com as chaves do formulário."""
+    return {
+        chave: dados[campo]
+        for chave, campo in zip(destinos, CAMPOS_VIACEP)
+        if dados.get(campo)
+    }
+
+
+class LimiteTaxa:
+    """Espaça as chamadas para no máximo 'por_segundo' por segundo, entre todas as threads."""
+
+    def __init__(self, por_segundo: float):
+        self.intervalo = 1.0 / por_segundo
+        self._proxima = 0.0
+        self._lock = threading.Lock()
+
+    def aguardar(self):
+        with self._lock:
+            agora = time.monotonic()
+            espera = self._proxima - agora
+            self._proxima = max(agora, self._proxima) + self.intervalo
+        if espera > 0:
+            time.sleep(espera)
+
+
+class CacheCep:
+    """
+    Cache persistente (SQLite) das respostas do ViaCEP.
+
+    Cada entrada tem validade própria; respostas {"erro": true} também são
+    guardadas (por menos tempo), para não repetir consultas de CEPs inexistentes.
+    Acima de 'max_itens', as entradas usadas há mais tempo são descartadas.
+    Entradas vencidas continuam disponíveis como último recurso quando não há rede.
+    """
+
+    def __init__(self, caminho: Path, ttl: float = 30 * 86400,
+                 ttl_negativo: float = 86400, max_itens: int = 5000):
+        self.caminho = Path(caminho)
+        self.ttl = ttl
+        self.ttl_negativo = ttl_negativo
+        self.max_itens = max_itens
+
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        # usado pelas threads do ClienteCep; o lock serializa o acesso
+        self._conn = sqlite3.connect(str(self.caminho), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cep ("
+                " cep TEXT PRIMARY KEY,"
+                " dados TEXT NOT NULL,"
+                " expira_em REAL NOT NULL,"
+                " usado_em REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS cep_usado_em ON cep (usado_em)")
+
+    def obter(self, cep: str, aceitar_vencido: bool = False):
+        """Devolve a resposta guardada para o CEP, ou None se não houver (ou se venceu)."""
+        agora = time.time()
+        with self._lock, self._conn:
+            linha = self._conn.execute(
+                "SELECT dados, expira_em FROM cep WHERE cep = ?", (cep,)
+            ).fetchone()
+            if linha is None:
+                return None
+            dados, expira_em = linha
+            if expira_em < agora and not aceitar_vencido:
+                return None
+            self._conn.execute("UPDATE cep SET usado_em = ? WHERE cep = ?", (agora, cep))
+        return json.loads(dados)
+
+    def guardar(self, cep: str, dados: dict):
+        agora = time.time()
+        ttl = self.ttl_negativo if dados.get("erro") else self.ttl
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cep (cep, dados, expira_em, usado_em) VALUES (?, ?, ?, ?)",
+                (cep, json.dumps(dados, ensure_ascii=False), agora + ttl, agora),
+            )
+            (total,) = self._conn.execute("SELECT COUNT(*) FROM cep").fetchone()
+            if total > self.max_itens:
+                self._conn.execute(
+                    "DELETE FROM cep WHERE cep IN"
+                    " (SELECT cep FROM cep ORDER BY usado_em LIMIT ?)",
+                    (total - self.max_itens,),
+                )
+
+    def fechar(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ClienteCep:
+    """
+    Cliente do ViaCEP com uma única requests.Session, reaproveitando as
+    conexões HTTP entre consultas, e um pool de threads para consultas que
+    não podem bloquear quem chama (ex.: a interface). Com um CacheCep, a rede
+    só é consultada quando o CEP não está no cache (ou a entrada venceu); com
+    uma BaseCepOffline, os CEPs presentes nela nem chegam ao cache ou à rede.
+    'por_segundo' limita as requisições ao serviço (consultas locais não contam).
+    """
+
+    def __init__(self, url: str = VIACEP_URL, timeout: float = 5, max_workers: int = 3,
+                 cache: CacheCep | None = None, base_offline: BaseCepOffline | None = None,
+                 por_segundo: float | None = None):
+        self.url = url
+        self.timeout = timeout
+        self.cache = cache
+        self.base_offline = base_offline
+        self.limite = LimiteTaxa(por_segundo) if por_segundo else None
+        self.max_workers = max_workers
+        # a sessão (e o próprio requests) só é criada na primeira consulta à rede
+        self._session = None
+        self._lock_session = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cep")
+
+    @property
+    def session(self):
+        with self._lock_session:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    def consultar_local(self, cep: str):
+        """Endereço na base offline ou resposta válida no cache, sem acessar a rede (ou None)."""
+        if self.base_offline is not None:
+            dados = self.base_offline.obter(cep)
+            if dados is not None:
+                return dados
+        if self.cache is None:
+            return None
+        return self.cache.obter(cep)
+
+    def consultar(self, cep: str) -> dict:
+        """
+        Consulta síncrona. Devolve o JSON do ViaCEP, que traz {"erro": true}
+        quando o CEP não existe; falhas de rede/HTTP viram exceções.
+        """
+        dados = self.consultar_local(cep)
+        if dados is not None:
+            return dados
+
+        if self.limite is not None:
+            self.limite.aguardar()
+        try:
+            resp = self.session.get(self.url.format(cep=cep), timeout=self.timeout)
+            resp.raise_for_status()
+            dados = resp.json()
+        except Exception:
+            # sem rede: uma resposta vencida é melhor que nenhuma
+            vencido = self.cache.obter(cep, aceitar_vencido=True) if self.cache else None
+            if vencido is None:
+                raise
+            return vencido
+
+        if self.cache is not None:
+            self.cache.guardar(cep, dados)
+        return dados
+
+    def consultar_em_segundo_plano(self, cep: str) -> Future:
+        """Agenda a consulta no pool de threads e devolve o Future."""
+        return self._executor.submit(self.consultar, cep)
+
+    def fechar(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._session is not None:
+            self._session.close()
+        if self.cache is not None:
+            self.cache.fechar()
+        if self.base_offline is not None:
+            self.base_offline.fechar()
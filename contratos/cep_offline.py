@@ -0,0 +1,153 @@
+"""
+Base de CEPs offline: arquivo binário ordenado, lido via mmap.
+
+Formato (little-endian):
+
+    cabeçalho   8s I I        mágico, total de registros, reservado
+    registros   total x I I I cep (inteiro), início e tamanho do texto
+    textos      UTF-8         'logradouro␟bairro␟localidade␟uf' de cada CEP
+
+Os registros têm tamanho fixo e estão ordenados por CEP, então a busca é
+binária direto sobre o mmap: abrir a base não lê o arquivo inteiro e cada
+consulta toca só algumas páginas.
+
+    python contracts.py cep-offline ceps.csv [--destino ARQUIVO]
+"""
+from pathlib import Path
+import argparse
+import csv
+import mmap
+import struct
+import sys
+
+from .config import CEP_OFFLINE_PATH
+
+MAGICO = b"CEPBIN1\0"
+_CABECALHO = struct.Struct("<8sII")
+_REGISTRO = struct.Struct("<III")
+_CEP = struct.Struct("<I")
+_SEPARADOR = "\x1f"
+_CAMPOS = ("logradouro", "bairro", "localidade", "uf")
+
+
+class BaseCepOffline:
+    """Leitor da base offline; seguro para uso simultâneo por várias threads."""
+
+    def __init__(self, caminho: Path):
+        self.caminho = Path(caminho)
+        self._arquivo = open(self.caminho, "rb")
+        try:
+            self._mm = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # arquivo vazio
+            self._arquivo.close()
+            raise ValueError(f"Base de CEPs inválida: {self.caminho}")
+        if not self._integra():
+            self.fechar()
+            raise ValueError(f"Base de CEPs inválida: {self.caminho}")
+
+    def _integra(self) -> bool:
+        """Confere o mágico e se o arquivo não foi truncado (lê só o cabeçalho e o último registro)."""
+        try:
+            magico, self.total, _ = _CABECALHO.unpack_from(self._mm, 0)
+            self._inicio_textos = _CABECALHO.size + self.total * _REGISTRO.size
+            if magico != MAGICO:
+                return False
+            if not self.total:
+                return True
+            # os textos seguem a ordem dos CEPs: o do último registro termina no fim da base
+            _, inicio, tamanho = _REGISTRO.unpack_from(self._mm, self._inicio_textos - _REGISTRO.size)
+        except struct.error:
+            return False
+        return self._inicio_textos + inicio + tamanho <= len(self._mm)
+
+    def obter(self, cep: str):
+        """Endereço do CEP (8 dígitos) no formato do ViaCEP, ou None se não estiver na base."""
+        if len(cep) != 8 or not cep.isdigit():
+            return None
+        alvo = int(cep)
+
+        lo, hi = 0, self.total
+        while lo < hi:
+            meio = (lo + hi) // 2
+            (atual,) = _CEP.unpack_from(self._mm, _CABECALHO.size + meio * _REGISTRO.size)
+            if atual < alvo:
+                lo = meio + 1
+            elif atual > alvo:
+                hi = meio
+            else:
+                _, inicio, tamanho = _REGISTRO.unpack_from(
+                    self._mm, _CABECALHO.size + meio * _REGISTRO.size
+                )
+                inicio += self._inicio_textos
+                texto = self._mm[inicio:inicio + tamanho].decode("utf-8")
+                dados = dict(zip(_CAMPOS, texto.split(_SEPARADOR)))
+                dados["cep"] = f"{cep[:5]}-{cep[5:]}"
+                return dados
+        return None
+
+    def fechar(self):
+        self._mm.close()
+        self._arquivo.close()
+
+
+def construir_base_cep(origem_csv: Path, destino: Path) -> int:
+    """
+    Gera a base binária a partir de um CSV com cabeçalho e colunas
+    cep, logradouro, bairro, localidade (ou cidade) e uf; separador ',' ou ';'.
+    Devolve o número de CEPs gravados.
+    """
+    from .cep import normalizar_cep
+
+    registros = {}
+    with open(origem_csv, "r", encoding="utf-8-sig", newline="") as f:
+        amostra = f.read(4096)
+        f.seek(0)
+        dialeto = csv.Sniffer().sniff(amostra, delimiters=",;")
+        for linha in csv.DictReader(f, dialect=dialeto):
+            linha = {(k or "").strip().lower(): (v or "").strip() for k, v in linha.items()}
+            cep = normalizar_cep(linha.get("cep", ""))
+            if len(cep) != 8:
+                continue
+            if not linha.get("localidade"):
+                linha["localidade"] = linha.get("cidade", "")
+            texto = _SEPARADOR.join(linha.get(c, "").replace(_SEPARADOR, " ") for c in _CAMPOS)
+            registros[int(cep)] = texto.encode("utf-8")
+
+    indice = []
+    textos = []
+    inicio = 0
+    for cep in sorted(registros):
+        texto = registros[cep]
+        indice.append(_REGISTRO.pack(cep, inicio, len(texto)))
+        textos.append(texto)
+        inicio += len(texto)
+
+    destino = Path(destino)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    temporario = destino.with_suffix(destino.suffix + ".tmp")
+    with open(temporario, "wb") as f:
+        f.write(_CABECALHO.pack(MAGICO, len(indice), 0))
+        f.writelines(indice)
+        f.writelines(textos)
+    temporario.replace(destino)
+    return len(indice)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="contracts.py cep-offline",
+        description="Gera a base de CEPs offline a partir de um CSV.",
+    )
+    parser.add_argument("origem", type=Path, help="CSV com cep, logradouro, bairro, localidade/cidade, uf")
+    parser.add_argument("--destino", type=Path, default=CEP_OFFLINE_PATH,
+                        help=f"arquivo gerado (padrão: {CEP_OFFLINE_PATH})")
+    args = parser.parse_args(argv)
+
+    try:
+        total = construir_base_cep(args.origem, args.destino)
+    except (OSError, csv.Error) as e:
+        print(f"Erro ao gerar a base de CEPs: {e}", file=sys.stderr)
+        return 2
+
+    print(f"{total} CEP(s) gravados em {args.destino}")
+    return 0
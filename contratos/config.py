@@ -0,0 +1,30 @@
+"""Configuração compartilhada: caminhos de templates/saída e identificação do app."""
+from pathlib import Path
+import os
+import sys
+
+# Diretórios base (funciona tanto no script quanto empacotado com PyInstaller)
+if getattr(sys, "frozen", False):
+    # Rodando empacotado (PyInstaller): arquivos estão em sys._MEIPASS
+    BASE_DIR = Path(sys._MEIPASS)
+else:
+    # Rodando via `python contracts.py`
+    BASE_DIR = Path(__file__).resolve().parent.parent
+
+APP_NAME = "Contratos Musicais"
+APP_VERSION = "0.1.0"  # sem o 'v'
+
+# caminhos dos templates (ajusta se a pasta for outra)
+TEMPLATES_DIR = BASE_DIR / "templates"
+TEMPLATE_CONTRATO = TEMPLATES_DIR / "contrato_som_banda.docx"
+
+# pasta de saída para contratos gerados (criada ao gravar o primeiro contrato)
+SAIDA_DIR = Path.cwd() / "contratos_gerados"
+
+# organização da pasta de saída: "plano", "ano_mes" ou "atracao" (ver contratos.saida)
+LAYOUT_SAIDA = os.environ.get("CONTRATOS_LAYOUT", "plano")
+
+# dados locais do app (caches e índices), fora da pasta de trabalho
+DADOS_DIR = Path.home() / ".contratos_musicais"
+CEP_CACHE_PATH = DADOS_DIR / "cep_cache.sqlite3"
+CEP_OFFLINE_PATH = DADOS_DIR / "ceps.bin"
@@ -0,0 +1,182 @@
+"""
+Armazenamento por conteúdo dos DOCX gerados.
+
+Cada DOCX distinto é renderizado uma única vez e guardado em
+<saída>/.conteudo/ab/<chave>.docx; os _vN.docx são cópias independentes dele
+(reflink, onde o sistema de arquivos permite), que o usuário pode editar à
+vontade. Gerar de novo um contrato com os mesmos dados e o mesmo template não
+renderiza nada: só copia o objeto. A chave de cada _vN.docx vai para o
+manifesto ("conteudo").
+
+Os objetos ficam somente leitura e o sha256 de cada um é gravado ao lado
+(<chave>.sha256): um objeto alterado por fora não é reaproveitado. Objetos
+que nenhuma entrada do manifesto usa mais (ex.: depois de 'regerar') são
+apagados com:
+
+    python contracts.py limpar-conteudo
+"""
+from pathlib import Path
+import argparse
+import hashlib
+import os
+import shutil
+import stat
+import sys
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from .config import SAIDA_DIR
+from .saida import ler_manifesto
+from .template_docx import TemplateCompilado
+
+CONTEUDO_DIR = ".conteudo"
+
+_FICLONE = 0x40049409  # ioctl de linux/fs.h: reflink do arquivo inteiro
+
+
+def caminho_objeto(saida_dir: Path, chave: str) -> Path:
+    return Path(saida_dir) / CONTEUDO_DIR / chave[:2] / f"{chave}.docx"
+
+
+def _sha256_arquivo(caminho: Path) -> str:
+    with open(caminho, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _objeto_integro(objeto: Path) -> bool:
+    """O objeto existe e ainda tem o conteúdo com que foi gravado."""
+    try:
+        esperado = objeto.with_suffix(".sha256").read_text(encoding="ascii").strip()
+        return _sha256_arquivo(objeto) == esperado
+    except OSError:
+        return False  # ausente, ou gravado antes de existir o .sha256
+
+
+def _somente_leitura(caminho: Path):
+    # só os objetos de .conteudo/; no Windows, um arquivo somente leitura não
+    # pode ser trocado por os.replace: lá vale só a verificação do sha256
+    if os.name != "nt":
+        os.chmod(caminho, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+
+
+def _copiar(origem: Path, destino: Path):
+    """Cópia independente; reflink (blocos compartilhados até alguém gravar) se possível."""
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            with open(origem, "rb") as f_origem, open(destino, "wb") as f_destino:
+                fcntl.ioctl(f_destino.fileno(), _FICLONE, f_origem.fileno())
+            return
+        except OSError:
+            pass  # ext4, tmpfs, outro sistema de arquivos que o da origem...
+    shutil.copyfile(origem, destino)
+
+
+def entregar(objeto: Path, destino: Path):
+    """
+    Grava em 'destino' uma cópia do objeto, com as permissões normais de um
+    arquivo novo. Um 'destino' existente é trocado, não sobrescrito no lugar.
+    """
+    destino = Path(destino)
+    temporario = destino.with_name(f".{destino.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        _copiar(objeto, temporario)
+        os.replace(temporario, destino)
+    except BaseException:
+        temporario.unlink(missing_ok=True)
+        raise
+
+
+def _gravar_objeto(objeto: Path, dados: bytes):
+    """
+    Grava o objeto e o seu .sha256 em temporários e troca: outro processo pode
+    estar gravando o mesmo conteúdo. Um objeto alterado por fora é trocado.
+    """
+    objeto.parent.mkdir(parents=True, exist_ok=True)
+    sufixo = f"{os.getpid()}.{threading.get_ident()}.tmp"
+
+    resumo = objeto.with_suffix(".sha256")
+    temporario = resumo.with_name(f"{resumo.name}.{sufixo}")
+    temporario.write_text(hashlib.sha256(dados).hexdigest(), encoding="ascii")
+    os.replace(temporario, resumo)
+
+    temporario = objeto.with_name(f"{objeto.name}.{sufixo}")
+    temporario.write_bytes(dados)
+    _somente_leitura(temporario)
+    os.replace(temporario, objeto)
+
+
+def gravar_documento(saida_dir: Path, template: TemplateCompilado, contexto, destino: Path) -> str:
+    """
+    Grava o DOCX do contexto em 'destino', renderizando só se esse conteúdo
+    ainda não existir (intacto) no armazenamento da pasta de saída. Devolve a
+    chave, que o chamador registra no manifesto.
+    """
+    chave = template.chave_conteudo(contexto)
+    objeto = caminho_objeto(saida_dir, chave)
+
+    for tentativa in range(2):
+        if not _objeto_integro(objeto):
+            _gravar_objeto(objeto, template.gerar_bytes(contexto))
+        try:
+            entregar(objeto, destino)
+        except FileNotFoundError:
+            # objeto apagado por limpar_conteudo entre a verificação e a cópia
+            if tentativa:
+                raise
+        else:
+            return chave
+
+
+# ------------------------------------------------------------------
+# Limpeza
+# ------------------------------------------------------------------
+def limpar_conteudo(saida_dir: Path = SAIDA_DIR, idade_minima: float = 600) -> int:
+    """
+    Apaga os objetos cuja chave não está em nenhuma entrada do manifesto e
+    temporários esquecidos. Arquivos mais novos que 'idade_minima' segundos
+    são mantidos: o contrato que os usa pode ainda não estar no manifesto.
+    Apagar um objeto nunca afeta um _vN.docx (são cópias); só faz o próximo
+    contrato igual ser renderizado de novo. Devolve quantos objetos foram apagados.
+    """
+    usados = {e["conteudo"] for e in ler_manifesto(saida_dir) if "conteudo" in e}
+    limite = time.time() - idade_minima
+    apagados = 0
+    for caminho in sorted((Path(saida_dir) / CONTEUDO_DIR).glob("*/*")):
+        try:
+            st = caminho.stat()
+        except FileNotFoundError:
+            continue
+        if st.st_mtime > limite:
+            continue
+        if caminho.suffix == ".tmp":
+            caminho.unlink(missing_ok=True)
+        elif caminho.suffix == ".docx" and caminho.stem not in usados:
+            caminho.unlink(missing_ok=True)
+            caminho.with_suffix(".sha256").unlink(missing_ok=True)
+            apagados += 1
+        elif caminho.suffix == ".sha256" and not caminho.with_suffix(".docx").exists():
+            caminho.unlink(missing_ok=True)
+    return apagados
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="contracts.py limpar-conteudo",
+        description="Apaga de .conteudo/ os DOCX que nenhum contrato usa mais.",
+    )
+    parser.add_argument("-o", "--saida", type=Path, default=SAIDA_DIR,
+                        help="pasta de saída (padrão: contratos_gerados)")
+    args = parser.parse_args(argv)
+
+    try:
+        apagados = limpar_conteudo(args.saida)
+    except OSError as e:
+        print(f"Erro ao limpar {CONTEUDO_DIR}: {e}", file=sys.stderr)
+        return 1
+    print(f"{apagados} objeto(s) sem uso apagado(s).")
+    return 0
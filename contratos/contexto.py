@@ -0,0 +1,381 @@
+"""Montagem do contexto de placeholders usado nos templates de contrato."""
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
+from functools import cached_property
+
+from .dinheiro import Dinheiro
+from .extenso import data_por_extenso, hora_por_extenso, parse_hora_minuto
+
+# placeholders que são cópia direta de um campo do formulário
+_CAMPOS_DIRETOS = {
+    # CONTRATANTE
+    "CONTRATANTE_NOME": "contratante_nome_razao",
+    "CONTRATANTE_CPF_CNPJ": "contratante_cpf_cnpj",
+    "CONTRATANTE_TELEFONE": "contratante_telefone",
+    "CONTRATANTE_EMAIL": "contratante_email",
+
+    # CONTRATADO
+    "CONTRATADO_TIPO": "contratado_tipo",
+    "CONTRATADO_NOME": "contratado_nome_razao",
+    "CONTRATADO_CPF_CNPJ": "contratado_cpf_cnpj",
+    "CONTRATADO_TELEFONE": "contratado_telefone",
+    "CONTRATADO_EMAIL": "contratado_email",
+    "CONTRATADO_REPRESENTANTE_NOME": "contratado_representante_nome",
+    "CONTRATADO_REPRESENTANTE_CPF": "contratado_representante_cpf",
+
+    # EVENTO
+    "EVENTO_NOME": "evento_nome",
+    "ATRACAO_MUSICAL": "evento_atracao_musical",
+
+    # FAVORECIDO
+    "FAVORECIDO_NOME": "favorecido_nome",
+    "FAVORECIDO_CPF_CNPJ": "favorecido_cpf_cnpj",
+}
+
+# placeholders calculados: chave -> método de ContextoContrato
+_CAMPOS_CALCULADOS = {}
+
+
+def _placeholder(chave: str):
+    """Registra o método como cálculo do placeholder 'chave'."""
+    def registrar(func):
+        _CAMPOS_CALCULADOS[chave] = func
+        return func
+    return registrar
+
+
+class ContextoContrato(Mapping):
+    """
+    Contexto preguiçoso de placeholders -> valores.
+
+    Cada placeholder só é calculado no primeiro acesso e fica memorizado, de
+    modo que templates enxutos (recibos, riders) não pagam pelos campos que
+    não usam, como os valores por extenso ou o cálculo do sinal.
+    """
+
+    def __init__(self, values: dict, som: str, alimentacao: str,
+                 data_contrato: datetime | None = None):
+        self.values = values
+        self.som = som
+        self.alimentacao = alimentacao
+        self.data_contrato = data_contrato
+        self._calculados = {}
+
+    def __getitem__(self, chave):
+        try:
+            return self._calculados[chave]
+        except KeyError:
+            pass
+
+        if chave in _CAMPOS_DIRETOS:
+            valor = self.values.get(_CAMPOS_DIRETOS[chave], "")
+        elif chave in _CAMPOS_CALCULADOS:
+            valor = _CAMPOS_CALCULADOS[chave](self)
+        else:
+            raise KeyError(chave)
+
+        self._calculados[chave] = valor
+        return valor
+
+    def __contains__(self, chave):
+        # não calcula o valor só para responder se a chave existe
+        return chave in _CAMPOS_DIRETOS or chave in _CAMPOS_CALCULADOS
+
+    def __iter__(self):
+        yield from _CAMPOS_DIRETOS
+        yield from _CAMPOS_CALCULADOS
+
+    def __len__(self):
+        return len(_CAMPOS_DIRETOS) + len(_CAMPOS_CALCULADOS)
+
+    def resolver(self, chaves) -> dict:
+        """Calcula apenas as chaves pedidas (ex.: as usadas por um template)."""
+        return {chave: self[chave] for chave in chaves if chave in self}
+
+    # ------------------------------------------------------------------
+    # CONTRATANTE / CONTRATADO
+    # ------------------------------------------------------------------
+    def _endereco_parte(self, prefixo: str) -> str:
+        values = self.values
+        return (
+            f"{values.get(prefixo + '_endereco_logradouro', '')}, "
+            f"{values.get(prefixo + '_endereco_numero', '')} "
+            f"{values.get(prefixo + '_endereco_complemento', '')} - "
+            f"{values.get(prefixo + '_endereco_bairro', '')}, "
+            f"{values.get(prefixo + '_endereco_cidade', '')}/"
+            f"{values.get(prefixo + '_endereco_uf', '')} - "
+            f"CEP {values.get(prefixo + '_endereco_cep', '')}"
+        )
+
+    @_placeholder("CONTRATANTE_ENDERECO_COMPLETO")
+    def _endereco_contratante(self) -> str:
+        return self._endereco_parte("contratante")
+
+    @_placeholder("CONTRATADO_ENDERECO_COMPLETO")
+    def _endereco_contratado(self) -> str:
+        return self._endereco_parte("contratado")
+
+    # ------------------------------------------------------------------
+    # EVENTO
+    # ------------------------------------------------------------------
+    @_placeholder("EVENTO_DATA")
+    def _evento_data(self) -> str:
+        return data_por_extenso(self.values.get("evento_data", ""))
+
+    @_placeholder("EVENTO_HORARIO")
+    def _evento_horario(self) -> str:
+        return (
+            f"{self.values.get('evento_horario_inicio', '')}h às "
+            f"{self.values.get('evento_horario_fim_previsto', '')}h"
+        )
+
+    @_placeholder("EVENTO_LOCAL_COMPLETO")
+    def _evento_local(self) -> str:
+        values = self.values
+        nome_local = values.get("evento_local_nome", "")
+        logradouro_local = values.get("evento_local_logradouro", "")
+        numero_local = values.get("evento_local_numero", "").strip()
+        compl_local = values.get("evento_local_complemento", "").strip()
+        bairro_local = values.get("evento_local_bairro", "")
+        cidade_local = values.get("evento_local_cidade", "")
+        uf_local = values.get("evento_local_uf", "")
+        cep_local = values.get("evento_local_cep", "")
+
+        partes = [nome_local, logradouro_local]
+
+        if numero_local:
+            partes.append(numero_local)
+        if compl_local:
+            # complemento logo após o número, sem vírgula
+            if partes:
+                partes[-1] = f"{partes[-1]} {compl_local}"
+            else:
+                partes.append(compl_local)
+
+        endereco_evento = ", ".join(p for p in partes if p)
+        endereco_evento += f" - {bairro_local}, {cidade_local}/{uf_local} - CEP {cep_local}"
+        return endereco_evento
+
+    # ------------------------------------------------------------------
+    # DURAÇÃO DO EVENTO E HORÁRIO DE CHEGADA
+    # ------------------------------------------------------------------
+    @cached_property
+    def _horarios(self):
+        """(início, fim) como datetimes de uma data fictícia, ou None se inválidos."""
+        inicio_parsed = parse_hora_minuto(self.values.get("evento_horario_inicio", "").strip())
+        fim_parsed = parse_hora_minuto(self.values.get("evento_horario_fim_previsto", "").strip())
+        if not (inicio_parsed and fim_parsed):
+            return None
+
+        ih, im = inicio_parsed
+        fh, fm = fim_parsed
+
+        # usa uma data fictícia apenas para cálculo de diferença
+        inicio_dt = datetime(2000, 1, 1, ih, im)
+        fim_dt = datetime(2000, 1, 1, fh, fm)
+        if fim_dt <= inicio_dt:
+            # se o fim for menor ou igual ao início, assume virada de dia
+            fim_dt += timedelta(days=1)
+        return inicio_dt, fim_dt
+
+    @_placeholder("EVENTO_DURACAO")
+    def _evento_duracao(self) -> str:
+        if not self._horarios:
+            return ""
+        inicio_dt, fim_dt = self._horarios
+
+        diff = fim_dt - inicio_dt
+        total_min = diff.seconds // 60
+        horas = total_min // 60
+        minutos = total_min % 60
+
+        # duração formatada: HH:MM (por extenso)
+        dur_num = f"{horas:02d}:{minutos:02d}"
+        dur_ext = hora_por_extenso(horas, minutos)
+        return f"{dur_num} ({dur_ext})" if dur_ext else dur_num
+
+    @_placeholder("EVENTO_HORARIO_CHEGADA")
+    def _evento_horario_chegada(self) -> str:
+        if not self._horarios:
+            return ""
+        inicio_dt, _ = self._horarios
+
+        # horário de chegada: 1h antes do início
+        chegada_dt = inicio_dt - timedelta(hours=1)
+        ch_num = chegada_dt.strftime("%H:%M")
+        ch_ext = hora_por_extenso(chegada_dt.hour, chegada_dt.minute)
+        return f"{ch_num} ({ch_ext})" if ch_ext else ch_num
+
+    # ------------------------------------------------------------------
+    # PAGAMENTO
+    # ------------------------------------------------------------------
+    @cached_property
+    def valor_total(self):
+        """Valor total como Dinheiro (ou None se o campo não for um valor)."""
+        return Dinheiro.parse(self.values.get("pagamento_valor_total", "").strip())
+
+    @_placeholder("PAGAMENTO_VALOR_TOTAL")
+    def _valor_total(self) -> str:
+        # os textos já trazem o 'R$ ' antes do valor
+        if self.valor_total is None:
+            return self.values.get("pagamento_valor_total", "").strip()
+        return self.valor_total.numero
+
+    @_placeholder("PAGAMENTO_VALOR_TOTAL_EXTENSO")
+    def _valor_extenso(self) -> str:
+        return self.valor_total.extenso if self.valor_total else ""
+
+    @_placeholder("PAGAMENTO_FORMA_DESCRICAO")
+    def _pagamento_texto(self) -> str:
+        values = self.values
+        forma_pag = values.get("pagamento_forma", "")
+        meio_pag = values.get("pagamento_meio", "")
+        valor_num = self["PAGAMENTO_VALOR_TOTAL"]
+        valor_extenso = self["PAGAMENTO_VALOR_TOTAL_EXTENSO"]
+
+        if forma_pag == "À vista":
+            data_unica = values.get("pagamento_data_unica", "")
+            data_unica_ext = data_por_extenso(data_unica)
+            return (
+                f"O pagamento será efetuado à vista, no valor total de R$ {valor_num} "
+                f"({valor_extenso}), na data de {data_unica_ext}, via {meio_pag}."
+            )
+
+        elif forma_pag == "Sinal + restante":
+            sinal = values.get("pagamento_sinal_percentual", "")
+            data_sinal = values.get("pagamento_sinal_data", "")
+            data_restante = values.get("pagamento_restante_data", "")
+            data_sinal_ext = data_por_extenso(data_sinal)
+            data_restante_ext = data_por_extenso(data_restante)
+
+            sinal_info = f"{sinal}%"
+            try:
+                sinal_percent = Decimal(str(sinal).replace(",", ".") or "0")
+                valor_sinal = self.valor_total.percentual(sinal_percent)
+                sinal_info = f"{sinal}%, equivalente a {valor_sinal.formatado} ({valor_sinal.extenso}),"
+            except (AttributeError, InvalidOperation):
+                # valor total ou percentual inválidos: mantém só o percentual
+                pass
+
+            return (
+                f"O pagamento será realizado em duas etapas: sinal de {sinal_info} até a data {data_sinal_ext} "
+                f"e o valor restante até a data {data_restante_ext}, totalizando R$ {valor_num} "
+                f"({valor_extenso}), via {meio_pag}."
+            )
+
+        elif forma_pag == "Parcelado":
+            parcelas = values.get("pagamento_num_parcelas", "")
+            primeira = values.get("pagamento_primeira_parcela_data", "")
+            periodicidade = values.get("pagamento_periodicidade", "")
+            primeira_ext = data_por_extenso(primeira)
+            return (
+                f"O pagamento será efetuado em {parcelas} parcelas {periodicidade.lower()}, "
+                f"a primeira com vencimento em {primeira_ext}, totalizando R$ {valor_num} "
+                f"({valor_extenso}), via {meio_pag}."
+            )
+
+        else:  # Outro
+            return (
+                f"O pagamento será realizado no valor total de R$ {valor_num} "
+                f"({valor_extenso}), conforme forma negociada entre as partes, via {meio_pag}."
+            )
+
+    @_placeholder("PAGAMENTO_DESCRICAO")
+    def _pagamento_descr(self) -> str:
+        # Descrição simples (mantida para retrocompatibilidade se quiser usar)
+        return (
+            f"O valor total de R$ {self['PAGAMENTO_VALOR_TOTAL']} será pago na forma "
+            f"'{self.values.get('pagamento_forma', '')}', por meio de {self.values.get('pagamento_meio', '')}."
+        )
+
+    # ------------------------------------------------------------------
+    # FAVORECIDO
+    # ------------------------------------------------------------------
+    @_placeholder("FAVORECIDO_PIX")
+    def _pix_descr(self) -> str:
+        pix = self.values.get("favorecido_pix_chave", "")
+        pix_tipo = self.values.get("favorecido_pix_tipo", "")
+        return f"{pix} ({pix_tipo})" if pix or pix_tipo else ""
+
+    @_placeholder("FAVORECIDO_DADOS_BANCARIOS")
+    def _favorecido_dados_bancarios(self) -> str:
+        values = self.values
+        banco = values.get("favorecido_banco_nome", "")
+        codigo = values.get("favorecido_banco_codigo", "")
+        agencia = values.get("favorecido_agencia", "")
+        conta = values.get("favorecido_conta", "")
+        tipo_conta = values.get("favorecido_tipo_conta", "")
+
+        partes_banco = []
+
+        if banco:
+            if codigo:
+                partes_banco.append(f"Banco {banco} (Código {codigo})")
+            else:
+                partes_banco.append(f"Banco {banco}")
+
+        if agencia:
+            partes_banco.append(f"Agência {agencia}")
+
+        if conta:
+            partes_banco.append(f"Conta {conta}")
+
+        if tipo_conta:
+            partes_banco.append(f"– Conta {tipo_conta}")
+
+        return ", ".join(partes_banco) if partes_banco else ""
+
+    # ------------------------------------------------------------------
+    # SOM - cláusula dinâmica
+    # ------------------------------------------------------------------
+    @_placeholder("SOM_CLAUSULA")
+    def _som_clausula(self) -> str:
+        if self.som == "Banda":
+            return (
+                "A banda CONTRATADA será responsável por levar, montar e operar o sistema de som "
+                "necessário para a execução do show, incluindo mesa de som, amplificação, microfones "
+                "e demais equipamentos de áudio, em condições adequadas ao ambiente do evento."
+            )
+        return (
+            "O CONTRATANTE será responsável por fornecer, montar e operar o sistema de som "
+            "necessário para a execução do show, incluindo mesa de som, amplificação, microfones "
+            "e demais equipamentos de áudio, em condições adequadas ao ambiente do evento."
+        )
+
+    # ------------------------------------------------------------------
+    # ALIMENTAÇÃO - cláusula opcional
+    # ------------------------------------------------------------------
+    @_placeholder("ALIMENTACAO")
+    def _alimentacao_clausula(self) -> str:
+        if self.alimentacao != "Sim":
+            return ""
+        return (
+            "Cláusula 5.6. Fornecer consumação de alimentos e bebidas ao staff da banda no buffet "
+            "presente do evento, caso haja buffet contratado. Em caso de comercialização de alimentos "
+            "e bebidas no local do evento, as despesas decorrentes da consumação do(a) CONTRATADO(A) "
+            "durante a apresentação artística correrão por conta do(a) CONTRATANTE até o limite de "
+            "R$ 500,00 (quinhentos reais), caso esse seja ultrapassado as despesas serão de "
+            "responsabilidade do(a) CONTRATADO(A)."
+        )
+
+    # ------------------------------------------------------------------
+    # DATA DO CONTRATO (data corrente por extenso, ou a da geração original)
+    # ------------------------------------------------------------------
+    @_placeholder("DATA_CONTRATO")
+    def _data_contrato(self) -> str:
+        hoje_str = (self.data_contrato or datetime.now()).strftime("%d/%m/%Y")
+        return data_por_extenso(hoje_str)
+
+
+def montar_contexto(values: dict, som: str, alimentacao: str,
+                    data_contrato: datetime | None = None) -> ContextoContrato:
+    """
+    Monta o mapeamento de placeholders -> valores para usar no DOCX.
+    'data_contrato' fixa a data do contrato (ao regerar um contrato antigo);
+    sem ela, vale a data de hoje.
+
+    O resultado se comporta como um dicionário somente leitura, mas cada valor
+    só é calculado quando acessado pela primeira vez.
+    """
+    return ContextoContrato(values, som, alimentacao, data_contrato)
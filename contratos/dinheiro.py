@@ -0,0 +1,97 @@
+"""Valores monetários em reais, guardados em centavos inteiros."""
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+from .extenso import reais_por_extenso
+
+
+class Dinheiro:
+    """
+    Valor em reais guardado como centavos inteiros (sem arredondamento de float).
+
+    O texto digitado é interpretado uma única vez; as formas formatada
+    ('R$ 1.234,56') e por extenso são calculadas no primeiro uso e guardadas.
+    """
+
+    __slots__ = ("centavos", "_numero", "_extenso")
+
+    def __init__(self, centavos: int):
+        self.centavos = centavos
+        self._numero = None
+        self._extenso = None
+
+    @classmethod
+    def parse(cls, texto: str):
+        """
+        Interpreta um valor no formato brasileiro ('2000', '2.000,00', 'R$ 2.000,00').
+        Retorna None se o texto estiver vazio ou não for um valor.
+        """
+        if not texto:
+            return None
+        v = (
+            texto.replace("R$", "")
+            .replace(" ", "")
+            .replace(".", "")
+            .replace(",", ".")
+        )
+        try:
+            valor = Decimal(v)
+        except InvalidOperation:
+            return None
+        if not valor.is_finite():
+            return None
+        return cls(int((valor * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP)))
+
+    @classmethod
+    def de_digitos(cls, digitos: str):
+        """Valor a partir só dos dígitos digitados, em que os 2 últimos são os centavos."""
+        return cls(int(digitos or "0"))
+
+    @property
+    def numero(self) -> str:
+        """Valor sem o símbolo da moeda, ex.: '1.234,56'."""
+        if self._numero is None:
+            reais, centavos = divmod(abs(self.centavos), 100)
+            sinal = "-" if self.centavos < 0 else ""
+            self._numero = f"{sinal}{reais:,}".replace(",", ".") + f",{centavos:02d}"
+        return self._numero
+
+    @property
+    def formatado(self) -> str:
+        """Valor com o símbolo da moeda, ex.: 'R$ 1.234,56'."""
+        return f"R$ {self.numero}"
+
+    @property
+    def extenso(self) -> str:
+        """Valor por extenso, ex.: 'mil duzentos e trinta e quatro reais e cinquenta e seis centavos'."""
+        if self._extenso is None:
+            reais, centavos = divmod(abs(self.centavos), 100)
+            texto = reais_por_extenso(reais, centavos)
+            self._extenso = f"menos {texto}" if self.centavos < 0 else texto
+        return self._extenso
+
+    def percentual(self, percentual: Decimal):
+        """Fração do valor (ex.: sinal de 30%), arredondada ao centavo."""
+        centavos = (Decimal(self.centavos) * Decimal(percentual) / 100).quantize(
+            Decimal(1), rounding=ROUND_HALF_UP
+        )
+        return Dinheiro(int(centavos))
+
+    def __eq__(self, outro):
+        if not isinstance(outro, Dinheiro):
+            return NotImplemented
+        return self.centavos == outro.centavos
+
+    def __hash__(self):
+        return hash(self.centavos)
+
+    def __repr__(self):
+        return f"Dinheiro({self.formatado!r})"
+
+
+def valor_por_extenso(valor: str) -> str:
+    """
+    Converte uma string de valor monetário brasileiro (ex.: '2000', '2.000,00', 'R$ 2.000,00')
+    em texto por extenso, ex.: 'dois mil reais' ou 'dois mil reais e cinquenta centavos'.
+    """
+    dinheiro = Dinheiro.parse(valor)
+    return dinheiro.extenso if dinheiro else ""
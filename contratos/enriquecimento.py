@@ -0,0 +1,86 @@
+"""
+Enriquecimento de snapshots importados em lote: preenche os endereços a
+partir dos CEPs, com o mesmo mapeamento de campos dos botões "Buscar CEP".
+
+Cada CEP distinto é consultado uma única vez, mesmo que apareça em várias
+linhas e em vários campos (contratante, contratado, local do evento).
+"""
+from concurrent.futures import wait
+
+from .cep import ENDERECOS_CEP, ClienteCep, campos_do_endereco, normalizar_cep
+
+
+def ceps_dos_snapshots(snapshots) -> set:
+    """CEPs válidos (8 dígitos, sem máscara) presentes nos campos de CEP dos snapshots."""
+    ceps = set()
+    for snapshot in snapshots:
+        values = snapshot.get("values", {})
+        for cep_key in ENDERECOS_CEP:
+            cep = normalizar_cep(values.get(cep_key, ""))
+            if len(cep) == 8:
+                ceps.add(cep)
+    return ceps
+
+
+def resolver_ceps(ceps, cliente: ClienteCep) -> tuple:
+    """
+    Consulta um conjunto de CEPs: primeiro localmente (base offline/cache) e
+    o restante no pool do cliente, que limita a concorrência e a taxa.
+    Devolve ({cep: resposta}, {cep: exceção}).
+    """
+    respostas = {}
+    falhas = {}
+
+    futuros = {}
+    for cep in sorted(ceps):
+        dados = cliente.consultar_local(cep)
+        if dados is not None:
+            respostas[cep] = dados
+        else:
+            futuros[cliente.consultar_em_segundo_plano(cep)] = cep
+
+    wait(futuros)
+    for futuro, cep in futuros.items():
+        try:
+            respostas[cep] = futuro.result()
+        except Exception as e:
+            falhas[cep] = e
+
+    return respostas, falhas
+
+
+def aplicar_enderecos(snapshot: dict, respostas: dict, sobrescrever: bool = False) -> int:
+    """
+    Preenche os endereços do snapshot (em 'values') com as respostas já obtidas.
+    Campos já preenchidos são mantidos, a menos que 'sobrescrever'.
+    Devolve quantos campos foram alterados.
+    """
+    values = snapshot.setdefault("values", {})
+    alterados = 0
+    for cep_key, destinos in ENDERECOS_CEP.items():
+        dados = respostas.get(normalizar_cep(values.get(cep_key, "")))
+        if not dados or dados.get("erro"):
+            continue
+        for chave, valor in campos_do_endereco(dados, destinos).items():
+            if sobrescrever or not values.get(chave, "").strip():
+                values[chave] = valor
+                alterados += 1
+    return alterados
+
+
+def enriquecer_snapshots(snapshots, cliente: ClienteCep, sobrescrever: bool = False) -> dict:
+    """
+    Preenche os endereços de todos os snapshots (alterados no lugar).
+    Devolve um resumo com os totais de CEPs, falhas e campos preenchidos.
+    """
+    snapshots = list(snapshots)
+    ceps = ceps_dos_snapshots(snapshots)
+    respostas, falhas = resolver_ceps(ceps, cliente)
+
+    campos = sum(aplicar_enderecos(s, respostas, sobrescrever) for s in snapshots)
+    return {
+        "ceps": len(ceps),
+        "nao_encontrados": sorted(c for c, d in respostas.items() if d.get("erro")),
+        "falhas": falhas,
+        "campos": campos,
+    }
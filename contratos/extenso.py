@@ -0,0 +1,129 @@
+"""
+Conversões de valores, horários e datas para texto por extenso.
+
+O domínio é pequeno (1440 horários, 12 meses, poucos valores recorrentes),
+então tudo que passa pelo num2words fica em tabelas ou caches: os horários
+são montados numa tabela completa no primeiro uso e os números em um LRU.
+Valores monetários ficam em contratos.dinheiro.
+"""
+from functools import lru_cache
+import re
+
+_HORA_RE = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*$")
+_DATA_RE = re.compile(r"^\s*(\d{1,2})/(\d{1,2})/(\d{4})\s*$")
+
+MESES = (
+    "Janeiro",
+    "Fevereiro",
+    "Março",
+    "Abril",
+    "Maio",
+    "Junho",
+    "Julho",
+    "Agosto",
+    "Setembro",
+    "Outubro",
+    "Novembro",
+    "Dezembro",
+)
+
+
+@lru_cache(maxsize=4096)
+def numero_por_extenso(numero: int) -> str:
+    """num2words em pt_BR, memorizado (valores de contratos se repetem muito)."""
+    # importado no primeiro uso: o num2words carrega todos os idiomas
+    from num2words import num2words
+
+    return num2words(numero, lang="pt_BR")
+
+
+@lru_cache(maxsize=2048)
+def reais_por_extenso(reais: int, centavos: int) -> str:
+    """
+    Texto por extenso de um valor em reais e centavos, ex.:
+    (2000, 0) -> 'dois mil reais'; (2000, 50) -> 'dois mil reais e cinquenta centavos'.
+    """
+    extenso_reais = numero_por_extenso(reais)
+    # ajustes cosméticos simples
+    extenso_reais = extenso_reais.replace(" e zero", "")
+
+    if centavos == 0:
+        return f"{extenso_reais} reais"
+    else:
+        extenso_cent = numero_por_extenso(centavos)
+        return f"{extenso_reais} reais e {extenso_cent} centavos"
+
+
+# ------------------------------------------------------------------
+# Utilitários de horários por extenso
+# ------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def tabela_horarios() -> tuple:
+    """
+    Tabela com os 1440 horários por extenso, indexada por hora * 60 + minuto.
+    Montada uma única vez a partir de 24 horas e 59 minutos por extenso.
+    """
+    horas = []
+    for hora in range(24):
+        # Ajuste de gênero para 'hora' (feminino)
+        if hora == 1:
+            horas.append("uma hora")
+        elif hora == 2:
+            horas.append("duas horas")
+        else:
+            horas.append(f"{numero_por_extenso(hora)} horas")
+
+    minutos = [""]
+    for minuto in range(1, 60):
+        sufixo = "minuto" if minuto == 1 else "minutos"
+        minutos.append(f" e {numero_por_extenso(minuto)} {sufixo}")
+
+    return tuple(base + resto for base in horas for resto in minutos)
+
+
+def hora_por_extenso(hora: int, minuto: int) -> str:
+    """
+    Converte hora e minuto em texto por extenso, ex.:
+    18:00 -> 'dezoito horas'
+    18:30 -> 'dezoito horas e trinta minutos'
+    """
+    if hora < 0 or hora > 23 or minuto < 0 or minuto > 59:
+        return ""
+    return tabela_horarios()[hora * 60 + minuto]
+
+
+def parse_hora_minuto(texto: str):
+    """
+    Tenta interpretar uma string hh:mm e retorna (hora, minuto) ou None se inválido.
+    """
+    if not texto:
+        return None
+    m = _HORA_RE.match(texto)
+    if not m:
+        return None
+    hora = int(m.group(1))
+    minuto = int(m.group(2))
+    if 0 <= hora <= 23 and 0 <= minuto <= 59:
+        return hora, minuto
+    return None
+
+
+def data_por_extenso(data_str: str) -> str:
+    """
+    Converte 'dd/mm/aaaa' para 'dd de Mês de aaaa', ex.: '06/01/2025' -> '06 de Janeiro de 2025'.
+    Se não conseguir interpretar, retorna a string original.
+    """
+    if not data_str:
+        return ""
+    m = _DATA_RE.match(data_str)
+    if not m:
+        return data_str
+
+    dia = int(m.group(1))
+    mes = int(m.group(2))
+    ano = int(m.group(3))
+
+    if not 1 <= mes <= 12:
+        return data_str
+
+    return f"{dia:02d} de {MESES[mes - 1]} de {ano}"
@@ -0,0 +1,61 @@
+"""
+Modelo do formulário da interface: um StringVar por campo.
+
+Os widgets usam os StringVar como textvariable/variable, então o modelo está
+sempre em dia com o que foi digitado, inclusive para abas ainda não
+construídas (os campos existem antes dos widgets). Quem consome os valores
+lê um dict pronto, em vez de chamar .get() em cada widget, e pode saber
+quais campos mudaram desde a última vez que olhou.
+"""
+from tkinter import StringVar
+
+
+class ModeloFormulario:
+    def __init__(self, campos: dict, master=None):
+        """'campos': {chave: valor inicial}, na ordem em que são gravados no snapshot."""
+        self.vars = {}
+        self._valores = dict(campos)
+        self._ouvintes = {}  # chave (ou None = todas) -> [callback(chave, valor)]
+        self._sujos = set()
+        for chave, valor in campos.items():
+            var = StringVar(master=master, value=valor)
+            var.trace_add("write", lambda *_args, chave=chave: self._mudou(chave))
+            self.vars[chave] = var
+
+    def _mudou(self, chave: str):
+        valor = self.vars[chave].get()
+        if valor == self._valores[chave]:
+            return  # regravação do mesmo texto (ex.: máscara sem efeito)
+        self._valores[chave] = valor
+        self._sujos.add(chave)
+        for callback in self._ouvintes.get(chave, []) + self._ouvintes.get(None, []):
+            callback(chave, valor)
+
+    def observar(self, callback, chave: str | None = None):
+        """Chama callback(chave, valor) quando o campo 'chave' (ou qualquer um) mudar."""
+        self._ouvintes.setdefault(chave, []).append(callback)
+
+    # ------------------------------------------------------------------
+    # Leitura e escrita
+    # ------------------------------------------------------------------
+    def get(self, chave: str) -> str:
+        return self._valores.get(chave, "")
+
+    def set(self, chave: str, valor: str):
+        """Grava o valor (campos desconhecidos são ignorados, como no snapshot)."""
+        var = self.vars.get(chave)
+        if var is not None and valor != self._valores[chave]:
+            var.set(valor)
+
+    def valores(self) -> dict:
+        """Cópia de todos os campos, na ordem de 'campos'."""
+        return dict(self._valores)
+
+    def limpar(self):
+        for chave in self.vars:
+            self.set(chave, "")
+
+    def consumir_sujos(self) -> set:
+        """Campos alterados desde a chamada anterior (e zera a lista)."""
+        sujos, self._sujos = self._sujos, set()
+        return sujos
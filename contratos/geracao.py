@@ -0,0 +1,164 @@
+"""Geração dos arquivos de um contrato (snapshot JSON + DOCX) a partir de um snapshot."""
+from pathlib import Path
+import json
+import os
+import re
+import sqlite3
+import threading
+
+from .config import LAYOUT_SAIDA, SAIDA_DIR, TEMPLATE_CONTRATO
+from .conteudo import gravar_documento
+from .contexto import montar_contexto
+from .extenso import numero_por_extenso, tabela_horarios
+from .registro import RegistroContratos
+from .saida import registrar_no_manifesto, subpasta
+from .snapshots import codificar_snapshot
+from .template_docx import carregar_template, nome_template
+
+
+def nome_base_contrato(values: dict) -> str:
+    """Nome base sem extensão, ex.: 'Contrato_Banda_X_20250106'."""
+    # data: dd/mm/yyyy -> yyyymmdd
+    evento_raw = values.get("evento_data", "")
+    m = re.match(r"^\s*(\d{2})/(\d{2})/(\d{4})\s*$", evento_raw)
+    if m:
+        data_evento = f"{m.group(3)}{m.group(2)}{m.group(1)}"
+    else:
+        data_evento = evento_raw.replace("/", "")
+    atracao = values.get("evento_atracao_musical", "").replace(" ", "_")
+    return f"Contrato_{atracao}_{data_evento}"
+
+
+# contador de versões por nome base: guarda a próxima versão provável,
+# para não testar _v1, _v2, ... a cada geração
+VERSOES_DIR = ".versoes"
+
+
+def _ler_proxima_versao(contador: Path) -> int:
+    try:
+        return max(1, int(contador.read_text(encoding="ascii")))
+    except (OSError, ValueError):
+        return 1
+
+
+def _gravar_proxima_versao(contador: Path, versao: int):
+    # grava num temporário e troca, para nunca deixar o contador pela metade
+    temporario = contador.with_name(f"{contador.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        temporario.write_text(str(versao), encoding="ascii")
+        os.replace(temporario, contador)
+    except OSError:
+        temporario.unlink(missing_ok=True)  # o contador é só uma dica; a reserva já foi feita
+
+
+def reservar_versao(saida_dir: Path, base_name: str, legado: Path | None = None):
+    """
+    Reserva a próxima versão livre de 'base_name' criando o _vN.json com
+    criação exclusiva, o que é atômico mesmo com vários processos gravando
+    na mesma pasta. Devolve (versao, arquivo JSON aberto para escrita).
+
+    O contador em .versoes/ indica por onde começar; se estiver ausente ou
+    desatualizado, as versões ocupadas são puladas até achar uma livre.
+    Versões que ainda estão em 'legado' (a raiz de uma pasta plana não
+    migrada) também contam como ocupadas.
+    """
+    contador_dir = saida_dir / VERSOES_DIR
+    contador_dir.mkdir(exist_ok=True)
+    contador = contador_dir / f"{base_name}.txt"
+
+    versao = _ler_proxima_versao(contador)
+    while True:
+        json_path = saida_dir / f"{base_name}_v{versao}.json"
+        # DOCX sem JSON (gerado por versões antigas) também ocupa a versão
+        ocupada = (saida_dir / f"{base_name}_v{versao}.docx").exists() or (
+            legado is not None
+            and any((legado / f"{base_name}_v{versao}.{ext}").exists() for ext in ("json", "docx"))
+        )
+        if not ocupada:
+            try:
+                arquivo = open(json_path, "x", encoding="utf-8")
+            except FileExistsError:
+                pass
+            else:
+                break
+        versao += 1
+
+    _gravar_proxima_versao(contador, versao + 1)
+    return versao, arquivo
+
+
+def aquecer_geracao(template: Path = TEMPLATE_CONTRATO):
+    """
+    Deixa prontos os caches usados na geração, para que o primeiro contrato
+    saia tão rápido quanto os seguintes: compila o template, carrega o
+    num2words, monta a tabela de horários e renderiza um contrato vazio em
+    memória (sem gravar nada).
+    """
+    tabela_horarios()
+    numero_por_extenso(0)
+    compilado = carregar_template(template)
+    compilado.gerar_bytes(montar_contexto({}, "Contratante", "Não"))
+
+
+def gerar_arquivos_contrato(snapshot: dict, saida_dir: Path = SAIDA_DIR,
+                            template: Path = TEMPLATE_CONTRATO,
+                            layout: str = LAYOUT_SAIDA) -> Path:
+    """
+    Gera o par _vN.json / _vN.docx de um snapshot (o mesmo formato salvo pela
+    interface) na pasta de saída, na subpasta do layout, registra o par no
+    manifesto e no registro de contratos e devolve o caminho do DOCX.
+    """
+    values = snapshot.get("values", {})
+    som = snapshot.get("som", "Contratante")
+    alimentacao = snapshot.get("alimentacao", "Não")
+
+    contexto = montar_contexto(values, som, alimentacao)
+
+    # usa template único; cláusula de som é preenchida via placeholder
+    template = Path(template)
+    if not template.exists():
+        raise FileNotFoundError(f"Template não encontrado: {template}")
+
+    saida_dir = Path(saida_dir)
+    base_name = nome_base_contrato(values)
+    pasta = saida_dir / subpasta(base_name, layout)
+    pasta.mkdir(parents=True, exist_ok=True)
+
+    # --- Versionamento automático v1, v2, v3... ---
+    versao, f = reservar_versao(pasta, base_name, legado=saida_dir if pasta != saida_dir else None)
+    arquivo_saida = pasta / f"{base_name}_v{versao}.docx"
+
+    # adiciona a versão também dentro do JSON
+    snapshot = dict(snapshot, versao=versao)
+
+    try:
+        # versões seguintes à v1 são gravadas como delta da anterior (ver contratos.snapshots)
+        with f:
+            json.dump(codificar_snapshot(snapshot, Path(f.name)), f, ensure_ascii=False, indent=2)
+
+        # DOCX idêntico a um já gerado (mesmos dados e template) não é renderizado de novo
+        compilado = carregar_template(template)
+        chave = gravar_documento(saida_dir, compilado, contexto, arquivo_saida)
+        registrar_no_manifesto(saida_dir, arquivo_saida, versao, compilado.hash,
+                               nome_template(template), chave)
+    except BaseException:
+        # um _vN.json vazio ou sem DOCX quebraria a versão seguinte (delta) e o
+        # 'registro reconstruir': a reserva é desfeita e o número fica sem uso
+        Path(f.name).unlink(missing_ok=True)
+        arquivo_saida.unlink(missing_ok=True)
+        raise
+
+    # o registro é só um índice (reconstruível a partir dos JSON): falhar nele
+    # não pode desfazer um contrato já gravado
+    try:
+        registro = RegistroContratos.da_pasta(saida_dir)
+        try:
+            registro.registrar(snapshot, arquivo_saida.relative_to(saida_dir),
+                               template_hash=compilado.hash,
+                               template_nome=nome_template(template))
+        finally:
+            registro.fechar()
+    except sqlite3.Error as e:
+        print(f"Aviso: contrato não incluído no registro ({e}); use 'registro reconstruir'.")
+
+    return arquivo_saida
@@ -0,0 +1,1374 @@
+import customtkinter as ctk
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import StringVar, BooleanVar, messagebox, filedialog
+import re
+import sqlite3
+import threading
+
+from .cep import ENDERECOS_CEP, CacheCep, ClienteCep, campos_do_endereco, normalizar_cep
+from .cep_offline import BaseCepOffline
+from .config import APP_NAME, APP_VERSION, CEP_CACHE_PATH, CEP_OFFLINE_PATH, LAYOUT_SAIDA, SAIDA_DIR
+from .dinheiro import Dinheiro
+from .formulario import ModeloFormulario
+from .geracao import aquecer_geracao, gerar_arquivos_contrato
+from .registro import RegistroContratos
+from .saida import migrar_saida, ultima_pasta
+from .snapshots import carregar_snapshot
+
+# campos do formulário, na ordem em que são gravados no snapshot, com o valor
+# inicial de cada um; vale para campos de abas que ainda não foram construídas
+CAMPOS = {
+    "contratante_tipo": "Pessoa Física",
+    "contratante_nome_razao": "",
+    "contratante_cpf_cnpj": "",
+    "contratante_telefone": "",
+    "contratante_email": "",
+    "contratante_endereco_logradouro": "",
+    "contratante_endereco_numero": "",
+    "contratante_endereco_complemento": "",
+    "contratante_endereco_bairro": "",
+    "contratante_endereco_cidade": "",
+    "contratante_endereco_uf": "",
+    "contratante_endereco_cep": "",
+    "contratante_representante_nome": "",
+    "contratante_representante_cpf": "",
+    "contratado_tipo": "Pessoa Jurídica",
+    "contratado_nome_razao": "",
+    "contratado_cpf_cnpj": "",
+    "contratado_telefone": "",
+    "contratado_email": "",
+    "contratado_endereco_logradouro": "",
+    "contratado_endereco_numero": "",
+    "contratado_endereco_complemento": "",
+    "contratado_endereco_bairro": "",
+    "contratado_endereco_cidade": "",
+    "contratado_endereco_uf": "",
+    "contratado_endereco_cep": "",
+    "contratado_representante_nome": "",
+    "contratado_representante_cpf": "",
+    "evento_nome": "",
+    "evento_atracao_musical": "",
+    "evento_data": "",
+    "evento_horario_inicio": "",
+    "evento_horario_fim_previsto": "",
+    "evento_local_nome": "",
+    "evento_local_logradouro": "",
+    "evento_local_numero": "",
+    "evento_local_complemento": "",
+    "evento_local_bairro": "",
+    "evento_local_cidade": "",
+    "evento_local_uf": "",
+    "evento_local_cep": "",
+    "pagamento_valor_total": "",
+    "pagamento_forma": "À vista",
+    "pagamento_meio": "PIX",
+    "pagamento_data_unica": "",
+    "pagamento_sinal_percentual": "",
+    "pagamento_sinal_data": "",
+    "pagamento_restante_data": "",
+    "pagamento_num_parcelas": "",
+    "pagamento_primeira_parcela_data": "",
+    "pagamento_periodicidade": "Mensal",
+    "favorecido_nome": "",
+    "favorecido_cpf_cnpj": "",
+    "favorecido_banco_nome": "",
+    "favorecido_banco_codigo": "",
+    "favorecido_agencia": "",
+    "favorecido_conta": "",
+    "favorecido_tipo_conta": "Corrente",
+    "favorecido_pix_chave": "",
+    "favorecido_pix_tipo": "CPF/CNPJ",
+}
+
+# seções do resumo, na ordem em que aparecem; cada campo pertence à seção do
+# seu prefixo (contratante_*, evento_*, ...)
+SECOES_RESUMO = ("contratante", "contratado", "evento", "som", "alimentacao", "pagamento", "favorecido")
+
+# máscaras de digitação (ver _attach_mask), aplicadas quando o campo é criado
+MASCARAS = {
+    # Telefones
+    "contratante_telefone": "phone",
+    "contratado_telefone": "phone",
+    # CPF/CNPJ principais
+    "contratante_cpf_cnpj": "cpf_cnpj",
+    "contratado_cpf_cnpj": "cpf_cnpj",
+    "favorecido_cpf_cnpj": "cpf_cnpj",
+    # CPF de representantes
+    "contratante_representante_cpf": "cpf_cnpj",
+    "contratado_representante_cpf": "cpf_cnpj",
+    # CEPs
+    "contratante_endereco_cep": "cep",
+    "contratado_endereco_cep": "cep",
+    "evento_local_cep": "cep",
+    # Datas (dd/mm/aaaa)
+    "evento_data": "date",
+    "pagamento_data_unica": "date",
+    "pagamento_sinal_data": "date",
+    "pagamento_restante_data": "date",
+    "pagamento_primeira_parcela_data": "date",
+    # Horários (hh:mm)
+    "evento_horario_inicio": "time",
+    "evento_horario_fim_previsto": "time",
+    # Valor monetário
+    "pagamento_valor_total": "money",
+}
+
+
+class ContractApp(ctk.CTk):
+    def __init__(self):
+        super().__init__()
+
+        # garantir que a janela vem pra frente
+        self.lift()
+        self.attributes("-topmost", True)
+        self.after(200, lambda: self.attributes("-topmost", False))
+
+        ctk.set_appearance_mode("system")
+        ctk.set_default_color_theme("blue")
+
+        self.title(f"{APP_NAME} – v{APP_VERSION}")
+        self.geometry("1100x700")
+
+        # valores dos campos (um StringVar por campo, ligados aos widgets) e
+        # referências dos widgets já construídos
+        self.modelo = ModeloFormulario(CAMPOS, master=self)
+        self.inputs = {}
+        self.som_responsavel_var = StringVar(value="Contratante")
+        self.alimentacao_var = StringVar(value="Sim")
+        self.favorecido_igual_contratado_var = BooleanVar(value=False)
+        self.pag_frame_avista = None
+        self.pag_frame_sinal = None
+        self.pag_frame_parc = None
+        self._pag_container = None
+        self.preview_box = None
+
+        # avisos do modelo: a forma de pagamento mostra a seção correspondente;
+        # o resumo remonta só as seções cujos campos mudaram
+        self.modelo.observar(lambda _chave, forma: self._update_pagamento_forma_ui(forma),
+                             "pagamento_forma")
+        self._resumo_secoes = {}
+        self._secoes_sujas = set(SECOES_RESUMO)
+        self.som_responsavel_var.trace_add("write", lambda *_args: self._secoes_sujas.add("som"))
+        self.alimentacao_var.trace_add("write", lambda *_args: self._secoes_sujas.add("alimentacao"))
+
+        # consultas de CEP em segundo plano (uma pendente por campo)
+        try:
+            cache_cep = CacheCep(CEP_CACHE_PATH)
+        except (OSError, sqlite3.Error):
+            cache_cep = None  # sem cache local: consulta sempre a rede
+        base_cep = None
+        if CEP_OFFLINE_PATH.exists():
+            try:
+                base_cep = BaseCepOffline(CEP_OFFLINE_PATH)
+            except (OSError, ValueError):
+                base_cep = None  # base corrompida: segue com cache/rede
+        self.cliente_cep = ClienteCep(cache=cache_cep, base_offline=base_cep)
+        self._cep_pendentes = {}
+
+        # geração em segundo plano: um worker só, que atende os pedidos na ordem
+        # em que o botão foi clicado; o formulário continua livre para edição
+        self._geracao = ThreadPoolExecutor(max_workers=1, thread_name_prefix="geracao")
+        self._geracoes_pendentes = []
+
+        # registro dos contratos gerados (aba Contratos), aberto no primeiro uso
+        self.registro = None
+
+        # --- TABVIEW PRINCIPAL ---
+        self.tabview = ctk.CTkTabview(self)
+        self.tabview.pack(fill="both", expand=True, padx=20, pady=(20, 10))
+        self.tabview.configure(command=self._on_tab_change)
+
+        self._build_tabs()
+
+        # --- RODAPÉ COM BOTÕES ---
+        btn_frame = ctk.CTkFrame(self)
+        btn_frame.pack(fill="x", padx=20, pady=(0, 15))
+        
+        btn_carregar = ctk.CTkButton(btn_frame, text="Carregar preenchimento", command=self.carregar_preenchimento)
+        btn_carregar.pack(side="left", padx=(0, 10))
+
+        btn_gerar = ctk.CTkButton(btn_frame, text="Gerar contrato", command=self.gerar_contrato)
+        btn_gerar.pack(side="left", padx=(0, 10))
+
+        btn_limpar = ctk.CTkButton(btn_frame, text="Limpar", fg_color="gray", command=self.limpar_campos)
+        btn_limpar.pack(side="left", padx=(0, 10))
+
+        self.status_geracao = ctk.CTkLabel(btn_frame, text="", anchor="w")
+        self.status_geracao.pack(side="left", fill="x", expand=True, padx=(10, 10))
+
+        btn_sair = ctk.CTkButton(btn_frame, text="Sair", fg_color="red", command=self.destroy)
+        btn_sair.pack(side="right")
+
+        # template e extenso são preparados em segundo plano logo depois que a
+        # janela aparece, enquanto o usuário preenche o formulário
+        self.after(300, self._aquecer_geracao)
+
+        # pasta de saída ainda plana: migra para o layout configurado numa
+        # thread (a raiz é listada uma vez só); ao fechar, para entre dois contratos
+        self._parar_migracao = threading.Event()
+        self._migracao = None
+        if LAYOUT_SAIDA != "plano":
+            self.after(2000, self._migrar_saida_em_segundo_plano)
+
+    def _migrar_saida_em_segundo_plano(self):
+        def migrar():
+            try:
+                migrar_saida(SAIDA_DIR, LAYOUT_SAIDA, parar=self._parar_migracao)
+            except (OSError, ValueError) as e:
+                print(f"Migração da pasta de saída interrompida: {e}")
+
+        self._migracao = threading.Thread(target=migrar, name="migrar-saida", daemon=True)
+        self._migracao.start()
+
+    def _aquecer_geracao(self):
+        def aquecer():
+            try:
+                aquecer_geracao()
+            except Exception as e:
+                # só um atalho: a geração em si mostra o erro, se ele persistir
+                print(f"Aviso: preparação da geração falhou ({e}).")
+
+        threading.Thread(target=aquecer, name="aquecer-geracao", daemon=True).start()
+
+    def destroy(self):
+        # contratos já pedidos terminam de ser gravados antes de fechar
+        self._geracao.shutdown(wait=True)
+        self._parar_migracao.set()
+        if self._migracao is not None:
+            self._migracao.join()
+        self.cliente_cep.fechar()
+        if self.registro is not None:
+            self.registro.fechar()
+        super().destroy()
+
+    # ---------------------------------------------------------
+    # Construção das abas
+    # ---------------------------------------------------------
+    def _build_tabs(self):
+        # as abas são criadas vazias; o conteúdo é construído na primeira vez
+        # que cada uma é aberta (ver _garantir_aba)
+        self._abas_pendentes = {
+            "Contratante": self._build_tab_contratante,
+            "Contratado": self._build_tab_contratado,
+            "Evento / Local": self._build_tab_evento,
+            "Som": self._build_tab_som,
+            "Pagamento": self._build_tab_pagamento,
+            "Favorecido": self._build_tab_favorecido,
+            "Resumo": self._build_tab_resumo,
+            "Contratos": self._build_tab_contratos,
+        }
+        for nome in self._abas_pendentes:
+            self.tabview.add(nome)
+
+        self._garantir_aba("Contratante")
+
+    def _garantir_aba(self, nome: str):
+        """Constrói o conteúdo da aba 'nome', se ainda não foi construído."""
+        construir = self._abas_pendentes.pop(nome, None)
+        if construir is None:
+            return
+        self._construir(construir, self.tabview.tab(nome))
+
+        if nome == "Pagamento":
+            self._update_pagamento_forma_ui()
+        elif nome == "Favorecido":
+            self._bloquear_favorecido(self.favorecido_igual_contratado_var.get())
+
+    def _construir(self, construtor, parent):
+        """Chama 'construtor(parent)' e aplica MASCARAS aos campos que ele criou."""
+        existentes = set(self.inputs)
+        construtor(parent)
+        for key in self.inputs.keys() - existentes:
+            if key in MASCARAS:
+                self._attach_mask(key, MASCARAS[key])
+
+    def _attach_mask(self, key: str, kind: str):
+        """Anexa uma máscara de digitação ao campo identificado por 'key'."""
+        entry = self.inputs.get(key)
+        if not entry:
+            return
+
+        def on_key_release(event):
+            text = entry.get()
+            digits = re.sub(r"\D", "", text)
+
+            if kind == "phone":
+                # telefone: (##) #####-####
+                digits_trim = digits[:11]
+                if len(digits_trim) <= 2:
+                    formatted = f"({digits_trim}"
+                elif len(digits_trim) <= 7:
+                    formatted = f"({digits_trim[:2]}) {digits_trim[2:]}"
+                elif len(digits_trim) <= 10:
+                    # formato (##) ####-####
+                    formatted = f"({digits_trim[:2]}) {digits_trim[2:6]}-{digits_trim[6:]}"
+                else:
+                    # 11 dígitos: (##) #####-####
+                    formatted = f"({digits_trim[:2]}) {digits_trim[2:7]}-{digits_trim[7:]}"
+            elif kind == "cep":
+                # CEP: #####-###
+                digits_trim = digits[:8]
+                if len(digits_trim) <= 5:
+                    formatted = digits_trim
+                else:
+                    formatted = f"{digits_trim[:5]}-{digits_trim[5:]}"
+            elif kind == "cpf_cnpj":
+                # decide entre CPF e CNPJ pela quantidade de dígitos
+                if len(digits) <= 11:
+                    d = digits[:11]
+                    if len(d) <= 3:
+                        formatted = d
+                    elif len(d) <= 6:
+                        formatted = f"{d[:3]}.{d[3:]}"
+                    elif len(d) <= 9:
+                        formatted = f"{d[:3]}.{d[3:6]}.{d[6:]}"
+                    else:
+                        formatted = f"{d[:3]}.{d[3:6]}.{d[6:9]}-{d[9:]}"
+                else:
+                    d = digits[:14]
+                    if len(d) <= 2:
+                        formatted = d
+                    elif len(d) <= 5:
+                        formatted = f"{d[:2]}.{d[2:]}"
+                    elif len(d) <= 8:
+                        formatted = f"{d[:2]}.{d[2:5]}.{d[5:]}"
+                    elif len(d) <= 12:
+                        formatted = f"{d[:2]}.{d[2:5]}.{d[5:8]}/{d[8:]}"
+                    else:
+                        formatted = f"{d[:2]}.{d[2:5]}.{d[5:8]}/{d[8:12]}-{d[12:]}"
+            elif kind == "date":
+                # Data: dd/mm/aaaa
+                digits_trim = digits[:8]
+                if len(digits_trim) <= 2:
+                    formatted = digits_trim
+                elif len(digits_trim) <= 4:
+                    formatted = f"{digits_trim[:2]}/{digits_trim[2:4]}"
+                else:
+                    formatted = f"{digits_trim[:2]}/{digits_trim[2:4]}/{digits_trim[4:8]}"
+            elif kind == "time":
+                # Hora: HH:MM
+                digits_trim = digits[:4]
+                if len(digits_trim) <= 2:
+                    formatted = digits_trim
+                else:
+                    formatted = f"{digits_trim[:2]}:{digits_trim[2:]}"
+            elif kind == "money":
+                # Dinheiro: R$ #.###,## (os 2 últimos dígitos são os centavos)
+                if not digits:
+                    formatted = ""
+                else:
+                    # limite de segurança
+                    formatted = Dinheiro.de_digitos(digits[:15]).formatado
+            else:
+                formatted = text  # nenhuma máscara
+
+            if formatted != text:
+                entry.delete(0, "end")
+                entry.insert(0, formatted)
+
+        entry.bind("<KeyRelease>", on_key_release)
+
+    # ----------------- CONTRATANTE -----------------
+    def _build_tab_contratante(self, parent: ctk.CTkFrame):
+        frame = ctk.CTkScrollableFrame(parent)
+        frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Tipo
+        ctk.CTkLabel(frame, text="Tipo de contratante").grid(row=0, column=0, sticky="w", pady=(0, 5))
+        self.inputs["contratante_tipo"] = ctk.CTkComboBox(
+            frame,
+            values=["Pessoa Física", "Pessoa Jurídica"],
+            width=180,
+            variable=self.modelo.vars["contratante_tipo"]
+        )
+        self.inputs["contratante_tipo"].grid(row=1, column=0, sticky="w")
+
+        # Linha
+        ctk.CTkLabel(frame, text="").grid(row=2, column=0, pady=5)
+
+        # Dados básicos
+        self._add_labeled_entry(frame, "Nome / Razão Social", "contratante_nome_razao", row=3)
+        self._add_labeled_entry(frame, "CPF / CNPJ", "contratante_cpf_cnpj", row=4, width=180)
+        self._add_labeled_entry(frame, "Telefone", "contratante_telefone", row=5, width=180)
+        self._add_labeled_entry(frame, "E-mail", "contratante_email", row=6, width=300)
+
+        # Endereço
+        ctk.CTkLabel(frame, text="Endereço", font=ctk.CTkFont(weight="bold")).grid(
+            row=7, column=0, sticky="w", pady=(15, 5)
+        )
+        self._add_labeled_entry(frame, "Logradouro", "contratante_endereco_logradouro", row=8, width=350)
+
+        # Número + complemento
+        row = 9
+        ctk.CTkLabel(frame, text="Número", width=130, anchor="w").grid(row=row, column=0, sticky="w")
+        entry_num = ctk.CTkEntry(frame, width=80, textvariable=self.modelo.vars["contratante_endereco_numero"])
+        entry_num.grid(row=row, column=1, sticky="w", padx=(0, 10))
+        self.inputs["contratante_endereco_numero"] = entry_num
+
+        ctk.CTkLabel(frame, text="Compl.", width=60, anchor="w").grid(row=row, column=2, sticky="w")
+        entry_comp = ctk.CTkEntry(frame, width=100, textvariable=self.modelo.vars["contratante_endereco_complemento"])
+        entry_comp.grid(row=row, column=3, sticky="w")
+        self.inputs["contratante_endereco_complemento"] = entry_comp
+
+        self._add_labeled_entry(frame, "Bairro", "contratante_endereco_bairro", row=10, width=250)
+
+        # Cidade / UF
+        row = 11
+        ctk.CTkLabel(frame, text="Cidade", width=130, anchor="w").grid(row=row, column=0, sticky="w")
+        entry_cid = ctk.CTkEntry(frame, width=250, textvariable=self.modelo.vars["contratante_endereco_cidade"])
+        entry_cid.grid(row=row, column=1, sticky="w", padx=(0, 10))
+        self.inputs["contratante_endereco_cidade"] = entry_cid
+
+        ctk.CTkLabel(frame, text="UF", width=30, anchor="w").grid(row=row, column=2, sticky="w")
+        entry_uf = ctk.CTkEntry(frame, width=40, textvariable=self.modelo.vars["contratante_endereco_uf"])
+        entry_uf.grid(row=row, column=3, sticky="w")
+        self.inputs["contratante_endereco_uf"] = entry_uf
+
+        # CEP + botão Buscar
+        row = 12
+        ctk.CTkLabel(frame, text="CEP", width=130, anchor="w").grid(row=row, column=0, sticky="w", pady=3)
+        entry_cep_contr = ctk.CTkEntry(frame, width=120, textvariable=self.modelo.vars["contratante_endereco_cep"])
+        entry_cep_contr.grid(row=row, column=1, sticky="w", pady=3)
+        self.inputs["contratante_endereco_cep"] = entry_cep_contr
+
+        btn_buscar_cep_contr = ctk.CTkButton(
+            frame,
+            text="Buscar",
+            width=80,
+            command=self.buscar_cep_contratante
+        )
+        btn_buscar_cep_contr.grid(row=row, column=2, sticky="w", padx=(10, 0), pady=3)
+
+        # Representante
+        ctk.CTkLabel(frame, text="Dados do representante (apenas PJ)",
+                     font=ctk.CTkFont(weight="bold")).grid(
+            row=13, column=0, sticky="w", pady=(15, 5)
+        )
+        self._add_labeled_entry(frame, "Nome", "contratante_representante_nome", row=14, width=350)
+        self._add_labeled_entry(frame, "CPF", "contratante_representante_cpf", row=15, width=180)
+
+        # Config grid
+        for col in range(4):
+            frame.grid_columnconfigure(col, weight=0)
+        frame.grid_columnconfigure(1, weight=1)
+
+    # ----------------- CONTRATADO -----------------
+    def _build_tab_contratado(self, parent: ctk.CTkFrame):
+        frame = ctk.CTkScrollableFrame(parent)
+        frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Tipo
+        ctk.CTkLabel(frame, text="Tipo de contratado").grid(row=0, column=0, sticky="w", pady=(0, 5))
+        self.inputs["contratado_tipo"] = ctk.CTkComboBox(
+            frame,
+            values=["Pessoa Física", "Pessoa Jurídica"],
+            width=180,
+            variable=self.modelo.vars["contratado_tipo"]
+        )
+        self.inputs["contratado_tipo"].grid(row=1, column=0, sticky="w")
+
+        # Linha
+        ctk.CTkLabel(frame, text="").grid(row=2, column=0, pady=5)
+
+        # Dados básicos
+        self._add_labeled_entry(frame, "Nome / Razão Social", "contratado_nome_razao", row=3)
+        self._add_labeled_entry(frame, "CPF / CNPJ", "contratado_cpf_cnpj", row=4, width=180)
+        self._add_labeled_entry(frame, "Telefone", "contratado_telefone", row=5, width=180)
+        self._add_labeled_entry(frame, "E-mail", "contratado_email", row=6, width=300)
+
+        # Endereço
+        ctk.CTkLabel(frame, text="Endereço", font=ctk.CTkFont(weight="bold")).grid(
+            row=7, column=0, sticky="w", pady=(15, 5)
+        )
+        self._add_labeled_entry(frame, "Logradouro", "contratado_endereco_logradouro", row=8, width=350)
+
+        # Número + complemento
+        row = 9
+        ctk.CTkLabel(frame, text="Número", width=130, anchor="w").grid(row=row, column=0, sticky="w")
+        entry_num = ctk.CTkEntry(frame, width=80, textvariable=self.modelo.vars["contratado_endereco_numero"])
+        entry_num.grid(row=row, column=1, sticky="w", padx=(0, 10))
+        self.inputs["contratado_endereco_numero"] = entry_num
+
+        ctk.CTkLabel(frame, text="Compl.", width=60, anchor="w").grid(row=row, column=2, sticky="w")
+        entry_comp = ctk.CTkEntry(frame, width=100, textvariable=self.modelo.vars["contratado_endereco_complemento"])
+        entry_comp.grid(row=row, column=3, sticky="w")
+        self.inputs["contratado_endereco_complemento"] = entry_comp
+
+        self._add_labeled_entry(frame, "Bairro", "contratado_endereco_bairro", row=10, width=250)
+
+        # Cidade / UF
+        row = 11
+        ctk.CTkLabel(frame, text="Cidade", width=130, anchor="w").grid(row=row, column=0, sticky="w")
+        entry_cid = ctk.CTkEntry(frame, width=250, textvariable=self.modelo.vars["contratado_endereco_cidade"])
+        entry_cid.grid(row=row, column=1, sticky="w", padx=(0, 10))
+        self.inputs["contratado_endereco_cidade"] = entry_cid
+
+        ctk.CTkLabel(frame, text="UF", width=30, anchor="w").grid(row=row, column=2, sticky="w")
+        entry_uf = ctk.CTkEntry(frame, width=40, textvariable=self.modelo.vars["contratado_endereco_uf"])
+        entry_uf.grid(row=row, column=3, sticky="w")
+        self.inputs["contratado_endereco_uf"] = entry_uf
+
+        # CEP + botão Buscar (contratado)
+        row = 12
+        ctk.CTkLabel(frame, text="CEP", width=130, anchor="w").grid(row=row, column=0, sticky="w", pady=3)
+        entry_cep_contratado = ctk.CTkEntry(frame, width=120, textvariable=self.modelo.vars["contratado_endereco_cep"])
+        entry_cep_contratado.grid(row=row, column=1, sticky="w", pady=3)
+        self.inputs["contratado_endereco_cep"] = entry_cep_contratado
+
+        btn_buscar_cep_contratado = ctk.CTkButton(
+            frame,
+            text="Buscar",
+            width=80,
+            command=self.buscar_cep_contratado
+        )
+        btn_buscar_cep_contratado.grid(row=row, column=2, sticky="w", padx=(10, 0), pady=3)
+
+        # Representante
+        ctk.CTkLabel(frame, text="Representante (apenas PJ)",
+                     font=ctk.CTkFont(weight="bold")).grid(
+            row=13, column=0, sticky="w", pady=(15, 5)
+        )
+        self._add_labeled_entry(frame, "Nome", "contratado_representante_nome", row=14, width=350)
+        self._add_labeled_entry(frame, "CPF", "contratado_representante_cpf", row=15, width=180)
+
+        for col in range(4):
+            frame.grid_columnconfigure(col, weight=0)
+        frame.grid_columnconfigure(1, weight=1)
+
+    # ----------------- EVENTO / LOCAL -----------------
+    def _build_tab_evento(self, parent: ctk.CTkFrame):
+        frame = ctk.CTkScrollableFrame(parent)
+        frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        ctk.CTkLabel(frame, text="Dados do evento", font=ctk.CTkFont(weight="bold")).grid(
+            row=0, column=0, sticky="w", pady=(0, 5)
+        )
+
+        self._add_labeled_entry(frame, "Nome do evento", "evento_nome", row=1, width=350)
+        self._add_labeled_entry(frame, "Atração musical", "evento_atracao_musical", row=2, width=350)
+        self._add_labeled_entry(frame, "Data (dd/mm/aaaa)", "evento_data", row=3, width=120)
+        self._add_labeled_entry(frame, "Horário início (hh:mm)", "evento_horario_inicio", row=4, width=80)
+        self._add_labeled_entry(frame, "Horário fim (prev.)", "evento_horario_fim_previsto", row=5, width=80)
+
+        ctk.CTkLabel(frame, text="Local da apresentação", font=ctk.CTkFont(weight="bold")).grid(
+            row=6, column=0, sticky="w", pady=(15, 5)
+        )
+
+        self._add_labeled_entry(frame, "Nome do local", "evento_local_nome", row=7, width=350)
+        self._add_labeled_entry(frame, "Logradouro", "evento_local_logradouro", row=8, width=350)
+
+        # Número + compl.
+        row = 9
+        ctk.CTkLabel(frame, text="Número", width=130, anchor="w").grid(row=row, column=0, sticky="w")
+        entry_num = ctk.CTkEntry(frame, width=80, textvariable=self.modelo.vars["evento_local_numero"])
+        entry_num.grid(row=row, column=1, sticky="w", padx=(0, 10))
+        self.inputs["evento_local_numero"] = entry_num
+
+        ctk.CTkLabel(frame, text="Compl.", width=60, anchor="w").grid(row=row, column=2, sticky="w")
+        entry_comp = ctk.CTkEntry(frame, width=100, textvariable=self.modelo.vars["evento_local_complemento"])
+        entry_comp.grid(row=row, column=3, sticky="w")
+        self.inputs["evento_local_complemento"] = entry_comp
+
+        self._add_labeled_entry(frame, "Bairro", "evento_local_bairro", row=10, width=250)
+
+        # Cidade / UF
+        row = 11
+        ctk.CTkLabel(frame, text="Cidade", width=130, anchor="w").grid(row=row, column=0, sticky="w")
+        entry_cid = ctk.CTkEntry(frame, width=250, textvariable=self.modelo.vars["evento_local_cidade"])
+        entry_cid.grid(row=row, column=1, sticky="w", padx=(0, 10))
+        self.inputs["evento_local_cidade"] = entry_cid
+
+        ctk.CTkLabel(frame, text="UF", width=30, anchor="w").grid(row=row, column=2, sticky="w")
+        entry_uf = ctk.CTkEntry(frame, width=40, textvariable=self.modelo.vars["evento_local_uf"])
+        entry_uf.grid(row=row, column=3, sticky="w")
+        self.inputs["evento_local_uf"] = entry_uf
+
+        # CEP + buscar
+        row = 12
+        ctk.CTkLabel(frame, text="CEP", width=130, anchor="w").grid(row=row, column=0, sticky="w", pady=3)
+        entry_cep_evento = ctk.CTkEntry(frame, width=120, textvariable=self.modelo.vars["evento_local_cep"])
+        entry_cep_evento.grid(row=row, column=1, sticky="w", pady=3)
+        self.inputs["evento_local_cep"] = entry_cep_evento
+
+        btn_buscar_cep_evento = ctk.CTkButton(
+            frame,
+            text="Buscar",
+            width=80,
+            command=self.buscar_cep_evento
+        )
+        btn_buscar_cep_evento.grid(row=row, column=2, sticky="w", padx=(10, 0), pady=3)
+
+        for col in range(4):
+            frame.grid_columnconfigure(col, weight=0)
+        frame.grid_columnconfigure(1, weight=1)
+
+    # ----------------- SOM / ALIMENTAÇÃO -----------------
+    def _build_tab_som(self, parent: ctk.CTkFrame):
+        frame = ctk.CTkFrame(parent)
+        frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        ctk.CTkLabel(frame, text="Responsabilidade pelo som",
+                     font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 10))
+
+        ctk.CTkLabel(frame, text="Quem fornece o som (PA, caixas, etc.)?").pack(anchor="w", pady=(0, 5))
+
+        rb_frame = ctk.CTkFrame(frame)
+        rb_frame.pack(anchor="w", pady=5)
+
+        ctk.CTkRadioButton(
+            rb_frame,
+            text="Banda",
+            variable=self.som_responsavel_var,
+            value="Banda"
+        ).pack(side="left", padx=(0, 15))
+
+        ctk.CTkRadioButton(
+            rb_frame,
+            text="Contratante",
+            variable=self.som_responsavel_var,
+            value="Contratante"
+        ).pack(side="left")
+
+        ctk.CTkLabel(
+            frame,
+            text="Obs.: o texto da cláusula será gerado automaticamente com base nessa escolha.",
+            wraplength=600,
+            justify="left"
+        ).pack(anchor="w", pady=(10, 0))
+        
+            # Alimentação (cláusula opcional)
+        ctk.CTkLabel(
+            frame,
+            text="Alimentação",
+            font=ctk.CTkFont(weight="bold")
+        ).pack(anchor="w", pady=(20, 5))
+
+        ctk.CTkLabel(
+            frame,
+            text="Deseja incluir cláusula de alimentação/consumação para o staff da banda?"
+        ).pack(anchor="w")
+
+        alimentacao_frame = ctk.CTkFrame(frame)
+        alimentacao_frame.pack(anchor="w", pady=5)
+
+        ctk.CTkRadioButton(
+            alimentacao_frame,
+            text="Sim",
+            variable=self.alimentacao_var,
+            value="Sim"
+        ).pack(side="left", padx=(0, 15))
+
+        ctk.CTkRadioButton(
+            alimentacao_frame,
+            text="Não",
+            variable=self.alimentacao_var,
+            value="Não"
+        ).pack(side="left")
+
+    # ----------------- PAGAMENTO -----------------
+    def _build_tab_pagamento(self, parent: ctk.CTkFrame):
+        frame = ctk.CTkScrollableFrame(parent)
+        frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        ctk.CTkLabel(
+            frame,
+            text="Valor e forma de pagamento",
+            font=ctk.CTkFont(weight="bold")
+        ).grid(row=0, column=0, sticky="w", pady=(0, 5))
+
+        # Valor total
+        self._add_labeled_entry(frame, "Valor total (R$)", "pagamento_valor_total", row=1, width=150)
+
+        # Forma
+        ctk.CTkLabel(frame, text="Forma", width=130, anchor="w").grid(row=2, column=0, sticky="w", pady=(5, 5))
+        cb_forma = ctk.CTkComboBox(
+            frame,
+            values=["À vista", "Sinal + restante", "Parcelado", "Outro"],
+            width=180,
+            variable=self.modelo.vars["pagamento_forma"]
+        )
+        cb_forma.grid(row=2, column=1, sticky="w")
+        self.inputs["pagamento_forma"] = cb_forma
+
+        # Meio
+        ctk.CTkLabel(frame, text="Meio", width=130, anchor="w").grid(row=3, column=0, sticky="w", pady=(5, 5))
+        cb_meio = ctk.CTkComboBox(
+            frame,
+            values=["PIX", "TED/DOC", "Dinheiro", "Boleto", "Cartão", "Outro"],
+            width=180,
+            variable=self.modelo.vars["pagamento_meio"]
+        )
+        cb_meio.grid(row=3, column=1, sticky="w")
+        self.inputs["pagamento_meio"] = cb_meio
+
+        # seções específicas por forma de pagamento: construídas quando a forma
+        # é escolhida (ver _update_pagamento_forma_ui)
+        self._pag_container = frame
+
+        for col in range(4):
+            frame.grid_columnconfigure(col, weight=0)
+        frame.grid_columnconfigure(1, weight=1)
+
+    def _build_pag_avista(self, parent):
+        self.pag_frame_avista = ctk.CTkFrame(parent)
+        self.pag_frame_avista.grid(row=4, column=0, columnspan=4, sticky="w", pady=(15, 5))
+        ctk.CTkLabel(
+            self.pag_frame_avista,
+            text="À vista",
+            font=ctk.CTkFont(weight="bold")
+        ).grid(row=0, column=0, sticky="w", pady=(0, 5))
+        self._add_labeled_entry(
+            self.pag_frame_avista,
+            "Data de pagamento (dd/mm/aaaa)",
+            "pagamento_data_unica",
+            row=1,
+            width=150
+        )
+
+    def _build_pag_sinal(self, parent):
+        self.pag_frame_sinal = ctk.CTkFrame(parent)
+        self.pag_frame_sinal.grid(row=5, column=0, columnspan=4, sticky="w", pady=(15, 5))
+        ctk.CTkLabel(
+            self.pag_frame_sinal,
+            text="Sinal + restante",
+            font=ctk.CTkFont(weight="bold")
+        ).grid(row=0, column=0, sticky="w", pady=(0, 5))
+        self._add_labeled_entry(
+            self.pag_frame_sinal,
+            "Sinal (%)",
+            "pagamento_sinal_percentual",
+            row=1,
+            width=80
+        )
+        self._add_labeled_entry(
+            self.pag_frame_sinal,
+            "Data do sinal (dd/mm/aaaa)",
+            "pagamento_sinal_data",
+            row=2,
+            width=150
+        )
+        self._add_labeled_entry(
+            self.pag_frame_sinal,
+            "Data do restante (dd/mm/aaaa)",
+            "pagamento_restante_data",
+            row=3,
+            width=150
+        )
+
+    def _build_pag_parc(self, parent):
+        self.pag_frame_parc = ctk.CTkFrame(parent)
+        self.pag_frame_parc.grid(row=6, column=0, columnspan=4, sticky="w", pady=(15, 5))
+        ctk.CTkLabel(
+            self.pag_frame_parc,
+            text="Parcelado (MVP)",
+            font=ctk.CTkFont(weight="bold")
+        ).grid(row=0, column=0, sticky="w", pady=(0, 5))
+        self._add_labeled_entry(
+            self.pag_frame_parc,
+            "Nº de parcelas",
+            "pagamento_num_parcelas",
+            row=1,
+            width=80
+        )
+        self._add_labeled_entry(
+            self.pag_frame_parc,
+            "1ª parcela em (dd/mm/aaaa)",
+            "pagamento_primeira_parcela_data",
+            row=2,
+            width=150
+        )
+
+        ctk.CTkLabel(self.pag_frame_parc, text="Periodicidade", width=130, anchor="w").grid(
+            row=3, column=0, sticky="w", pady=(5, 5)
+        )
+        cb_period = ctk.CTkComboBox(
+            self.pag_frame_parc,
+            values=["Mensal", "Semanal", "Outro"],
+            width=120,
+            variable=self.modelo.vars["pagamento_periodicidade"]
+        )
+        cb_period.grid(row=3, column=1, sticky="w")
+        self.inputs["pagamento_periodicidade"] = cb_period
+
+    def _update_pagamento_forma_ui(self, forma: str | None = None):
+        """Mostra apenas a seção de campos correspondente à forma de pagamento escolhida."""
+        if forma is None:
+            forma = self.modelo.get("pagamento_forma")
+        forma = (forma or "").strip()
+
+        # aba Pagamento ainda não construída: as seções são montadas quando for
+        if self._pag_container is None:
+            return
+
+        secoes = {
+            "À vista": ("pag_frame_avista", self._build_pag_avista),
+            "Sinal + restante": ("pag_frame_sinal", self._build_pag_sinal),
+            "Parcelado": ("pag_frame_parc", self._build_pag_parc),
+        }
+
+        # Esconde todas as seções
+        for atributo, _ in secoes.values():
+            frame = getattr(self, atributo)
+            if frame is not None:
+                frame.grid_remove()
+
+        # Mostra apenas a correspondente ("Outro" -> nenhuma seção específica),
+        # construindo-a na primeira vez
+        if forma in secoes:
+            atributo, construir = secoes[forma]
+            if getattr(self, atributo) is None:
+                self._construir(construir, self._pag_container)
+            else:
+                getattr(self, atributo).grid()
+
+    # ----------------- FAVORECIDO -----------------
+    def _build_tab_favorecido(self, parent: ctk.CTkFrame):
+        frame = ctk.CTkScrollableFrame(parent)
+        frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        ctk.CTkLabel(frame, text="Dados do favorecido",
+                font=ctk.CTkFont(weight="bold")).grid(row=0, column=0, sticky="w", pady=(0, 5))
+
+        self._add_labeled_entry(frame, "Nome", "favorecido_nome", row=1, width=350)
+        self._add_labeled_entry(frame, "CPF / CNPJ", "favorecido_cpf_cnpj", row=2, width=180)
+
+        # checkbox para copiar dados do CONTRATADO
+        ctk.CTkCheckBox(
+            frame,
+            text="Favorecido é o mesmo que o CONTRATADO",
+            variable=self.favorecido_igual_contratado_var,
+            command=self._on_toggle_favorecido_igual_contratado
+        ).grid(row=3, column=0, sticky="w", pady=(5, 10))
+
+        ctk.CTkLabel(frame, text="Dados bancários (opcional)",
+                     font=ctk.CTkFont(weight="bold")).grid(row=4, column=0, sticky="w", pady=(15, 5))
+
+        self._add_labeled_entry(frame, "Banco", "favorecido_banco_nome", row=5, width=250)
+        self._add_labeled_entry(frame, "Cód. banco", "favorecido_banco_codigo", row=6, width=80)
+        self._add_labeled_entry(frame, "Agência", "favorecido_agencia", row=7, width=100)
+        self._add_labeled_entry(frame, "Conta", "favorecido_conta", row=8, width=140)
+
+        ctk.CTkLabel(frame, text="Tipo conta", width=130, anchor="w").grid(row=9, column=0, sticky="w", pady=(5, 5))
+        cb_tipoconta = ctk.CTkComboBox(
+            frame,
+            values=["Corrente", "Poupança", "Pagamento"],
+            width=150,
+            variable=self.modelo.vars["favorecido_tipo_conta"]
+        )
+        cb_tipoconta.grid(row=9, column=1, sticky="w")
+        self.inputs["favorecido_tipo_conta"] = cb_tipoconta
+
+        ctk.CTkLabel(frame, text="PIX", font=ctk.CTkFont(weight="bold")).grid(
+            row=10, column=0, sticky="w", pady=(15, 5)
+        )
+
+        self._add_labeled_entry(frame, "Chave PIX", "favorecido_pix_chave", row=11, width=350)
+
+        ctk.CTkLabel(frame, text="Tipo da chave", width=130, anchor="w").grid(row=12, column=0, sticky="w", pady=(5, 5))
+        cb_pixtipo = ctk.CTkComboBox(
+            frame,
+            values=["CPF/CNPJ", "E-mail", "Telefone", "Chave aleatória"],
+            width=150,
+            variable=self.modelo.vars["favorecido_pix_tipo"]
+        )
+        cb_pixtipo.grid(row=12, column=1, sticky="w")
+        self.inputs["favorecido_pix_tipo"] = cb_pixtipo
+
+        for col in range(4):
+            frame.grid_columnconfigure(col, weight=0)
+        frame.grid_columnconfigure(1, weight=1)
+
+    def _on_toggle_favorecido_igual_contratado(self):
+        """Quando marcado, copia nome/CPF do CONTRATADO para o FAVORECIDO e bloqueia edição."""
+        marcado = self.favorecido_igual_contratado_var.get()
+
+        if marcado:
+            self.modelo.set("favorecido_nome", self.modelo.get("contratado_nome_razao"))
+            self.modelo.set("favorecido_cpf_cnpj", self.modelo.get("contratado_cpf_cnpj"))
+        else:
+            self.modelo.set("favorecido_nome", "")
+            self.modelo.set("favorecido_cpf_cnpj", "")
+        self._bloquear_favorecido(marcado)
+
+    def _bloquear_favorecido(self, bloquear: bool):
+        for key in ("favorecido_nome", "favorecido_cpf_cnpj"):
+            widget = self.inputs.get(key)
+            if widget:
+                widget.configure(state="disabled" if bloquear else "normal")
+
+    # ----------------- RESUMO -----------------
+    def _build_tab_resumo(self, parent: ctk.CTkFrame):
+        frame = ctk.CTkFrame(parent)
+        frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        ctk.CTkLabel(frame, text="Resumo do contrato",
+                     font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+
+        btn_atualizar_resumo = ctk.CTkButton(
+            frame,
+            text="Atualizar resumo",
+            command=self._update_resumo_preview
+        )
+        btn_atualizar_resumo.pack(anchor="w", pady=(0, 5))
+
+        self.preview_box = ctk.CTkTextbox(frame, width=900, height=450)
+        self.preview_box.pack(fill="both", expand=True, pady=(5, 0))
+
+    def _build_tab_contratos(self, parent: ctk.CTkFrame):
+        frame = ctk.CTkFrame(parent)
+        frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        ctk.CTkLabel(frame, text="Contratos gerados",
+                     font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+
+        # filtros (fora de self.inputs: não fazem parte do preenchimento)
+        filtros = ctk.CTkFrame(frame, fg_color="transparent")
+        filtros.pack(fill="x", pady=(0, 5))
+        self.filtros_contratos = {}
+        campos = (
+            ("Atração", "atracao", 200),
+            ("De", "data_de", 100),
+            ("Até", "data_ate", 100),
+            ("CPF/CNPJ contratante", "contratante", 160),
+        )
+        for col, (rotulo, chave, largura) in enumerate(campos):
+            ctk.CTkLabel(filtros, text=rotulo).grid(row=0, column=2 * col, sticky="w",
+                                                    padx=(0 if col == 0 else 10, 5))
+            entry = ctk.CTkEntry(filtros, width=largura)
+            entry.grid(row=0, column=2 * col + 1, sticky="w")
+            entry.bind("<Return>", lambda _e: self._buscar_contratos())
+            self.filtros_contratos[chave] = entry
+        ctk.CTkButton(filtros, text="Buscar", width=90,
+                      command=self._buscar_contratos).grid(row=0, column=2 * len(campos), padx=(10, 0))
+
+        # número fixo de linhas, reaproveitadas a cada página: a quantidade de
+        # widgets não depende de quantos contratos existem
+        lista = ctk.CTkFrame(frame)
+        lista.pack(fill="both", expand=True)
+        self._linhas_contratos = []
+        for i in range(self.LINHAS_POR_PAGINA):
+            linha = ctk.CTkButton(
+                lista, text="", anchor="w", fg_color="transparent",
+                text_color=("gray10", "gray90"), hover_color=("gray75", "gray30"),
+                command=lambda i=i: self._abrir_contrato_da_lista(i),
+            )
+            linha.pack(fill="x", padx=5, pady=1)
+            self._linhas_contratos.append(linha)
+
+        nav = ctk.CTkFrame(frame, fg_color="transparent")
+        nav.pack(fill="x", pady=(5, 0))
+        self._btn_pagina_anterior = ctk.CTkButton(
+            nav, text="◀ Anterior", width=100, state="disabled",
+            command=lambda: self._mostrar_pagina_contratos(self._pagina_contratos - 1),
+        )
+        self._btn_pagina_anterior.pack(side="left")
+        self._btn_pagina_proxima = ctk.CTkButton(
+            nav, text="Próxima ▶", width=100, state="disabled",
+            command=lambda: self._mostrar_pagina_contratos(self._pagina_contratos + 1),
+        )
+        self._btn_pagina_proxima.pack(side="left", padx=(10, 0))
+        self._lbl_pagina_contratos = ctk.CTkLabel(nav, text="")
+        self._lbl_pagina_contratos.pack(side="left", padx=(15, 0))
+
+        self._filtros_atuais = {}
+        self._total_contratos = 0
+        self._pagina_contratos = 0
+        self._contratos_na_pagina = []
+
+    # ---------------------------------------------------------
+    # Aba Contratos (registro)
+    # ---------------------------------------------------------
+    LINHAS_POR_PAGINA = 15
+
+    def _abrir_registro(self):
+        if self.registro is None:
+            try:
+                self.registro = RegistroContratos.da_pasta(SAIDA_DIR)
+            except (OSError, sqlite3.Error) as e:
+                messagebox.showerror("Registro indisponível",
+                                     f"Não foi possível abrir o registro de contratos:\n{e}")
+        return self.registro
+
+    def _buscar_contratos(self, manter_pagina: bool = False):
+        registro = self._abrir_registro()
+        if registro is None:
+            return
+        filtros = {chave: entry.get().strip() or None
+                   for chave, entry in self.filtros_contratos.items()}
+        try:
+            self._total_contratos = registro.contar(**filtros)
+            self._filtros_atuais = filtros
+            self._mostrar_pagina_contratos(self._pagina_contratos if manter_pagina else 0)
+        except ValueError as e:
+            messagebox.showerror("Filtro inválido", str(e))
+        except sqlite3.Error as e:
+            # registro aberto, mas ilegível (corrompido, travado por outro processo...)
+            self._lbl_pagina_contratos.configure(text=f"Erro ao ler o registro: {e}")
+
+    def _mostrar_pagina_contratos(self, pagina: int):
+        if self.registro is None:
+            return  # registro indisponível: nada a paginar
+        n = self.LINHAS_POR_PAGINA
+        paginas = max(1, -(-self._total_contratos // n))
+        pagina = min(max(pagina, 0), paginas - 1)
+        self._pagina_contratos = pagina
+
+        # só a página visível é lida do registro
+        self._contratos_na_pagina = self.registro.buscar(
+            **self._filtros_atuais, limite=n, deslocamento=pagina * n
+        )
+        for i, linha in enumerate(self._linhas_contratos):
+            if i < len(self._contratos_na_pagina):
+                c = self._contratos_na_pagina[i]
+                valor = Dinheiro(c["valor_centavos"]).formatado if c["valor_centavos"] is not None else "-"
+                texto = (f"{c['evento_data'] or '-'}   {c['atracao'] or '-'}   "
+                         f"{c['contratante_nome'] or '-'}   {valor}   v{c['versao']}")
+                linha.configure(text=texto, state="normal")
+            else:
+                linha.configure(text="", state="disabled")
+
+        self._btn_pagina_anterior.configure(state="normal" if pagina > 0 else "disabled")
+        self._btn_pagina_proxima.configure(state="normal" if pagina < paginas - 1 else "disabled")
+        self._lbl_pagina_contratos.configure(
+            text=f"Página {pagina + 1} de {paginas} — {self._total_contratos} contrato(s)"
+        )
+
+    def _abrir_contrato_da_lista(self, indice: int):
+        if indice >= len(self._contratos_na_pagina):
+            return
+        caminho = SAIDA_DIR / self._contratos_na_pagina[indice]["json"]
+        try:
+            snapshot = carregar_snapshot(caminho)
+        except (OSError, ValueError, KeyError) as e:
+            messagebox.showerror(
+                "Erro ao abrir contrato",
+                f"{e}\n\nSe os arquivos foram movidos, use 'python contracts.py registro reconstruir'.",
+            )
+            return
+        self._aplicar_snapshot(snapshot)
+        self.tabview.set("Contratante")
+
+    # ---------------------------------------------------------
+    # Utilitários de layout
+    # ---------------------------------------------------------
+    def _add_labeled_entry(self, parent, label, key, row, width=300):
+        ctk.CTkLabel(parent, text=label, width=130, anchor="w").grid(row=row, column=0, sticky="w", pady=3)
+        entry = ctk.CTkEntry(parent, width=width, textvariable=self.modelo.vars[key])
+        entry.grid(row=row, column=1, sticky="w", pady=3)
+        self.inputs[key] = entry
+
+    # ---------------------------------------------------------
+    # Busca CEP (ViaCEP)
+    # ---------------------------------------------------------
+    def _preencher_endereco_por_cep(self, cep_key: str):
+        """
+        Usa o CEP (campo cep_key) para preencher logradouro/bairro/cidade/UF
+        (os campos de ENDERECOS_CEP[cep_key]).
+        A consulta roda em segundo plano; o resultado é aplicado via after().
+        """
+        cep = normalizar_cep(self.modelo.get(cep_key))
+
+        if len(cep) != 8:
+            messagebox.showerror("CEP inválido", "Informe um CEP com 8 dígitos.")
+            return
+
+        # nova busca para o mesmo campo descarta a anterior, se ainda pendente
+        anterior = self._cep_pendentes.pop(cep_key, None)
+        if anterior is not None:
+            anterior.cancel()
+
+        destinos = ENDERECOS_CEP[cep_key]
+
+        # CEP na base offline ou já consultado antes: preenche na hora, sem passar pelo pool
+        try:
+            data = self.cliente_cep.consultar_local(cep)
+        except sqlite3.Error:
+            data = None
+        if data is not None:
+            self._preencher_campos_cep(data, destinos)
+            return
+
+        futuro = self.cliente_cep.consultar_em_segundo_plano(cep)
+        self._cep_pendentes[cep_key] = futuro
+        self.after(50, self._aplicar_resultado_cep, cep_key, futuro, destinos)
+
+    def _aplicar_resultado_cep(self, cep_key: str, futuro, destinos: tuple):
+        """Roda na thread da interface: aguarda o Future sem bloquear e preenche os campos."""
+        if self._cep_pendentes.get(cep_key) is not futuro:
+            return  # substituída por uma busca mais recente
+        if not futuro.done():
+            self.after(50, self._aplicar_resultado_cep, cep_key, futuro, destinos)
+            return
+        del self._cep_pendentes[cep_key]
+
+        try:
+            data = futuro.result()
+        except Exception as e:
+            messagebox.showerror("Erro na consulta",
+                                 f"Não foi possível consultar o CEP.\n\nDetalhes: {e}")
+            return
+
+        self._preencher_campos_cep(data, destinos)
+
+    def _preencher_campos_cep(self, data: dict, destinos: tuple):
+        if data.get("erro"):
+            messagebox.showerror("CEP não encontrado",
+                                 "Não foi possível localizar o CEP informado.")
+            return
+
+        # Preenche campos
+        for key, value in campos_do_endereco(data, destinos).items():
+            self.modelo.set(key, value)
+
+    def buscar_cep_contratante(self):
+        self._preencher_endereco_por_cep("contratante_endereco_cep")
+
+    def buscar_cep_evento(self):
+        self._preencher_endereco_por_cep("evento_local_cep")
+
+    def buscar_cep_contratado(self):
+        self._preencher_endereco_por_cep("contratado_endereco_cep")
+
+    # ---------------------------------------------------------
+    # Lógica de botões
+    # ---------------------------------------------------------
+    def limpar_campos(self):
+        self.modelo.limpar()
+
+        self.som_responsavel_var.set("Contratante")
+        self.alimentacao_var.set("Sim")
+        if self.preview_box is not None:
+            self.preview_box.delete("1.0", "end")
+        
+        self.favorecido_igual_contratado_var.set(False)
+        self._on_toggle_favorecido_igual_contratado()
+        self.modelo.set("pagamento_forma", "À vista")
+        self._update_pagamento_forma_ui("À vista")
+
+    def _update_resumo_preview(self):
+        """Atualiza o resumo sem gerar o contrato."""
+        if self.preview_box is None:
+            return  # aba Resumo ainda não aberta: o resumo é montado quando for
+
+        sujas = self._secoes_sujas | {chave.split("_", 1)[0] for chave in self.modelo.consumir_sujos()}
+        self._secoes_sujas = set()
+        values = self.modelo.valores()
+        for secao in sujas:
+            self._resumo_secoes[secao] = getattr(self, f"_resumo_{secao}")(values)
+
+        resumo = ["CONTRATO DE PRESTAÇÃO DE SERVIÇOS MUSICAIS\n", "-" * 60 + "\n\n"]
+        resumo.extend(self._resumo_secoes[secao] for secao in SECOES_RESUMO)
+        resumo.append("(Resumo prévio — o contrato completo será gerado ao clicar em 'Gerar contrato'.)\n")
+
+        self.preview_box.delete("1.0", "end")
+        self.preview_box.insert("1.0", "".join(resumo))
+
+    def _resumo_contratante(self, values: dict) -> str:
+        resumo = []
+        resumo.append("CONTRATANTE:\n")
+        resumo.append(f"  Nome/Razão Social: {values.get('contratante_nome_razao', '')}\n")
+        resumo.append(f"  CPF/CNPJ: {values.get('contratante_cpf_cnpj', '')}\n")
+        resumo.append(f"  Endereço: {values.get('contratante_endereco_logradouro', '')}, "
+                      f"{values.get('contratante_endereco_numero', '')} - "
+                      f"{values.get('contratante_endereco_bairro', '')}, "
+                      f"{values.get('contratante_endereco_cidade', '')}/"
+                      f"{values.get('contratante_endereco_uf', '')} - "
+                      f"CEP: {values.get('contratante_endereco_cep', '')}\n")
+        resumo.append(f"  Telefone: {values.get('contratante_telefone', '')}\n")
+        resumo.append(f"  E-mail: {values.get('contratante_email', '')}\n\n")
+        return "".join(resumo)
+
+    def _resumo_contratado(self, values: dict) -> str:
+        resumo = []
+        resumo.append("CONTRATADO:\n")
+        resumo.append(f"  Nome/Razão Social: {values.get('contratado_nome_razao', '')}\n")
+        resumo.append(f"  CPF/CNPJ: {values.get('contratado_cpf_cnpj', '')}\n")
+        resumo.append(f"  Endereço: {values.get('contratado_endereco_logradouro', '')}, "
+                      f"{values.get('contratado_endereco_numero', '')} - "
+                      f"{values.get('contratado_endereco_bairro', '')}, "
+                      f"{values.get('contratado_endereco_cidade', '')}/"
+                      f"{values.get('contratado_endereco_uf', '')} - "
+                      f"CEP: {values.get('contratado_endereco_cep', '')}\n")
+        resumo.append(f"  Telefone: {values.get('contratado_telefone', '')}\n")
+        resumo.append(f"  E-mail: {values.get('contratado_email', '')}\n\n")
+        return "".join(resumo)
+
+    def _resumo_evento(self, values: dict) -> str:
+        resumo = []
+        resumo.append("EVENTO:\n")
+        resumo.append(f"  Nome do evento: {values.get('evento_nome', '')}\n")
+        resumo.append(f"  Data: {values.get('evento_data', '')}\n")
+        resumo.append(
+            f"  Horário: {values.get('evento_horario_inicio', '')}h às "
+            f"{values.get('evento_horario_fim_previsto', '')}h\n"
+        )
+        resumo.append(
+            "  Local: "
+            f"{values.get('evento_local_nome', '')}, "
+            f"{values.get('evento_local_logradouro', '')}, "
+            f"{values.get('evento_local_numero', '')} - "
+            f"{values.get('evento_local_bairro', '')}, "
+            f"{values.get('evento_local_cidade', '')}/"
+            f"{values.get('evento_local_uf', '')} - "
+            f"CEP: {values.get('evento_local_cep', '')}\n\n"
+        )
+        return "".join(resumo)
+
+    def _resumo_som(self, values: dict) -> str:
+        resumo = []
+        resumo.append("RESPONSABILIDADE PELO SOM:\n")
+        if self.som_responsavel_var.get() == "Banda":
+            resumo.append("  A banda será responsável por levar e operar o sistema de som necessário.\n\n")
+        else:
+            resumo.append("  O CONTRATANTE será responsável pelo sistema de som necessário.\n\n")
+        return "".join(resumo)
+
+    def _resumo_alimentacao(self, values: dict) -> str:
+        resumo = []
+        resumo.append("ALIMENTAÇÃO:\n")
+        if self.alimentacao_var.get() == "Sim":
+            resumo.append("  Haverá fornecimento de alimentação/consumação ao staff.\n\n")
+        else:
+            resumo.append("  Não haverá fornecimento de alimentação.\n\n")
+        return "".join(resumo)
+
+    def _resumo_pagamento(self, values: dict) -> str:
+        resumo = []
+        resumo.append("PAGAMENTO:\n")
+        valor_total = values.get("pagamento_valor_total", "")
+        dinheiro = Dinheiro.parse(valor_total)
+        resumo.append(f"  Valor total: {dinheiro.formatado if dinheiro else valor_total}\n")
+        resumo.append(f"  Forma: {values.get('pagamento_forma', '')}\n")
+        resumo.append(f"  Meio: {values.get('pagamento_meio', '')}\n\n")
+        return "".join(resumo)
+
+    def _resumo_favorecido(self, values: dict) -> str:
+        resumo = []
+        resumo.append("FAVORECIDO:\n")
+        resumo.append(f"  Nome: {values.get('favorecido_nome', '')}\n")
+        resumo.append(f"  CPF/CNPJ: {values.get('favorecido_cpf_cnpj', '')}\n")
+        resumo.append(
+            f"  Chave PIX: {values.get('favorecido_pix_chave', '')} "
+            f"({values.get('favorecido_pix_tipo', '')})\n\n"
+        )
+        return "".join(resumo)
+
+    def _on_tab_change(self):
+        """Callback do TabView — constrói a aba ativa na primeira vez e atualiza o resumo se for a aba Resumo."""
+        aba = self.tabview.get()
+        self._garantir_aba(aba)
+        if aba == "Resumo":
+            try:
+                self._update_resumo_preview()
+            except Exception:
+                pass
+        elif aba == "Contratos":
+            self._buscar_contratos(manter_pagina=True)  # trata os próprios erros
+
+    def gerar_contrato(self):
+        """
+        MVP: monta um texto de resumo com base em alguns campos, mostra na aba
+        Resumo e põe o DOCX na fila de geração (não espera ele ficar pronto).
+        """
+        # coleta de dados (inclusive de abas ainda não construídas)
+        values = self.modelo.valores()
+
+        som = self.som_responsavel_var.get()
+        alimentacao = self.alimentacao_var.get()
+        
+        snapshot = {
+            "values": values,
+            "som": som,
+            "alimentacao": alimentacao,
+            "favorecido_igual_contratado": self.favorecido_igual_contratado_var.get(),
+        }
+
+        # ---------- PREVIEW ----------
+        self._update_resumo_preview()
+
+        # ---------- GERAÇÃO DO DOCX ----------
+        # roda no worker; o resultado é aplicado via after() (_acompanhar_geracao)
+        futuro = self._geracao.submit(gerar_arquivos_contrato, snapshot)
+        self._geracoes_pendentes.append(futuro)
+        if len(self._geracoes_pendentes) == 1:
+            self.after(100, self._acompanhar_geracao)
+        self._atualizar_status_geracao()
+
+    def _acompanhar_geracao(self):
+        """Roda na thread da interface: trata as gerações concluídas, na ordem em que foram pedidas."""
+        concluidas = 0
+        while self._geracoes_pendentes and self._geracoes_pendentes[0].done():
+            futuro = self._geracoes_pendentes.pop(0)
+            concluidas += 1
+            try:
+                arquivo_saida = futuro.result()
+            except Exception as e:
+                self._atualizar_status_geracao("Erro ao gerar contrato.")
+                messagebox.showerror(
+                    "Erro ao gerar contrato",
+                    f"Ocorreu um erro ao gerar o contrato:\n{e}"
+                )
+            else:
+                self._atualizar_status_geracao(f"Contrato gerado em: {arquivo_saida}")
+
+        if self._geracoes_pendentes:
+            self.after(100, self._acompanhar_geracao)
+
+        # a lista de contratos aberta passa a incluir os novos
+        if concluidas and self.tabview.get() == "Contratos" and self.registro is not None:
+            self._buscar_contratos(manter_pagina=True)
+
+    def _atualizar_status_geracao(self, mensagem: str = ""):
+        pendentes = len(self._geracoes_pendentes)
+        if pendentes:
+            mensagem = f"Gerando contrato... ({pendentes} na fila)" if pendentes > 1 else "Gerando contrato..."
+        elif not mensagem:
+            return
+        self.status_geracao.configure(text=mensagem)
+
+    def carregar_preenchimento(self):
+        path = filedialog.askopenfilename(
+            title="Selecione o preenchimento do contrato",
+            initialdir=ultima_pasta(SAIDA_DIR),
+            filetypes=[("JSON", "*.json")]
+        )
+        if not path:
+            return
+
+        try:
+            snapshot = carregar_snapshot(path)
+        except (OSError, ValueError, KeyError) as e:
+            # versões delta precisam das anteriores na mesma pasta
+            messagebox.showerror(
+                "Erro ao carregar preenchimento",
+                f"{e}\n\nSe for uma versão _vN.json copiada sozinha, copie também as versões "
+                "anteriores do mesmo contrato para a mesma pasta.",
+            )
+            return
+        self._aplicar_snapshot(snapshot)
+
+    def _aplicar_snapshot(self, snapshot: dict):
+        """Repopula o formulário com um snapshot salvo."""
+
+        values = snapshot.get("values", {})
+        som = snapshot.get("som", "Contratante")
+        alimentacao = snapshot.get("alimentacao", "Não")
+        fav_igual = snapshot.get("favorecido_igual_contratado", False)
+
+        # repopula os campos (inclusive de abas ainda não construídas)
+        for key, value in values.items():
+            self.modelo.set(key, value)
+
+        # repopula radios
+        self.som_responsavel_var.set(som)
+        self.alimentacao_var.set(alimentacao)
+        self.favorecido_igual_contratado_var.set(bool(fav_igual))
+        self._on_toggle_favorecido_igual_contratado()
+        # Atualiza visibilidade das seções de pagamento com base na forma carregada
+        self._update_pagamento_forma_ui(values.get("pagamento_forma", ""))
+        # Atualiza o resumo se já estiver na aba Resumo
+        try:
+            if self.tabview.get() == "Resumo":
+                self._update_resumo_preview()
+        except Exception:
+            pass
@@ -0,0 +1,200 @@
+"""
+Geração de contratos em lote, sem interface gráfica.
+
+    python contracts.py batch <pasta-ou-arquivo.jsonl> [--workers N] [--saida DIR]
+    python contracts.py batch planilha.csv --enriquecer-cep
+
+Lê os mesmos snapshots JSON gravados por "Gerar contrato" (ou as linhas de
+uma planilha exportada em CSV) e distribui a montagem do contexto e a
+renderização entre processos. Com --enriquecer-cep, os endereços são
+preenchidos a partir dos CEPs antes da geração.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+
+from .cep import VIACEP_URL, CacheCep, ClienteCep
+from .cep_offline import BaseCepOffline
+from .config import CEP_CACHE_PATH, CEP_OFFLINE_PATH, LAYOUT_SAIDA, SAIDA_DIR, TEMPLATE_CONTRATO
+from .geracao import gerar_arquivos_contrato
+from .saida import LAYOUTS
+from .snapshots import carregar_snapshot
+from .template_docx import carregar_template
+
+# colunas do CSV que vão para o snapshot, e não para 'values'
+_COLUNAS_SNAPSHOT = ("som", "alimentacao", "favorecido_igual_contratado")
+
+
+def _snapshot_da_linha(linha: dict) -> dict:
+    """Linha de planilha (colunas com os nomes dos campos do formulário) -> snapshot."""
+    values = {}
+    snapshot = {}
+    for coluna, valor in linha.items():
+        if not coluna:
+            continue
+        coluna = coluna.strip()
+        valor = (valor or "").strip()
+        if coluna in _COLUNAS_SNAPSHOT:
+            snapshot[coluna] = valor
+        else:
+            values[coluna] = valor
+    if "favorecido_igual_contratado" in snapshot:
+        snapshot["favorecido_igual_contratado"] = (
+            snapshot["favorecido_igual_contratado"].lower() in ("1", "sim", "true", "s")
+        )
+    snapshot["values"] = values
+    return snapshot
+
+
+def ler_snapshots(origem: Path) -> list:
+    """
+    Lê snapshots de uma pasta (*.json), de um .jsonl (um snapshot por linha),
+    de um .csv (uma linha por contrato, com cabeçalho) ou de um único .json.
+    Devolve uma lista de (identificação, snapshot).
+    """
+    origem = Path(origem)
+    itens = []
+
+    if origem.is_dir():
+        for path in sorted(origem.glob("*.json")):
+            itens.append((path.name, carregar_snapshot(path)))
+    elif origem.suffix.lower() == ".jsonl":
+        with open(origem, "r", encoding="utf-8") as f:
+            for n, linha in enumerate(f, start=1):
+                if linha.strip():
+                    itens.append((f"{origem.name}:{n}", json.loads(linha)))
+    elif origem.suffix.lower() == ".csv":
+        with open(origem, "r", encoding="utf-8-sig", newline="") as f:
+            amostra = f.read(4096)
+            f.seek(0)
+            try:
+                dialeto = csv.Sniffer().sniff(amostra, delimiters=",;\t")
+            except csv.Error:
+                # planilha de uma coluna só: não há separador para detectar
+                dialeto = csv.excel
+            for n, linha in enumerate(csv.DictReader(f, dialect=dialeto), start=2):
+                itens.append((f"{origem.name}:{n}", _snapshot_da_linha(linha)))
+    else:
+        itens.append((origem.name, carregar_snapshot(origem)))
+
+    return itens
+
+
+def _gerar(snapshot: dict, saida_dir: Path, template: Path, layout: str) -> str:
+    """Executado nos processos do pool."""
+    return str(gerar_arquivos_contrato(snapshot, saida_dir, template, layout))
+
+
+def _cliente_cep(args) -> ClienteCep:
+    """Cliente para o enriquecimento; a URL pode apontar para um servidor local de testes."""
+    cache = base = None
+    if not args.sem_cache_cep:
+        try:
+            cache = CacheCep(CEP_CACHE_PATH)
+        except (OSError, sqlite3.Error):
+            cache = None
+        if CEP_OFFLINE_PATH.exists():
+            try:
+                base = BaseCepOffline(CEP_OFFLINE_PATH)
+            except (OSError, ValueError):
+                base = None
+    return ClienteCep(url=args.cep_url, max_workers=args.cep_workers, cache=cache,
+                      base_offline=base, por_segundo=args.cep_por_segundo)
+
+
+def _enriquecer(itens: list, args):
+    from .enriquecimento import enriquecer_snapshots
+
+    cliente = _cliente_cep(args)
+    try:
+        resumo = enriquecer_snapshots((s for _, s in itens), cliente,
+                                      sobrescrever=args.sobrescrever_endereco)
+    finally:
+        cliente.fechar()
+
+    print(f"CEP: {resumo['ceps']} distinto(s), {resumo['campos']} campo(s) preenchido(s).",
+          flush=True)
+    for cep in resumo["nao_encontrados"]:
+        print(f"CEP não encontrado: {cep}", flush=True)
+    for cep, erro in resumo["falhas"].items():
+        print(f"ERRO ao consultar o CEP {cep}: {erro}", flush=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="contracts.py batch",
+        description="Gera contratos em lote a partir de snapshots JSON.",
+    )
+    parser.add_argument("origem", type=Path,
+                        help="pasta com snapshots .json, arquivo .jsonl, planilha .csv ou um único .json")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="número de processos (padrão: número de CPUs)")
+    parser.add_argument("-o", "--saida", type=Path, default=SAIDA_DIR,
+                        help="pasta de saída (padrão: contratos_gerados)")
+    parser.add_argument("--template", type=Path, default=TEMPLATE_CONTRATO,
+                        help="template DOCX")
+    parser.add_argument("--layout", choices=LAYOUTS, default=LAYOUT_SAIDA,
+                        help="organização da pasta de saída (padrão: CONTRATOS_LAYOUT ou plano)")
+
+    cep = parser.add_argument_group("endereços por CEP")
+    cep.add_argument("--enriquecer-cep", action="store_true",
+                     help="preenche logradouro/bairro/cidade/UF a partir dos CEPs antes de gerar")
+    cep.add_argument("--sobrescrever-endereco", action="store_true",
+                     help="substitui também os endereços já preenchidos")
+    cep.add_argument("--cep-url", default=VIACEP_URL,
+                     help="URL do serviço, com {cep} (padrão: ViaCEP)")
+    cep.add_argument("--cep-workers", type=int, default=4,
+                     help="consultas simultâneas (padrão: 4)")
+    cep.add_argument("--cep-por-segundo", type=float, default=5.0,
+                     help="máximo de consultas por segundo ao serviço (padrão: 5)")
+    cep.add_argument("--sem-cache-cep", action="store_true",
+                     help="ignora o cache e a base offline de CEPs")
+    args = parser.parse_args(argv)
+
+    if not args.template.exists():
+        print(f"Template não encontrado: {args.template}", file=sys.stderr)
+        return 2
+
+    try:
+        itens = ler_snapshots(args.origem)
+    except (OSError, ValueError, KeyError, csv.Error) as e:
+        print(f"Erro ao ler snapshots: {e}", file=sys.stderr)
+        return 2
+
+    total = len(itens)
+    if not total:
+        print("Nenhum snapshot encontrado.")
+        return 0
+
+    if args.enriquecer_cep:
+        _enriquecer(itens, args)
+
+    args.saida.mkdir(parents=True, exist_ok=True)
+    workers = max(1, min(args.workers, total))
+    print(f"Gerando {total} contrato(s) com {workers} processo(s)...", flush=True)
+
+    falhas = 0
+    # cada processo compila o template uma única vez, ao iniciar
+    with ProcessPoolExecutor(max_workers=workers, initializer=carregar_template,
+                             initargs=(args.template,)) as pool:
+        futuros = {
+            pool.submit(_gerar, snapshot, args.saida, args.template, args.layout): ident
+            for ident, snapshot in itens
+        }
+        for n, futuro in enumerate(as_completed(futuros), start=1):
+            ident = futuros[futuro]
+            try:
+                destino = futuro.result()
+            except Exception as e:
+                falhas += 1
+                print(f"[{n}/{total}] ERRO {ident}: {e}", flush=True)
+            else:
+                print(f"[{n}/{total}] {ident} -> {destino}", flush=True)
+
+    print(f"Concluído: {total - falhas} gerado(s), {falhas} com erro.")
+    return 1 if falhas else 0
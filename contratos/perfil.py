@@ -0,0 +1,102 @@
+"""
+Relatório do custo de importação dos módulos, para acompanhar o tempo de início.
+
+    python contracts.py perfil-importacao [MODULO ...] [--top N] [--orcamento MS]
+
+Cada módulo é importado num interpretador novo com 'python -X importtime'; o
+relatório lista os módulos mais caros (tempo acumulado, incluindo o que cada um
+importa) e verifica o núcleo sem interface contra ORCAMENTOS_MS.
+"""
+import argparse
+import subprocess
+import sys
+
+# orçamento de importação (ms, acumulado) dos pontos de entrada sem interface
+ORCAMENTOS_MS = {
+    "contracts": 30,
+    "contratos.contexto": 40,
+    "contratos.template_docx": 80,
+    "contratos.geracao": 120,
+}
+
+# módulos pesados que o núcleo só deve carregar no primeiro uso
+CARREGADOS_SOB_DEMANDA = ("docx", "requests", "num2words", "tkinter", "customtkinter")
+
+
+def medir_importacao(modulo: str) -> list:
+    """
+    Importa 'modulo' num interpretador novo e devolve [(módulo, próprio_us,
+    acumulado_us)] do que foi importado por causa dele (sem o que o próprio
+    interpretador carrega ao iniciar, como site), terminando pelo módulo.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        erro = proc.stderr.strip().splitlines()[-1:] or ["falha desconhecida"]
+        raise ImportError(f"{modulo}: {erro[0]}")
+
+    medidas = []
+    for linha in proc.stderr.splitlines():
+        if not linha.startswith("import time:"):
+            continue
+        proprio, acumulado, nome = linha[len("import time:"):].split("|")
+        if not proprio.strip().isdigit():
+            continue  # cabeçalho
+        # dependências aparecem antes de quem as importou, com mais recuo;
+        # um módulo sem recuo fecha uma importação de primeiro nível
+        if nome[1:2] != " ":
+            if nome.strip() == modulo:
+                medidas.append((nome.strip(), int(proprio), int(acumulado)))
+                return medidas
+            medidas = []
+        else:
+            medidas.append((nome.strip(), int(proprio), int(acumulado)))
+    return medidas
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="contracts.py perfil-importacao",
+        description="Mostra quanto custa importar cada módulo.",
+    )
+    parser.add_argument("modulos", nargs="*", default=list(ORCAMENTOS_MS),
+                        help="módulos a medir (padrão: pontos de entrada sem interface)")
+    parser.add_argument("--top", type=int, default=10,
+                        help="quantos módulos mais caros listar para cada um (padrão: 10)")
+    parser.add_argument("--orcamento", type=float, default=None,
+                        help="orçamento em ms para todos os módulos medidos (padrão: ORCAMENTOS_MS)")
+    args = parser.parse_args(argv)
+
+    if getattr(sys, "frozen", False):
+        print("O relatório precisa do interpretador Python; rode a partir do código-fonte.",
+              file=sys.stderr)
+        return 2
+
+    estourados = []
+    for modulo in args.modulos:
+        try:
+            medidas = medir_importacao(modulo)
+        except ImportError as e:
+            print(f"Erro ao importar {e}", file=sys.stderr)
+            estourados.append(modulo)
+            continue
+
+        total_ms = next((acc for nome, _, acc in medidas if nome == modulo), 0) / 1000
+        orcamento = args.orcamento if args.orcamento is not None else ORCAMENTOS_MS.get(modulo)
+        situacao = ""
+        if orcamento is not None:
+            situacao = f"  (orçamento {orcamento:.0f} ms: {'ok' if total_ms <= orcamento else 'ESTOUROU'})"
+            if total_ms > orcamento:
+                estourados.append(modulo)
+        print(f"{modulo}: {total_ms:.1f} ms{situacao}")
+
+        pesados = sorted({nome.split(".")[0] for nome, _, _ in medidas} & set(CARREGADOS_SOB_DEMANDA))
+        if pesados and modulo in ORCAMENTOS_MS:
+            print(f"  carregou na importação: {', '.join(pesados)}")
+
+        for nome, proprio, acumulado in sorted(medidas, key=lambda m: m[2], reverse=True)[1:args.top + 1]:
+            print(f"  {acumulado / 1000:8.1f} ms  {proprio / 1000:8.1f} ms  {nome}")
+
+    return 1 if estourados else 0
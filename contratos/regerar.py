@@ -0,0 +1,133 @@
+"""
+Regeração dos DOCX quando o template muda.
+
+    python contracts.py regerar [--template ARQUIVO] [--workers N] [--incluir-sem-template]
+
+O registro guarda o template (nome do arquivo e hash) com que cada contrato
+foi renderizado; só os contratos daquele template cujo hash difere do atual
+são regerados, em paralelo, a partir dos seus snapshots. Contratos de outros
+templates (ex.: 'batch --template recibo.docx') ficam como estão. Cada contrato concluído é marcado na
+hora, então uma execução interrompida continua de onde parou ao rodar de novo.
+A data do contrato é mantida (a da geração original).
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+import argparse
+import os
+import sqlite3
+import sys
+
+from .config import SAIDA_DIR, TEMPLATE_CONTRATO
+from .conteudo import CONTEUDO_DIR, gravar_documento, limpar_conteudo
+from .contexto import montar_contexto
+from .registro import RegistroContratos
+from .saida import registrar_no_manifesto
+from .snapshots import carregar_snapshot
+from .template_docx import carregar_template, nome_template
+
+
+def regerar_contrato(saida_dir: Path, contrato: dict, template: Path) -> tuple:
+    """
+    Renderiza de novo o DOCX de um contrato do registro, no mesmo caminho.
+    Devolve (hash do template usado, chave do conteúdo). Executado nos
+    processos do pool.
+    """
+    saida_dir = Path(saida_dir)
+    snapshot = carregar_snapshot(saida_dir / contrato["json"])
+    contexto = montar_contexto(
+        snapshot.get("values", {}),
+        snapshot.get("som", "Contratante"),
+        snapshot.get("alimentacao", "Não"),
+        data_contrato=datetime.fromtimestamp(contrato["gerado_em"]),
+    )
+    compilado = carregar_template(template)
+    chave = gravar_documento(saida_dir, compilado, contexto, saida_dir / contrato["docx"])
+    return compilado.hash, chave
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="contracts.py regerar",
+        description="Regera os contratos renderizados com uma versão anterior do template.",
+    )
+    parser.add_argument("--template", type=Path, default=TEMPLATE_CONTRATO,
+                        help="template DOCX")
+    parser.add_argument("-o", "--saida", type=Path, default=SAIDA_DIR,
+                        help="pasta de saída (padrão: contratos_gerados)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="número de processos (padrão: número de CPUs)")
+    parser.add_argument("--incluir-sem-template", action="store_true",
+                        help="regera também os contratos registrados sem o nome do template"
+                             " (gerados por versões anteriores)")
+    args = parser.parse_args(argv)
+
+    if not args.template.exists():
+        print(f"Template não encontrado: {args.template}", file=sys.stderr)
+        return 2
+
+    try:
+        registro = RegistroContratos.da_pasta(args.saida)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Erro ao abrir o registro: {e}", file=sys.stderr)
+        return 2
+
+    template_nome = nome_template(args.template)
+    template_hash = carregar_template(args.template).hash
+    pendentes = registro.desatualizados(template_nome, template_hash)
+    # registros antigos não dizem de qual template vieram: só com --incluir-sem-template
+    sem_template = registro.desatualizados("", template_hash)
+    if args.incluir_sem_template:
+        pendentes += sem_template
+    elif sem_template:
+        print(f"{len(sem_template)} contrato(s) sem template registrado ignorado(s);"
+              f" use --incluir-sem-template se forem de {template_nome}.")
+    total = len(pendentes)
+    if not total:
+        print(f"Todos os contratos de {template_nome} já usam a versão atual.")
+        registro.fechar()
+        return 0
+
+    workers = max(1, min(args.workers, total))
+    print(f"Regerando {total} contrato(s) com {workers} processo(s)...", flush=True)
+
+    falhas = 0
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=carregar_template,
+                               initargs=(args.template,))
+    try:
+        futuros = {
+            pool.submit(regerar_contrato, args.saida, contrato, args.template): contrato
+            for contrato in pendentes
+        }
+        for n, futuro in enumerate(as_completed(futuros), start=1):
+            contrato = futuros[futuro]
+            try:
+                usado, chave = futuro.result()
+            except Exception as e:
+                falhas += 1
+                print(f"[{n}/{total}] ERRO {contrato['docx']}: {e}", flush=True)
+                continue
+            # marcado na hora: se a execução for interrompida, ele não é refeito
+            registro.marcar_template(contrato["base"], contrato["versao"], usado, template_nome)
+            registrar_no_manifesto(args.saida, args.saida / contrato["docx"], contrato["versao"],
+                                   usado, template_nome, chave)
+            print(f"[{n}/{total}] {contrato['docx']}", flush=True)
+    except KeyboardInterrupt:
+        pool.shutdown(wait=True, cancel_futures=True)
+        print("Interrompido; rode de novo para continuar.", file=sys.stderr)
+        return 130
+    finally:
+        pool.shutdown(wait=True)
+        registro.fechar()
+
+    # os DOCX renderizados com a versão anterior do template ficaram sem uso
+    try:
+        apagados = limpar_conteudo(args.saida)
+    except OSError as e:
+        print(f"Aviso: limpeza de {CONTEUDO_DIR} falhou ({e}).", file=sys.stderr)
+    else:
+        if apagados:
+            print(f"{apagados} DOCX sem uso apagado(s) de {CONTEUDO_DIR}.")
+
+    print(f"Concluído: {total - falhas} regerado(s), {falhas} com erro.")
+    return 1 if falhas else 0
@@ -0,0 +1,342 @@
+"""
+Registro dos contratos gerados (SQLite), para buscas sem abrir cada JSON.
+
+Fica em <pasta de saída>/registro.sqlite3 e é atualizado a cada contrato
+gerado. Como os snapshots JSON continuam sendo a fonte da verdade, o
+registro pode ser apagado e reconstruído a qualquer momento:
+
+    python contracts.py registro reconstruir
+    python contracts.py registro buscar --atracao "Banda X" --de 01/03/2025 --ate 31/03/2025
+"""
+from pathlib import Path
+import argparse
+import re
+import sqlite3
+import sys
+import time
+
+from .config import SAIDA_DIR
+from .dinheiro import Dinheiro
+from .snapshots import carregar_snapshot
+
+REGISTRO = "registro.sqlite3"
+
+_DATA_BR_RE = re.compile(r"^\s*(\d{1,2})/(\d{1,2})/(\d{4})\s*$")
+_DATA_ISO_RE = re.compile(r"^\s*(\d{4})-(\d{2})-(\d{2})\s*$")
+_VERSAO_RE = re.compile(r"^(?P<base>.*)_v(?P<versao>\d+)$")
+
+_COLUNAS = (
+    "base", "versao", "docx", "json", "atracao", "data_evento", "evento_data",
+    "contratante_nome", "contratante_doc", "contratado_nome", "valor_centavos", "gerado_em",
+    "template_hash", "template_nome",
+)
+
+
+def _data_iso(texto: str):
+    """'dd/mm/aaaa' ou 'aaaa-mm-dd' -> 'aaaa-mm-dd' (ordenável); None se não for uma data."""
+    m = _DATA_BR_RE.match(texto or "")
+    if m:
+        return f"{m.group(3)}-{int(m.group(2)):02d}-{int(m.group(1)):02d}"
+    m = _DATA_ISO_RE.match(texto or "")
+    return m.group(0).strip() if m else None
+
+
+def _data_filtro(texto: str) -> str:
+    data = _data_iso(texto)
+    if data is None:
+        raise ValueError(f"Data inválida: {texto!r} (use dd/mm/aaaa)")
+    return data
+
+
+def _so_digitos(texto: str) -> str:
+    return "".join(c for c in (texto or "") if c.isdigit())
+
+
+def _centavos(valor):
+    if valor is None or isinstance(valor, int):
+        return valor
+    if isinstance(valor, Dinheiro):
+        return valor.centavos
+    dinheiro = Dinheiro.parse(str(valor))
+    return dinheiro.centavos if dinheiro else None
+
+
+def _centavos_filtro(valor) -> int:
+    centavos = _centavos(valor)
+    if centavos is None:
+        raise ValueError(f"Valor inválido: {valor!r} (use 2.000,00)")
+    return centavos
+
+
+class RegistroContratos:
+    """Índice dos contratos de uma pasta de saída; os caminhos são relativos a ela."""
+
+    def __init__(self, caminho: Path):
+        self.caminho = Path(caminho)
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        # vários processos do lote gravam ao mesmo tempo: WAL + espera pelo lock
+        self._conn = sqlite3.connect(str(self.caminho), timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS contrato (
+                    base TEXT NOT NULL,
+                    versao INTEGER NOT NULL,
+                    docx TEXT NOT NULL,
+                    json TEXT NOT NULL,
+                    atracao TEXT NOT NULL,
+                    atracao_busca TEXT NOT NULL,
+                    data_evento TEXT,
+                    evento_data TEXT NOT NULL,
+                    contratante_nome TEXT NOT NULL,
+                    contratante_doc TEXT NOT NULL,
+                    contratado_nome TEXT NOT NULL,
+                    valor_centavos INTEGER,
+                    gerado_em REAL NOT NULL,
+                    template_hash TEXT NOT NULL DEFAULT '',
+                    template_nome TEXT NOT NULL DEFAULT '',
+                    PRIMARY KEY (base, versao)
+                );
+                CREATE INDEX IF NOT EXISTS contrato_atracao ON contrato (atracao_busca, data_evento);
+                CREATE INDEX IF NOT EXISTS contrato_ordem ON contrato (data_evento, base, versao);
+                CREATE INDEX IF NOT EXISTS contrato_contratante ON contrato (contratante_doc);
+                CREATE INDEX IF NOT EXISTS contrato_valor ON contrato (valor_centavos);
+                """
+            )
+            colunas = {linha["name"] for linha in self._conn.execute("PRAGMA table_info(contrato)")}
+            if "template_hash" not in colunas:
+                # registros criados antes de guardar o hash do template
+                self._conn.execute(
+                    "ALTER TABLE contrato ADD COLUMN template_hash TEXT NOT NULL DEFAULT ''"
+                )
+            if "template_nome" not in colunas:
+                # sem o nome, não dá para saber de qual template veio o contrato
+                self._conn.execute(
+                    "ALTER TABLE contrato ADD COLUMN template_nome TEXT NOT NULL DEFAULT ''"
+                )
+
+    @classmethod
+    def da_pasta(cls, saida_dir: Path = SAIDA_DIR):
+        return cls(Path(saida_dir) / REGISTRO)
+
+    # ------------------------------------------------------------------
+    # Gravação
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _linha(snapshot: dict, docx_rel: Path, gerado_em: float, template_hash: str,
+               template_nome: str) -> tuple:
+        values = snapshot.get("values", {})
+        docx_rel = Path(docx_rel)
+        m = _VERSAO_RE.match(docx_rel.stem)
+        base = m.group("base") if m else docx_rel.stem
+        versao = int(m.group("versao")) if m else snapshot.get("versao", 0)
+        atracao = values.get("evento_atracao_musical", "").strip()
+        return (
+            base,
+            versao,
+            docx_rel.as_posix(),
+            docx_rel.with_suffix(".json").as_posix(),
+            atracao,
+            atracao.casefold(),
+            _data_iso(values.get("evento_data", "")),
+            values.get("evento_data", ""),
+            values.get("contratante_nome_razao", "").strip(),
+            _so_digitos(values.get("contratante_cpf_cnpj", "")),
+            values.get("contratado_nome_razao", "").strip(),
+            _centavos(values.get("pagamento_valor_total", "")),
+            gerado_em,
+            template_hash,
+            template_nome,
+        )
+
+    _INSERIR = (
+        "INSERT OR REPLACE INTO contrato (base, versao, docx, json, atracao, atracao_busca,"
+        " data_evento, evento_data, contratante_nome, contratante_doc, contratado_nome,"
+        " valor_centavos, gerado_em, template_hash, template_nome)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+
+    def registrar(self, snapshot: dict, docx_rel: Path, gerado_em: float | None = None,
+                  template_hash: str = "", template_nome: str = ""):
+        """
+        Inclui (ou atualiza) o contrato cujo DOCX está em 'docx_rel', renderizado
+        com o template 'template_nome' (ver nome_template) de hash 'template_hash'.
+        """
+        gerado_em = time.time() if gerado_em is None else gerado_em
+        linha = self._linha(snapshot, docx_rel, gerado_em, template_hash, template_nome)
+        with self._conn:
+            self._conn.execute(self._INSERIR, linha)
+
+    def mover(self, base: str, versao: int, docx_rel: Path):
+        """Atualiza o caminho de um contrato cujos arquivos mudaram de pasta."""
+        docx_rel = Path(docx_rel)
+        with self._conn:
+            self._conn.execute(
+                "UPDATE contrato SET docx = ?, json = ? WHERE base = ? AND versao = ?",
+                (docx_rel.as_posix(), docx_rel.with_suffix(".json").as_posix(), base, versao),
+            )
+
+    def marcar_template(self, base: str, versao: int, template_hash: str, template_nome: str):
+        """Registra que o DOCX do contrato foi (re)renderizado com outro template."""
+        with self._conn:
+            self._conn.execute(
+                "UPDATE contrato SET template_hash = ?, template_nome = ?"
+                " WHERE base = ? AND versao = ?",
+                (template_hash, template_nome, base, versao),
+            )
+
+    def reconstruir(self, saida_dir: Path) -> int:
+        """
+        Apaga o registro e o refaz a partir dos snapshots JSON da pasta (e
+        subpastas); o template (nome e hash) de cada contrato vem do manifesto.
+        """
+        from .saida import ler_manifesto
+
+        saida_dir = Path(saida_dir)
+        templates = {
+            (e["base"], e["versao"]): (e.get("template", ""), e.get("template_nome", ""))
+            for e in ler_manifesto(saida_dir)
+        }
+        linhas = []
+        for json_path in saida_dir.rglob("*_v*.json"):
+            if not _VERSAO_RE.match(json_path.stem):
+                continue
+            try:
+                snapshot = carregar_snapshot(json_path)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Ignorado ({e}): {json_path}", file=sys.stderr)
+                continue
+            docx_rel = json_path.relative_to(saida_dir).with_suffix(".docx")
+            m = _VERSAO_RE.match(docx_rel.stem)
+            template_hash, template_nome = templates.get(
+                (m.group("base"), int(m.group("versao"))), ("", "")
+            )
+            linhas.append(self._linha(snapshot, docx_rel, json_path.stat().st_mtime,
+                                      template_hash, template_nome))
+
+        with self._conn:
+            self._conn.execute("DELETE FROM contrato")
+            self._conn.executemany(self._INSERIR, linhas)
+        return len(linhas)
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _filtros(atracao=None, data_de=None, data_ate=None, contratante=None,
+                 valor_min=None, valor_max=None) -> tuple:
+        condicoes = []
+        parametros = []
+        if atracao:
+            # começo do nome, pelo índice: "banda" <= atracao_busca < "banda\U0010ffff"
+            prefixo = atracao.strip().casefold()
+            condicoes.append("atracao_busca >= ? AND atracao_busca < ?")
+            parametros += [prefixo, prefixo + "\U0010ffff"]
+        if data_de:
+            condicoes.append("data_evento >= ?")
+            parametros.append(_data_filtro(data_de))
+        if data_ate:
+            condicoes.append("data_evento <= ?")
+            parametros.append(_data_filtro(data_ate))
+        if contratante:
+            condicoes.append("contratante_doc = ?")
+            parametros.append(_so_digitos(contratante))
+        if valor_min is not None:
+            condicoes.append("valor_centavos >= ?")
+            parametros.append(_centavos_filtro(valor_min))
+        if valor_max is not None:
+            condicoes.append("valor_centavos <= ?")
+            parametros.append(_centavos_filtro(valor_max))
+        where = f" WHERE {' AND '.join(condicoes)}" if condicoes else ""
+        return where, parametros
+
+    def buscar(self, atracao: str | None = None, data_de: str | None = None,
+               data_ate: str | None = None, contratante: str | None = None,
+               valor_min=None, valor_max=None,
+               limite: int | None = None, deslocamento: int = 0) -> list:
+        """
+        Contratos que atendem a todos os filtros informados, por data do evento.
+        Atração pelo começo do nome, sem diferenciar maiúsculas; datas em
+        'dd/mm/aaaa' ou 'aaaa-mm-dd'; contratante pelo CPF/CNPJ (com ou sem
+        máscara); valores como texto ('2.000,00'), Dinheiro ou centavos. Datas e
+        valores inválidos levantam ValueError.
+        """
+        where, parametros = self._filtros(atracao, data_de, data_ate, contratante,
+                                          valor_min, valor_max)
+        sql = (f"SELECT {', '.join(_COLUNAS)} FROM contrato{where}"
+               " ORDER BY data_evento, base, versao")
+        if limite is not None:
+            sql += " LIMIT ? OFFSET ?"
+            parametros += [limite, deslocamento]
+        return [dict(linha) for linha in self._conn.execute(sql, parametros)]
+
+    def desatualizados(self, template_nome: str, template_hash: str) -> list:
+        """
+        Contratos do template 'template_nome' cujo DOCX não foi renderizado com a
+        versão 'template_hash' dele. Com template_nome="", os contratos gravados
+        antes de o registro guardar o nome (o template deles é desconhecido).
+        """
+        sql = (f"SELECT {', '.join(_COLUNAS)} FROM contrato"
+               " WHERE template_nome = ? AND template_hash != ? ORDER BY base, versao")
+        return [dict(linha) for linha in self._conn.execute(sql, (template_nome, template_hash))]
+
+    def contar(self, **filtros) -> int:
+        """Quantidade de contratos que atendem aos filtros (os mesmos de buscar)."""
+        where, parametros = self._filtros(**filtros)
+        (total,) = self._conn.execute(f"SELECT COUNT(*) FROM contrato{where}", parametros).fetchone()
+        return total
+
+    def fechar(self):
+        self._conn.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="contracts.py registro",
+        description="Registro (índice) dos contratos gerados.",
+    )
+    parser.add_argument("--saida", type=Path, default=SAIDA_DIR,
+                        help="pasta de saída (padrão: contratos_gerados)")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    sub.add_parser("reconstruir", help="refaz o registro a partir dos snapshots JSON")
+
+    buscar = sub.add_parser("buscar", help="lista os contratos que atendem aos filtros")
+    buscar.add_argument("--atracao", help="atrações que começam com este texto"
+                                           " (sem diferenciar maiúsculas)")
+    buscar.add_argument("--de", dest="data_de", help="data do evento a partir de (dd/mm/aaaa)")
+    buscar.add_argument("--ate", dest="data_ate", help="data do evento até (dd/mm/aaaa)")
+    buscar.add_argument("--contratante", help="CPF/CNPJ do contratante")
+    buscar.add_argument("--valor-min")
+    buscar.add_argument("--valor-max")
+    args = parser.parse_args(argv)
+
+    try:
+        registro = RegistroContratos.da_pasta(args.saida)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Erro ao abrir o registro: {e}", file=sys.stderr)
+        return 2
+
+    try:
+        if args.comando == "reconstruir":
+            total = registro.reconstruir(args.saida)
+            print(f"{total} contrato(s) registrado(s).")
+            return 0
+
+        try:
+            contratos = registro.buscar(
+                atracao=args.atracao, data_de=args.data_de, data_ate=args.data_ate,
+                contratante=args.contratante, valor_min=args.valor_min, valor_max=args.valor_max,
+            )
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 2
+        for c in contratos:
+            valor = Dinheiro(c["valor_centavos"]).formatado if c["valor_centavos"] is not None else "-"
+            print(f"{c['evento_data']:<10}  {c['atracao']:<30}  {valor:>16}  {c['docx']}")
+        print(f"{len(contratos)} contrato(s).")
+        return 0
+    finally:
+        registro.fechar()
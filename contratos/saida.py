@@ -0,0 +1,214 @@
+"""
+Organização da pasta de saída (contratos_gerados) e manifesto dos arquivos.
+
+Layouts:
+
+    plano     tudo na raiz da pasta (padrão, como sempre foi)
+    ano_mes   uma subpasta por ano/mês do evento, ex.: 2025/01/
+    atracao   uma subpasta por atração, ex.: Banda_X/
+
+O manifesto (manifesto.jsonl, uma linha por par gerado) registra onde cada
+contrato foi gravado, para que o app não precise listar a pasta inteira.
+Pastas planas antigas são migradas aos poucos com:
+
+    python contracts.py migrar-saida [--layout ano_mes] [--limite N]
+"""
+from pathlib import Path
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+
+from .config import LAYOUT_SAIDA, SAIDA_DIR
+from .registro import RegistroContratos
+
+LAYOUTS = ("plano", "ano_mes", "atracao")
+MANIFESTO = "manifesto.jsonl"
+
+# Contrato_<atracao>_<data>_vN.(json|docx), como gerado por nome_base_contrato
+_ARQUIVO_RE = re.compile(
+    r"^(?P<base>Contrato_(?P<atracao>.*)_(?P<data>[^_]*))_v(?P<versao>\d+)\.(?P<ext>json|docx)$"
+)
+_BASE_RE = re.compile(r"^Contrato_(?P<atracao>.*)_(?P<data>[^_]*)$")
+
+
+def subpasta(base_name: str, layout: str = LAYOUT_SAIDA) -> Path:
+    """Subpasta (relativa à pasta de saída) em que ficam os arquivos de 'base_name'."""
+    if layout == "plano":
+        return Path()
+    m = _BASE_RE.match(base_name)
+    atracao = m.group("atracao") if m else ""
+    data = m.group("data") if m else ""
+
+    if layout == "ano_mes":
+        if len(data) == 8 and data.isdigit():
+            return Path(data[:4]) / data[4:6]
+        return Path("sem_data")
+    if layout == "atracao":
+        # o nome da atração vira nome de pasta: sem separadores de caminho
+        pasta = re.sub(r'[\\/:*?"<>|]', "_", atracao).strip(". ")
+        return Path(pasta or "sem_atracao")
+    raise ValueError(f"Layout de saída desconhecido: {layout}")
+
+
+# ------------------------------------------------------------------
+# Manifesto
+# ------------------------------------------------------------------
+def registrar_no_manifesto(saida_dir: Path, docx_path: Path, versao: int,
+                           template_hash: str = "", template_nome: str = "",
+                           conteudo: str = ""):
+    """
+    Acrescenta uma linha ao manifesto (append atômico para linhas curtas).
+    'template_nome' e 'template_hash' identificam o template usado na
+    renderização (ver nome_template) e 'conteudo' é a chave do objeto de
+    .conteudo/ copiado para o DOCX; vazios quando só os arquivos mudaram de lugar.
+    """
+    saida_dir = Path(saida_dir)
+    docx_rel = Path(docx_path).relative_to(saida_dir)
+    entrada = {
+        "base": docx_rel.stem.rsplit("_v", 1)[0],
+        "versao": versao,
+        "docx": docx_rel.as_posix(),
+        "json": docx_rel.with_suffix(".json").as_posix(),
+    }
+    if template_hash:
+        entrada["template"] = template_hash
+    if template_nome:
+        entrada["template_nome"] = template_nome
+    if conteudo:
+        entrada["conteudo"] = conteudo
+    linha = (json.dumps(entrada, ensure_ascii=False) + "\n").encode("utf-8")
+    fd = os.open(saida_dir / MANIFESTO, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, linha)
+    finally:
+        os.close(fd)
+
+
+def ler_manifesto(saida_dir: Path = SAIDA_DIR) -> list:
+    """
+    Entradas do manifesto, da mais antiga para a mais recente. Quando um par
+    aparece mais de uma vez (ex.: foi migrado), vale a última linha; o hash do
+    template (nome e hash) e a chave do conteúdo são mantidos da última linha
+    que os informou.
+    """
+    entradas = {}
+    try:
+        with open(Path(saida_dir) / MANIFESTO, "r", encoding="utf-8") as f:
+            for linha in f:
+                if linha.strip():
+                    entrada = json.loads(linha)
+                    chave = (entrada["base"], entrada["versao"])
+                    anterior = entradas.pop(chave, None)
+                    for campo in ("template", "template_nome", "conteudo"):
+                        if anterior and campo in anterior:
+                            entrada.setdefault(campo, anterior[campo])
+                    entradas[chave] = entrada
+    except FileNotFoundError:
+        return []
+    return list(entradas.values())
+
+
+def ultima_pasta(saida_dir: Path = SAIDA_DIR) -> Path:
+    """Pasta do contrato gerado mais recentemente (lê só o fim do manifesto)."""
+    saida_dir = Path(saida_dir)
+    try:
+        with open(saida_dir / MANIFESTO, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 4096))
+            linhas = f.read().splitlines()
+    except OSError:
+        return saida_dir
+    for linha in reversed(linhas):
+        try:
+            pasta = saida_dir / Path(json.loads(linha)["docx"]).parent
+        except (ValueError, KeyError):
+            continue  # primeira linha cortada pelo seek
+        return pasta if pasta.is_dir() else saida_dir
+    return saida_dir
+
+
+# ------------------------------------------------------------------
+# Migração da pasta plana
+# ------------------------------------------------------------------
+def migrar_saida(saida_dir: Path = SAIDA_DIR, layout: str = LAYOUT_SAIDA,
+                 limite: int | None = None, parar: threading.Event | None = None) -> int:
+    """
+    Move pares _vN.json/_vN.docx da raiz da pasta para as subpastas do layout,
+    registrando cada um no manifesto e no registro. As versões de um mesmo contrato são
+    movidas juntas (os deltas dependem da versão anterior na mesma pasta): se
+    alguma delas já existir no destino, o contrato inteiro fica na raiz.
+    A raiz é listada uma única vez por chamada. Com 'limite', para depois de
+    mover cerca desse número de pares; com 'parar', para assim que o evento for
+    sinalizado. Nos dois casos, pode ser chamada de novo para continuar de onde
+    parou (nunca deixa um contrato pela metade). Devolve quantos pares foram movidos.
+    """
+    saida_dir = Path(saida_dir)
+    if layout == "plano" or not saida_dir.is_dir():
+        return 0
+
+    # nome base -> {versao: [extensões]}, só da raiz
+    grupos = {}
+    with os.scandir(saida_dir) as entradas:
+        for entrada in entradas:
+            m = _ARQUIVO_RE.match(entrada.name)
+            if m and entrada.is_file():
+                versoes = grupos.setdefault(m.group("base"), {})
+                versoes.setdefault(int(m.group("versao")), []).append(m.group("ext"))
+
+    try:
+        registro = RegistroContratos.da_pasta(saida_dir) if grupos else None
+    except sqlite3.Error:
+        registro = None  # sem registro: 'registro reconstruir' acerta os caminhos depois
+
+    movidos = 0
+    for base, versoes in grupos.items():
+        if limite is not None and movidos >= limite:
+            break
+        if parar is not None and parar.is_set():
+            break
+        destino_dir = saida_dir / subpasta(base, layout)
+        conflitos = [
+            f"{base}_v{versao}" for versao in sorted(versoes)
+            if any((destino_dir / f"{base}_v{versao}.{ext}").exists() for ext in ("json", "docx"))
+        ]
+        if conflitos:
+            # mover só parte das versões separaria os deltas da versão anterior
+            print(f"Já existe em {destino_dir}, contrato mantido na raiz: {', '.join(conflitos)}",
+                  file=sys.stderr)
+            continue
+        destino_dir.mkdir(parents=True, exist_ok=True)
+        for versao in sorted(versoes):
+            nome = f"{base}_v{versao}"
+            for ext in versoes[versao]:
+                os.replace(saida_dir / f"{nome}.{ext}", destino_dir / f"{nome}.{ext}")
+            registrar_no_manifesto(saida_dir, destino_dir / f"{nome}.docx", versao)
+            if registro is not None:
+                registro.mover(base, versao, (destino_dir / f"{nome}.docx").relative_to(saida_dir))
+            movidos += 1
+
+    if registro is not None:
+        registro.fechar()
+    return movidos
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="contracts.py migrar-saida",
+        description="Move os contratos da raiz da pasta de saída para as subpastas do layout.",
+    )
+    parser.add_argument("--saida", type=Path, default=SAIDA_DIR,
+                        help="pasta de saída (padrão: contratos_gerados)")
+    parser.add_argument("--layout", choices=LAYOUTS[1:],
+                        default=LAYOUT_SAIDA if LAYOUT_SAIDA != "plano" else "ano_mes",
+                        help="layout de destino (padrão: CONTRATOS_LAYOUT ou ano_mes)")
+    parser.add_argument("--limite", type=int, default=None,
+                        help="move no máximo N contratos nesta execução")
+    args = parser.parse_args(argv)
+
+    movidos = migrar_saida(args.saida, args.layout, args.limite)
+    print(f"{movidos} contrato(s) movido(s) para o layout '{args.layout}'.")
+    return 0
@@ -0,0 +1,152 @@
+"""
+Gravação e leitura dos snapshots _vN.json, com versões guardadas como delta.
+
+A v1 de um contrato (e uma versão a cada CHECKPOINT_A_CADA) é gravada
+completa, como sempre foi. As demais guardam só o que mudou em relação à
+versão anterior:
+
+    {"versao": 3, "delta_de": 2, "profundidade": 2,
+     "values": {"evento_data": "07/01/2025"}, "removidos": [], ...}
+
+Para ler qualquer versão, use carregar_snapshot: ela segue a cadeia até o
+último snapshot completo (no máximo CHECKPOINT_A_CADA - 1 deltas).
+
+    python contracts.py diff Contrato_X_v2.json Contrato_X_v5.json
+"""
+from pathlib import Path
+import argparse
+import json
+import re
+import sys
+
+# a cada N versões seguidas, uma é gravada completa
+CHECKPOINT_A_CADA = 10
+
+_VERSAO_RE = re.compile(r"^(?P<base>.*)_v(?P<versao>\d+)$")
+_CONTROLE = ("versao", "delta_de", "profundidade", "values", "removidos", "removidos_topo")
+_AUSENTE = object()
+
+
+def _caminho_versao(caminho: Path, versao: int) -> Path:
+    m = _VERSAO_RE.match(caminho.stem)
+    if not m:
+        raise ValueError(f"Nome de snapshot sem versão: {caminho.name}")
+    return caminho.with_name(f"{m.group('base')}_v{versao}{caminho.suffix}")
+
+
+def _ler(caminho: Path) -> tuple:
+    """Snapshot completo de 'caminho' e a profundidade do delta (0 = completo)."""
+    with open(caminho, "r", encoding="utf-8") as f:
+        dados = json.load(f)
+    if "delta_de" not in dados:
+        return dados, 0
+
+    anterior, _ = _ler(_caminho_versao(caminho, dados["delta_de"]))
+    return _aplicar_delta(anterior, dados), dados["profundidade"]
+
+
+def carregar_snapshot(caminho: Path) -> dict:
+    """Lê um _vN.json, completo ou delta, e devolve o snapshot completo."""
+    snapshot, _ = _ler(Path(caminho))
+    return snapshot
+
+
+# ------------------------------------------------------------------
+# Deltas
+# ------------------------------------------------------------------
+def _delta(antes: dict, depois: dict) -> dict:
+    values_antes = antes.get("values", {})
+    values_depois = depois.get("values", {})
+    delta = {
+        "values": {k: v for k, v in values_depois.items() if values_antes.get(k, _AUSENTE) != v},
+        "removidos": [k for k in values_antes if k not in values_depois],
+    }
+    removidos_topo = [k for k in antes if k not in depois and k not in _CONTROLE]
+    if removidos_topo:
+        delta["removidos_topo"] = removidos_topo
+    for chave, valor in depois.items():
+        if chave not in _CONTROLE and antes.get(chave, _AUSENTE) != valor:
+            delta[chave] = valor
+    return delta
+
+
+def _aplicar_delta(antes: dict, delta: dict) -> dict:
+    snapshot = {k: v for k, v in antes.items() if k not in delta.get("removidos_topo", ())}
+    values = dict(antes.get("values", {}))
+    for chave in delta.get("removidos", ()):
+        values.pop(chave, None)
+    values.update(delta.get("values", {}))
+    for chave, valor in delta.items():
+        if chave not in _CONTROLE:
+            snapshot[chave] = valor
+    snapshot["values"] = values
+    snapshot["versao"] = delta["versao"]
+    return snapshot
+
+
+def codificar_snapshot(snapshot: dict, json_path: Path) -> dict:
+    """
+    Conteúdo a gravar em 'json_path' (o _vN.json de snapshot["versao"]): um
+    delta sobre a versão anterior da mesma pasta, ou o snapshot completo se
+    for hora de um checkpoint, se a anterior não puder ser lida ou se o delta
+    não for menor.
+    """
+    versao = snapshot["versao"]
+    if versao <= 1:
+        return snapshot
+    try:
+        anterior, profundidade = _ler(_caminho_versao(Path(json_path), versao - 1))
+    except (OSError, ValueError, KeyError):
+        return snapshot  # anterior ausente, de outra pasta ou ainda sendo gravada
+    if profundidade + 1 >= CHECKPOINT_A_CADA:
+        return snapshot
+
+    delta = _delta(anterior, snapshot)
+    delta.update(versao=versao, delta_de=versao - 1, profundidade=profundidade + 1)
+    if len(json.dumps(delta, ensure_ascii=False)) >= len(json.dumps(snapshot, ensure_ascii=False)):
+        return snapshot
+    return delta
+
+
+# ------------------------------------------------------------------
+# Diferenças entre versões
+# ------------------------------------------------------------------
+def diferencas(antes: dict, depois: dict) -> dict:
+    """
+    Campos que mudaram entre dois snapshots completos: {campo: (antes, depois)},
+    com None para campos ausentes. 'versao' é ignorada.
+    """
+    resultado = {}
+    values_antes = antes.get("values", {})
+    values_depois = depois.get("values", {})
+    for chave in values_antes.keys() | values_depois.keys():
+        a, b = values_antes.get(chave), values_depois.get(chave)
+        if a != b:
+            resultado[chave] = (a, b)
+    for chave in (antes.keys() | depois.keys()) - {"values", "versao"}:
+        a, b = antes.get(chave), depois.get(chave)
+        if a != b:
+            resultado[chave] = (a, b)
+    return dict(sorted(resultado.items()))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="contracts.py diff",
+        description="Mostra os campos que mudaram entre duas versões de um contrato.",
+    )
+    parser.add_argument("antes", type=Path, help="_vN.json da versão anterior")
+    parser.add_argument("depois", type=Path, help="_vN.json da versão posterior")
+    args = parser.parse_args(argv)
+
+    try:
+        mudancas = diferencas(carregar_snapshot(args.antes), carregar_snapshot(args.depois))
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Erro ao ler snapshot: {e}", file=sys.stderr)
+        return 2
+
+    for campo, (a, b) in mudancas.items():
+        print(f"{campo}: {a!r} -> {b!r}")
+    if not mudancas:
+        print("Nenhuma diferença.")
+    return 0
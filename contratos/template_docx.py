@@ -0,0 +1,312 @@
+"""
+Motor de templates DOCX: placeholders {{CHAVE}} compilados uma vez por
+template e renderizados direto sobre o zip do pacote.
+"""
+from pathlib import Path
+from bisect import bisect_right
+from itertools import accumulate
+import copy
+import hashlib
+import io
+import json
+import re
+import struct
+import threading
+import zipfile
+import zlib
+
+from lxml import etree
+
+PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+NS_W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+NS = {"w": NS_W}
+W_P = f"{{{NS_W}}}p"
+W_T = f"{{{NS_W}}}t"
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+NS_CONTENT_TYPES = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+# partes do pacote com texto do documento (corpo, cabeçalhos, rodapés, notas)
+TIPOS_PARTES_TEXTO = (
+    ".document.main+xml",
+    ".document.macroEnabled.main+xml",
+    ".template.main+xml",
+    ".header+xml",
+    ".footer+xml",
+    ".footnotes+xml",
+    ".endnotes+xml",
+)
+
+
+class TemplateCompilado:
+    """
+    Template DOCX analisado uma única vez.
+
+    Na carga, os runs de cada parágrafo com placeholders são normalizados para
+    que cada {{CHAVE}} fique inteira dentro de um único nó de texto (o Word
+    costuma quebrar tokens como '{{EVENTO_' + 'DATA}}'). A renderização então
+    altera apenas esses nós, preservando negrito/itálico e demais formatações.
+
+    Todas as partes de texto entram no mesmo índice: corpo, cabeçalhos,
+    rodapés e notas, incluindo caixas de texto e tabelas aninhadas.
+
+    O template trabalha direto sobre o zip e o XML (sem objetos do python-docx):
+    cada renderização copia apenas as árvores das partes com placeholders, e a
+    gravação reaproveita byte a byte, sem recomprimir, todas as demais partes.
+    """
+
+    def __init__(self, dados: bytes, hash_arquivo: str = ""):
+        self.dados = dados
+        self.hash = hash_arquivo or hashlib.sha256(dados).hexdigest()
+        self.partes = {}       # nome da parte -> raiz XML (só partes com placeholders)
+        self.indices = {}      # nome da parte -> posições dos <w:t> com placeholders
+        self.ocorrencias = {}  # chave -> [(nome da parte, posição do <w:t>)]
+
+        with zipfile.ZipFile(io.BytesIO(dados)) as zf:
+            self.membros = zf.infolist()
+            for nome in _partes_de_texto(zf):
+                raiz = etree.fromstring(zf.read(nome))
+                self._indexar(nome, raiz)
+        self._brutos = {info.filename: _dados_brutos(dados, info) for info in self.membros}
+
+    def _indexar(self, nome: str, raiz):
+        nos = []
+        # uma única passada por todos os parágrafos da parte: iter() também
+        # desce em células de tabelas (aninhadas ou não) e caixas de texto
+        for p in raiz.iter(W_P):
+            nos.extend(_normalizar_runs(p))
+        if not nos:
+            return
+
+        alvo = set(nos)
+        indices = []
+        for i, t in enumerate(raiz.iter(W_T)):
+            if t in alvo:
+                indices.append(i)
+                for chave in PLACEHOLDER_RE.findall(t.text):
+                    self.ocorrencias.setdefault(chave, []).append((nome, i))
+        self.partes[nome] = raiz
+        self.indices[nome] = indices
+
+    @property
+    def chaves(self) -> set:
+        """Chaves referenciadas pelo template."""
+        return set(self.ocorrencias)
+
+    def valores(self, contexto) -> dict:
+        """
+        Textos das chaves usadas pelo template (as ausentes do contexto ficam de fora).
+        Só essas chaves são lidas, o que permite que contextos preguiçosos deixem
+        de calcular o resto.
+        """
+        return {chave: str(contexto[chave]) for chave in self.ocorrencias if chave in contexto}
+
+    def chave_conteudo(self, contexto) -> str:
+        """
+        sha256 que identifica o DOCX que este template geraria para o contexto:
+        hash do template mais os valores que ele usa. Mesma chave, mesmos bytes.
+        """
+        valores = json.dumps(self.valores(contexto), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(f"{self.hash}\0{valores}".encode("utf-8")).hexdigest()
+
+    def renderizar_xml(self, contexto) -> dict:
+        """
+        Devolve {nome da parte: XML} das partes com placeholders, já substituídos;
+        chaves ausentes do contexto ficam intactas.
+        """
+        valores = self.valores(contexto)
+
+        def trocar(m):
+            return valores.get(m.group(1), m.group(0))
+
+        renderizadas = {}
+        for nome, raiz in self.partes.items():
+            raiz = copy.deepcopy(raiz)
+            nos = list(raiz.iter(W_T))
+            for i in self.indices[nome]:
+                t = nos[i]
+                t.text = PLACEHOLDER_RE.sub(trocar, t.text)
+            renderizadas[nome] = etree.tostring(
+                raiz, xml_declaration=True, encoding="UTF-8", standalone=True
+            )
+        return renderizadas
+
+    def gerar_bytes(self, contexto) -> bytes:
+        """Monta o .docx final: só as partes com placeholders são regravadas."""
+        return _montar_zip(self.membros, self._brutos, self.renderizar_xml(contexto))
+
+    def salvar(self, contexto, caminho_saida: Path):
+        Path(caminho_saida).write_bytes(self.gerar_bytes(contexto))
+
+    def renderizar(self, contexto):
+        """
+        Devolve o documento renderizado como objeto do python-docx, para quem
+        precisar fazer edições estruturais antes de salvar.
+        """
+        from docx import Document  # só quem usa esta saída paga pela importação
+
+        return Document(io.BytesIO(self.gerar_bytes(contexto)))
+
+
+def _partes_de_texto(zf: zipfile.ZipFile) -> list:
+    """Lista as partes de texto declaradas no [Content_Types].xml do pacote."""
+    tipos = etree.fromstring(zf.read("[Content_Types].xml"))
+    nomes = []
+    for override in tipos.iter(f"{{{NS_CONTENT_TYPES}}}Override"):
+        if override.get("ContentType", "").endswith(TIPOS_PARTES_TEXTO):
+            nomes.append(override.get("PartName", "").lstrip("/"))
+    return nomes
+
+
+def _normalizar_runs(p_el) -> list:
+    """
+    Junta no primeiro nó de texto os pedaços de placeholders quebrados entre
+    runs e devolve os nós <w:t> do parágrafo que contêm placeholders.
+    """
+    nos = p_el.xpath(
+        "./w:r/w:t | ./w:hyperlink/w:r/w:t | ./w:ins/w:r/w:t | ./w:sdt/w:sdtContent/w:r/w:t",
+        namespaces=NS,
+    )
+    textos = [t.text or "" for t in nos]
+    completo = "".join(textos)
+
+    spans = [m.span() for m in PLACEHOLDER_RE.finditer(completo)]
+    if not spans:
+        return []
+
+    # o texto concatenado não muda ao mover caracteres entre nós, então os
+    # spans continuam válidos; só os limites de cada nó precisam ser refeitos
+    for inicio, fim in spans:
+        limites = list(accumulate(len(x) for x in textos))
+        i = bisect_right(limites, inicio)
+        j = bisect_right(limites, fim - 1)
+        if i == j:
+            continue
+        corte = fim - (limites[j] - len(textos[j]))
+        textos[i] = textos[i] + "".join(textos[i + 1:j]) + textos[j][:corte]
+        for k in range(i + 1, j):
+            textos[k] = ""
+        textos[j] = textos[j][corte:]
+
+    com_placeholder = []
+    for t, texto in zip(nos, textos):
+        if t.text != texto:
+            t.text = texto
+        if PLACEHOLDER_RE.search(texto):
+            # valores com espaços nas pontas não podem ser descartados pelo Word
+            t.set(XML_SPACE, "preserve")
+            com_placeholder.append(t)
+    return com_placeholder
+
+
+# ------------------------------------------------------------------
+# Escrita direta do pacote .docx (zip)
+# ------------------------------------------------------------------
+_ZIP_LOCAL = "<IHHHHHIIIHH"
+_ZIP_CENTRAL = "<IHHHHHHIIIHHHHHII"
+_ZIP_FIM = "<IHHHHIIH"
+
+
+def _dados_brutos(dados: bytes, info: zipfile.ZipInfo) -> bytes:
+    """Devolve os bytes ainda comprimidos de um membro do zip."""
+    cabecalho = struct.unpack_from(_ZIP_LOCAL, dados, info.header_offset)
+    inicio = info.header_offset + struct.calcsize(_ZIP_LOCAL) + cabecalho[9] + cabecalho[10]
+    return dados[inicio:inicio + info.compress_size]
+
+
+def _montar_zip(membros: list, brutos: dict, alteradas: dict) -> bytes:
+    """
+    Remonta o zip na ordem original: membros em 'alteradas' (nome -> conteúdo
+    descomprimido) são comprimidos de novo; os demais são copiados como estão.
+    """
+    saida = []
+    central = []
+    offset = 0
+
+    for info in membros:
+        nome = info.filename.encode("utf-8")
+        flags = info.flag_bits & ~0x08  # tamanhos vão no cabeçalho local
+        if not info.filename.isascii():
+            flags |= 0x800
+
+        conteudo = alteradas.get(info.filename)
+        if conteudo is None:
+            dados = brutos[info.filename]
+            metodo, crc, tam = info.compress_type, info.CRC, info.file_size
+        else:
+            comp = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+            dados = comp.compress(conteudo) + comp.flush()
+            metodo, crc, tam = zipfile.ZIP_DEFLATED, zlib.crc32(conteudo), len(conteudo)
+            flags &= ~0x06  # bits de nível de compressão do membro original
+
+        ano, mes, dia, hora, minuto, seg = info.date_time
+        data_dos = (ano - 1980) << 9 | mes << 5 | dia
+        hora_dos = hora << 11 | minuto << 5 | seg // 2
+        versao = max(info.extract_version, 20)
+
+        saida.append(struct.pack(
+            _ZIP_LOCAL, 0x04034B50, versao, flags, metodo, hora_dos, data_dos,
+            crc, len(dados), tam, len(nome), 0,
+        ))
+        saida.append(nome)
+        saida.append(dados)
+        central.append(struct.pack(
+            _ZIP_CENTRAL, 0x02014B50, info.create_version | info.create_system << 8,
+            versao, flags, metodo, hora_dos, data_dos, crc, len(dados), tam,
+            len(nome), 0, 0, 0, info.internal_attr, info.external_attr, offset,
+        ) + nome)
+        offset += struct.calcsize(_ZIP_LOCAL) + len(nome) + len(dados)
+
+    diretorio = b"".join(central)
+    saida.append(diretorio)
+    saida.append(struct.pack(
+        _ZIP_FIM, 0x06054B50, 0, 0, len(membros), len(membros), len(diretorio), offset, 0,
+    ))
+    return b"".join(saida)
+
+
+# caminho resolvido -> (mtime_ns, tamanho, hash, TemplateCompilado)
+_CACHE_TEMPLATES = {}
+# a interface aquece o cache numa thread enquanto o usuário preenche o formulário
+_LOCK_TEMPLATES = threading.Lock()
+
+
+def carregar_template(caminho_template: Path) -> TemplateCompilado:
+    """
+    Devolve o template compilado, reaproveitando a versão em memória enquanto o
+    arquivo não mudar (mesmo mtime/tamanho ou, se o mtime mudou, mesmo conteúdo).
+    Pode ser chamada de várias threads: o template é compilado uma vez só.
+    """
+    caminho = Path(caminho_template).resolve()
+    with _LOCK_TEMPLATES:
+        st = caminho.stat()
+
+        entrada = _CACHE_TEMPLATES.get(caminho)
+        if entrada and entrada[0] == st.st_mtime_ns and entrada[1] == st.st_size:
+            return entrada[3]
+
+        dados = caminho.read_bytes()
+        digest = hashlib.sha256(dados).hexdigest()
+        if entrada and entrada[2] == digest:
+            # arquivo apenas tocado/copiado: conteúdo idêntico
+            template = entrada[3]
+        else:
+            template = TemplateCompilado(dados, digest)
+
+        _CACHE_TEMPLATES[caminho] = (st.st_mtime_ns, st.st_size, digest, template)
+        return template
+
+
+def nome_template(caminho_template: Path) -> str:
+    """
+    Identidade do template no registro e no manifesto: o nome do arquivo. O
+    caminho não serve (muda de uma máquina para outra e, no executável, a
+    cada execução) e o hash muda justamente quando o template é editado.
+    """
+    return Path(caminho_template).name
+
+
+def preencher_template_docx(caminho_template: Path, caminho_saida: Path, contexto):
+    """Abre o template DOCX, troca placeholders {{CHAVE}} pelos valores e salva no caminho de saída."""
+    carregar_template(caminho_template).salvar(contexto, caminho_saida)
@@ -0,0 +1,69 @@
+"""Base de CEPs offline: construção a partir do CSV, consultas e arquivos truncados."""
+from pathlib import Path
+import tempfile
+import unittest
+
+from contratos.cep_offline import BaseCepOffline, construir_base_cep
+
+CSV = """cep;logradouro;bairro;cidade;uf
+01001-000;Praça da Sé;Sé;São Paulo;SP
+20040-020;Avenida Rio Branco;Centro;Rio de Janeiro;RJ
+70040010;Esplanada dos Ministérios;Zona Cívico-Administrativa;Brasília;DF
+inválido;Rua X;Bairro;Cidade;UF
+"""
+
+
+class BaseCepOfflineTest(unittest.TestCase):
+    def setUp(self):
+        pasta = tempfile.TemporaryDirectory()
+        self.addCleanup(pasta.cleanup)
+        self.pasta = Path(pasta.name)
+        origem = self.pasta / "ceps.csv"
+        origem.write_text(CSV, encoding="utf-8")
+        self.destino = self.pasta / "ceps.bin"
+        self.total = construir_base_cep(origem, self.destino)
+
+    def _abrir(self, caminho: Path) -> BaseCepOffline:
+        base = BaseCepOffline(caminho)
+        self.addCleanup(base.fechar)
+        return base
+
+    def test_cep_encontrado(self):
+        self.assertEqual(self.total, 3)
+        base = self._abrir(self.destino)
+        self.assertEqual(base.obter("20040020"), {
+            "logradouro": "Avenida Rio Branco", "bairro": "Centro",
+            "localidade": "Rio de Janeiro", "uf": "RJ", "cep": "20040-020",
+        })
+        for cep in ("01001000", "70040010"):  # primeiro e último registros
+            self.assertEqual(base.obter(cep)["cep"], f"{cep[:5]}-{cep[5:]}")
+
+    def test_cep_ausente(self):
+        base = self._abrir(self.destino)
+        for cep in ("00000000", "20040021", "99999999", "0100100", "abcdefgh", ""):
+            self.assertIsNone(base.obter(cep), cep)
+
+    def test_arquivo_truncado_ou_vazio(self):
+        dados = self.destino.read_bytes()
+        truncado = self.pasta / "truncado.bin"
+        # vazio, no meio do cabeçalho, no meio dos registros, no meio dos textos
+        for tamanho in (0, 5, 20, len(dados) - 1):
+            truncado.write_bytes(dados[:tamanho])
+            with self.assertRaises(ValueError, msg=tamanho):
+                BaseCepOffline(truncado)
+
+    def test_magico_errado(self):
+        arquivo = self.pasta / "outro.bin"
+        arquivo.write_bytes(b"XXXXXXXX" + self.destino.read_bytes()[8:])
+        with self.assertRaises(ValueError):
+            BaseCepOffline(arquivo)
+
+    def test_base_sem_ceps(self):
+        vazio = self.pasta / "vazio.csv"
+        vazio.write_text("cep;logradouro;bairro;cidade;uf\n", encoding="utf-8")
+        self.assertEqual(construir_base_cep(vazio, self.destino), 0)
+        self.assertIsNone(self._abrir(self.destino).obter("01001000"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Armazenamento por conteúdo: DOCX entregues como cópias independentes e limpeza dos objetos sem uso."""
+from pathlib import Path
+import os
+import tempfile
+import unittest
+
+from contratos.conteudo import caminho_objeto, gravar_documento, limpar_conteudo
+from contratos.saida import registrar_no_manifesto
+
+
+class _Template:
+    """O mínimo de TemplateCompilado usado por gravar_documento."""
+
+    def __init__(self):
+        self.renderizacoes = 0
+
+    def chave_conteudo(self, contexto) -> str:
+        return f"{contexto['n']:064x}"
+
+    def gerar_bytes(self, contexto) -> bytes:
+        self.renderizacoes += 1
+        return f"documento {contexto['n']}".encode()
+
+
+class ConteudoTest(unittest.TestCase):
+    def setUp(self):
+        pasta = tempfile.TemporaryDirectory()
+        self.addCleanup(pasta.cleanup)
+        self.saida = Path(pasta.name)
+        self.template = _Template()
+
+    def test_conteudo_igual_nao_renderiza_de_novo(self):
+        gravar_documento(self.saida, self.template, {"n": 1}, self.saida / "a_v1.docx")
+        gravar_documento(self.saida, self.template, {"n": 1}, self.saida / "a_v2.docx")
+
+        self.assertEqual(self.template.renderizacoes, 1)
+        self.assertEqual((self.saida / "a_v2.docx").read_bytes(), b"documento 1")
+        self.assertFalse(os.path.samefile(self.saida / "a_v1.docx", self.saida / "a_v2.docx"))
+
+    def test_docx_entregue_e_independente(self):
+        chave = gravar_documento(self.saida, self.template, {"n": 1}, self.saida / "a_v1.docx")
+        gravar_documento(self.saida, self.template, {"n": 1}, self.saida / "a_v2.docx")
+        # o usuário edita e salva no lugar (ex.: Word)
+        with open(self.saida / "a_v1.docx", "r+b") as f:
+            f.write(b"editado")
+
+        self.assertEqual((self.saida / "a_v2.docx").read_bytes(), b"documento 1")
+        self.assertEqual(caminho_objeto(self.saida, chave).read_bytes(), b"documento 1")
+        gravar_documento(self.saida, self.template, {"n": 1}, self.saida / "a_v3.docx")
+        self.assertEqual(self.template.renderizacoes, 1)
+
+    def test_objeto_editado_nao_e_reaproveitado(self):
+        chave = gravar_documento(self.saida, self.template, {"n": 1}, self.saida / "a_v1.docx")
+        objeto = caminho_objeto(self.saida, chave)
+        os.chmod(objeto, 0o644)
+        objeto.write_bytes(b"corrompido")
+
+        gravar_documento(self.saida, self.template, {"n": 1}, self.saida / "a_v2.docx")
+
+        self.assertEqual(self.template.renderizacoes, 2)
+        self.assertEqual((self.saida / "a_v2.docx").read_bytes(), b"documento 1")
+
+    @unittest.skipIf(os.name == "nt", "objetos somente leitura só fora do Windows")
+    def test_so_o_objeto_fica_somente_leitura(self):
+        chave = gravar_documento(self.saida, self.template, {"n": 1}, self.saida / "a_v1.docx")
+        self.assertEqual(caminho_objeto(self.saida, chave).stat().st_mode & 0o222, 0)
+        self.assertNotEqual((self.saida / "a_v1.docx").stat().st_mode & 0o200, 0)
+
+    def test_limpeza_apaga_so_objetos_sem_uso(self):
+        usado = gravar_documento(self.saida, self.template, {"n": 1}, self.saida / "a_v1.docx")
+        registrar_no_manifesto(self.saida, self.saida / "a_v1.docx", 1, conteudo=usado)
+        sem_uso = gravar_documento(self.saida, self.template, {"n": 2}, self.saida / "b_v1.docx")
+        recente = gravar_documento(self.saida, self.template, {"n": 3}, self.saida / "c_v1.docx")
+        for chave in (usado, sem_uso):
+            os.utime(caminho_objeto(self.saida, chave), (0, 0))
+
+        self.assertEqual(limpar_conteudo(self.saida), 1)
+
+        self.assertTrue(caminho_objeto(self.saida, usado).exists())
+        self.assertFalse(caminho_objeto(self.saida, sem_uso).exists())
+        self.assertFalse(caminho_objeto(self.saida, sem_uso).with_suffix(".sha256").exists())
+        self.assertTrue(caminho_objeto(self.saida, recente).exists())  # pode não estar no manifesto ainda
+        self.assertEqual((self.saida / "b_v1.docx").read_bytes(), b"documento 2")
+
+
+if __name__ == "__main__":
+    unittest.main()
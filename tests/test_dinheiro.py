@@ -0,0 +1,64 @@
+"""Valores em centavos inteiros: leitura do texto digitado, sinal percentual e extenso."""
+from decimal import Decimal
+import unittest
+
+from contratos.dinheiro import Dinheiro, valor_por_extenso
+
+
+class ParseTest(unittest.TestCase):
+    def test_formato_brasileiro(self):
+        for texto, centavos in (("1.234,56", 123456), ("R$ 1.234,56", 123456), ("2000", 200000),
+                                ("R$ 2.000,00", 200000), ("0,5", 50), (" 10,00 ", 1000)):
+            self.assertEqual(Dinheiro.parse(texto).centavos, centavos, texto)
+
+    def test_ponto_e_sempre_separador_de_milhar(self):
+        # como no formato antigo (float): '1234.5' não é lido como 1.234,50
+        self.assertEqual(Dinheiro.parse("1234.5").centavos, 1234500)
+
+    def test_fracao_de_centavo_arredondada(self):
+        self.assertEqual(Dinheiro.parse("0,005").centavos, 1)
+        self.assertEqual(Dinheiro.parse("0,004").centavos, 0)
+        # float daria 1.1499999...: com Decimal não há erro de representação
+        self.assertEqual(Dinheiro.parse("1,145").centavos, 115)
+
+    def test_vazio_ou_invalido(self):
+        for texto in ("", None, "R$", "abc", "1,2,3", "NaN", "Infinity", "12a"):
+            self.assertIsNone(Dinheiro.parse(texto), texto)
+            self.assertEqual(valor_por_extenso(texto), "")
+
+    def test_formatado(self):
+        self.assertEqual(Dinheiro(123456789).formatado, "R$ 1.234.567,89")
+        self.assertEqual(Dinheiro(5).numero, "0,05")
+        self.assertEqual(Dinheiro(-150).numero, "-1,50")
+
+
+class PercentualTest(unittest.TestCase):
+    def test_sinal_arredondado_ao_centavo(self):
+        total = Dinheiro.parse("1.000,01")
+        self.assertEqual(total.percentual(Decimal("30")).centavos, 30000)   # 300,003
+        self.assertEqual(total.percentual(Decimal("50")).centavos, 50001)   # 500,005: metade para cima
+        self.assertEqual(total.percentual(Decimal("33.3")).centavos, 33300)
+        self.assertEqual(Dinheiro(15).percentual(Decimal("10")).centavos, 2)
+        self.assertEqual(Dinheiro(-15).percentual(Decimal("10")).centavos, -2)
+
+    def test_sinal_e_restante_somam_o_total(self):
+        total = Dinheiro.parse("R$ 2.345,67")
+        sinal = total.percentual(Decimal("40"))
+        self.assertEqual(sinal.formatado, "R$ 938,27")
+        self.assertEqual(total.centavos - sinal.centavos, 140740)
+
+
+class ExtensoTest(unittest.TestCase):
+    def test_com_e_sem_centavos(self):
+        self.assertEqual(valor_por_extenso("2.000,00"), "dois mil reais")
+        self.assertEqual(valor_por_extenso("R$ 2.000,50"), "dois mil reais e cinquenta centavos")
+        self.assertEqual(valor_por_extenso("0,99"), "zero reais e noventa e nove centavos")
+        self.assertEqual(Dinheiro.parse("1.234,56").extenso,
+                         "mil, duzentos e trinta e quatro reais e cinquenta e seis centavos")
+
+    def test_negativo(self):
+        self.assertEqual(Dinheiro(-250).extenso, "menos dois reais e cinquenta centavos")
+
+
+if __name__ == "__main__":
+    unittest.main()
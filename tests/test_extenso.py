@@ -0,0 +1,67 @@
+"""Textos por extenso: tabela de horários e números memorizados."""
+import unittest
+
+from num2words import num2words
+
+from contratos.extenso import (
+    data_por_extenso, hora_por_extenso, numero_por_extenso, parse_hora_minuto,
+    reais_por_extenso, tabela_horarios,
+)
+
+
+def _hora_direta(hora: int, minuto: int) -> str:
+    """Horário por extenso calculado a cada chamada, como antes da tabela."""
+    base = {1: "uma hora", 2: "duas horas"}.get(hora, f"{num2words(hora, lang='pt_BR')} horas")
+    if minuto == 0:
+        return base
+    return f"{base} e {num2words(minuto, lang='pt_BR')} {'minuto' if minuto == 1 else 'minutos'}"
+
+
+class HorariosTest(unittest.TestCase):
+    def test_tabela_completa(self):
+        tabela = tabela_horarios()
+        self.assertEqual(len(tabela), 1440)
+        self.assertIs(tabela_horarios(), tabela)  # montada uma vez só
+
+    def test_tabela_igual_ao_calculo_direto(self):
+        amostra = [(h, m) for h in range(24) for m in (0, 1, 2, 15, 21, 30, 59)]
+        amostra += [(h, m) for h in (0, 12, 23) for m in range(60)]
+        for hora, minuto in amostra:
+            self.assertEqual(hora_por_extenso(hora, minuto), _hora_direta(hora, minuto),
+                             f"{hora}:{minuto:02d}")
+
+    def test_exemplos(self):
+        self.assertEqual(hora_por_extenso(18, 0), "dezoito horas")
+        self.assertEqual(hora_por_extenso(18, 30), "dezoito horas e trinta minutos")
+        self.assertEqual(hora_por_extenso(1, 1), "uma hora e um minuto")
+
+    def test_fora_do_intervalo(self):
+        for hora, minuto in ((-1, 0), (24, 0), (12, 60), (12, -1)):
+            self.assertEqual(hora_por_extenso(hora, minuto), "")
+
+    def test_parse_hora_minuto(self):
+        self.assertEqual(parse_hora_minuto(" 9:05 "), (9, 5))
+        for texto in ("", "24:00", "12:60", "12h30", "1230"):
+            self.assertIsNone(parse_hora_minuto(texto), texto)
+
+
+class NumerosTest(unittest.TestCase):
+    def test_numero_memorizado(self):
+        self.assertEqual(numero_por_extenso(1234), num2words(1234, lang="pt_BR"))
+        antes = numero_por_extenso.cache_info().hits
+        numero_por_extenso(1234)
+        self.assertEqual(numero_por_extenso.cache_info().hits, antes + 1)
+
+    def test_reais_com_e_sem_centavos(self):
+        self.assertEqual(reais_por_extenso(2000, 0), "dois mil reais")
+        self.assertEqual(reais_por_extenso(2000, 50), "dois mil reais e cinquenta centavos")
+        self.assertEqual(reais_por_extenso(0, 99), "zero reais e noventa e nove centavos")
+
+    def test_data_por_extenso(self):
+        self.assertEqual(data_por_extenso("6/1/2025"), "06 de Janeiro de 2025")
+        self.assertEqual(data_por_extenso("06/13/2025"), "06/13/2025")
+        self.assertEqual(data_por_extenso("amanhã"), "amanhã")
+
+
+if __name__ == "__main__":
+    unittest.main()
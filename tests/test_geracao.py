@@ -0,0 +1,71 @@
+"""Geração de contratos: reserva de versões e limpeza quando a geração falha."""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+import tempfile
+import unittest
+
+from contratos.geracao import gerar_arquivos_contrato, reservar_versao
+
+BASE = "Contrato_Banda_X_20250106"
+SNAPSHOT = {"values": {"evento_atracao_musical": "Banda X", "evento_data": "06/01/2025"},
+            "som": "Contratante", "alimentacao": "Não"}
+
+
+class ReservarVersaoTest(unittest.TestCase):
+    def setUp(self):
+        pasta = tempfile.TemporaryDirectory()
+        self.addCleanup(pasta.cleanup)
+        self.saida = Path(pasta.name)
+
+    def _reservar(self, pasta: Path, legado: Path | None = None) -> int:
+        versao, f = reservar_versao(pasta, BASE, legado=legado)
+        f.close()
+        return versao
+
+    def test_reservas_simultaneas_nao_repetem_versao(self):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            versoes = list(pool.map(lambda _: self._reservar(self.saida), range(40)))
+
+        self.assertEqual(sorted(versoes), list(range(1, 41)))
+        self.assertEqual(len(list(self.saida.glob(f"{BASE}_v*.json"))), 40)
+
+    def test_contador_ausente_ou_atrasado(self):
+        for _ in range(3):
+            self._reservar(self.saida)
+        (self.saida / ".versoes" / f"{BASE}.txt").write_text("2", encoding="ascii")
+        self.assertEqual(self._reservar(self.saida), 4)
+        (self.saida / ".versoes" / f"{BASE}.txt").unlink()
+        self.assertEqual(self._reservar(self.saida), 5)
+
+    def test_versoes_antigas_ocupam_o_numero(self):
+        # DOCX sem JSON, na mesma pasta, e pares ainda na raiz não migrada
+        subpasta = self.saida / "2025" / "01"
+        subpasta.mkdir(parents=True)
+        (subpasta / f"{BASE}_v1.docx").write_bytes(b"")
+        (self.saida / f"{BASE}_v2.json").write_text("{}", encoding="utf-8")
+        (self.saida / f"{BASE}_v3.docx").write_bytes(b"")
+
+        self.assertEqual(self._reservar(subpasta, legado=self.saida), 4)
+        self.assertEqual(self._reservar(self.saida), 1)  # sem legado, só a própria pasta conta
+
+
+class GerarArquivosTest(unittest.TestCase):
+    def setUp(self):
+        pasta = tempfile.TemporaryDirectory()
+        self.addCleanup(pasta.cleanup)
+        self.saida = Path(pasta.name)
+
+    def test_falha_na_renderizacao_desfaz_a_reserva(self):
+        with mock.patch("contratos.geracao.gravar_documento", side_effect=OSError("disco cheio")):
+            with self.assertRaises(OSError):
+                gerar_arquivos_contrato(SNAPSHOT, self.saida, layout="plano")
+
+        self.assertEqual(list(self.saida.glob(f"{BASE}_v*")), [])
+
+        docx = gerar_arquivos_contrato(SNAPSHOT, self.saida, layout="plano")
+        self.assertTrue(docx.exists() and docx.with_suffix(".json").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
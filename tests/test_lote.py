@@ -0,0 +1,114 @@
+"""Importação em lote: leitura de CSV e enriquecimento por CEP contra um servidor local."""
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import json
+import tempfile
+import threading
+import unittest
+
+from contratos import lote
+from contratos.cep import ClienteCep
+from contratos.enriquecimento import enriquecer_snapshots
+from contratos.snapshots import carregar_snapshot
+
+ENDERECOS = {
+    "01001000": {"cep": "01001-000", "logradouro": "Praça da Sé", "bairro": "Sé",
+                 "localidade": "São Paulo", "uf": "SP"},
+    "20040020": {"cep": "20040-020", "logradouro": "Praça Pio X", "bairro": "Centro",
+                 "localidade": "Rio de Janeiro", "uf": "RJ"},
+}
+
+
+class _ViaCepLocal(BaseHTTPRequestHandler):
+    """Responde como o ViaCEP em /ws/<cep>/json/; CEPs desconhecidos dão {"erro": true}."""
+    consultas = Counter()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cep = self.path.strip("/").split("/")[1]
+        with self.lock:
+            self.consultas[cep] += 1
+        corpo = json.dumps(ENDERECOS.get(cep, {"erro": True})).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, *args):
+        pass
+
+
+class EnriquecimentoCepTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.servidor = ThreadingHTTPServer(("127.0.0.1", 0), _ViaCepLocal)
+        threading.Thread(target=cls.servidor.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.servidor.server_port}/ws/{{cep}}/json/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.servidor.shutdown()
+        cls.servidor.server_close()
+
+    def setUp(self):
+        _ViaCepLocal.consultas.clear()
+        pasta = tempfile.TemporaryDirectory()
+        self.addCleanup(pasta.cleanup)
+        self.tmp = Path(pasta.name)
+
+    def _csv(self, texto: str) -> Path:
+        caminho = self.tmp / "planilha.csv"
+        caminho.write_text(texto, encoding="utf-8")
+        return caminho
+
+    def test_csv_de_uma_coluna(self):
+        caminho = self._csv("evento_atracao_musical\nBanda X\nBanda Y\n")
+        itens = lote.ler_snapshots(caminho)
+        self.assertEqual([s["values"] for _, s in itens],
+                         [{"evento_atracao_musical": "Banda X"}, {"evento_atracao_musical": "Banda Y"}])
+
+    def test_cada_cep_consultado_uma_vez(self):
+        snapshots = [
+            {"values": {"contratante_endereco_cep": "01001-000", "evento_local_cep": "20040020"}},
+            {"values": {"contratante_endereco_cep": "01001000", "contratado_endereco_cep": "99999-999"}},
+            {"values": {"evento_local_cep": "20040-020", "contratado_endereco_cep": "99999999"}},
+        ]
+        cliente = ClienteCep(url=self.url, max_workers=4)
+        try:
+            resumo = enriquecer_snapshots(snapshots, cliente)
+        finally:
+            cliente.fechar()
+
+        self.assertEqual(_ViaCepLocal.consultas, Counter({"01001000": 1, "20040020": 1, "99999999": 1}))
+        self.assertEqual(resumo["ceps"], 3)
+        self.assertEqual(resumo["nao_encontrados"], ["99999999"])
+        self.assertEqual(resumo["falhas"], {})
+        self.assertEqual(snapshots[0]["values"]["contratante_endereco_logradouro"], "Praça da Sé")
+        self.assertEqual(snapshots[2]["values"]["evento_local_cidade"], "Rio de Janeiro")
+        # CEP inexistente não preenche nada
+        self.assertNotIn("contratado_endereco_logradouro", snapshots[1]["values"])
+
+    def test_batch_com_cep_url(self):
+        caminho = self._csv(
+            "evento_atracao_musical;evento_data;contratante_endereco_cep\n"
+            "Banda X;06/01/2025;01001-000\n"
+            "Banda Y;07/01/2025;01001000\n"
+            "Banda Z;08/01/2025;99999-999\n"
+        )
+        saida = self.tmp / "saida"
+        rc = lote.main([str(caminho), "--workers", "1", "--saida", str(saida), "--layout", "plano",
+                        "--enriquecer-cep", "--cep-url", self.url, "--sem-cache-cep",
+                        "--cep-por-segundo", "1000"])
+
+        self.assertEqual(rc, 0)
+        self.assertEqual(_ViaCepLocal.consultas, Counter({"01001000": 1, "99999999": 1}))
+        x = carregar_snapshot(saida / "Contrato_Banda_X_20250106_v1.json")["values"]
+        z = carregar_snapshot(saida / "Contrato_Banda_Z_20250108_v1.json")["values"]
+        self.assertEqual(x["contratante_endereco_cidade"], "São Paulo")
+        self.assertNotIn("contratante_endereco_cidade", z)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Registro de contratos: template de cada contrato e filtros de busca."""
+from pathlib import Path
+import json
+import tempfile
+import unittest
+
+from contratos.registro import RegistroContratos
+from contratos.saida import registrar_no_manifesto
+from contratos.snapshots import codificar_snapshot
+
+
+def _snapshot(atracao: str, valor: str = "") -> dict:
+    return {"values": {"evento_atracao_musical": atracao, "pagamento_valor_total": valor},
+            "som": "Contratante", "alimentacao": "Não"}
+
+
+class RegistroTemplateTest(unittest.TestCase):
+    def setUp(self):
+        pasta = tempfile.TemporaryDirectory()
+        self.addCleanup(pasta.cleanup)
+        self.saida = Path(pasta.name)
+        self.registro = RegistroContratos.da_pasta(self.saida)
+        self.addCleanup(self.registro.fechar)
+
+    def test_desatualizados_so_do_mesmo_template(self):
+        self.registro.registrar(_snapshot("A"), Path("a_v1.docx"),
+                                template_hash="h1", template_nome="contrato.docx")
+        self.registro.registrar(_snapshot("B"), Path("b_v1.docx"),
+                                template_hash="r1", template_nome="recibo.docx")
+        self.registro.registrar(_snapshot("C"), Path("c_v1.docx"), template_hash="h0")
+
+        pendentes = self.registro.desatualizados("contrato.docx", "h2")
+        self.assertEqual([c["base"] for c in pendentes], ["a"])
+        self.assertEqual(self.registro.desatualizados("recibo.docx", "r1"), [])
+        self.assertEqual([c["base"] for c in self.registro.desatualizados("", "h2")], ["c"])
+
+        self.registro.marcar_template("a", 1, "h2", "contrato.docx")
+        self.assertEqual(self.registro.desatualizados("contrato.docx", "h2"), [])
+
+    def test_reconstruir_le_o_template_do_manifesto(self):
+        for nome, template in (("a", "contrato.docx"), ("b", "recibo.docx")):
+            docx = self.saida / f"{nome}_v1.docx"
+            json_path = docx.with_suffix(".json")
+            snapshot = dict(_snapshot(nome.upper()), versao=1)
+            json_path.write_text(json.dumps(codificar_snapshot(snapshot, json_path)), "utf-8")
+            registrar_no_manifesto(self.saida, docx, 1, f"hash-{nome}", template)
+        # linha de migração (sem template) não apaga o que já se sabia
+        registrar_no_manifesto(self.saida, self.saida / "a_v1.docx", 1)
+
+        self.assertEqual(self.registro.reconstruir(self.saida), 2)
+        pendentes = self.registro.desatualizados("recibo.docx", "outro")
+        self.assertEqual([(c["base"], c["template_hash"]) for c in pendentes], [("b", "hash-b")])
+        self.assertEqual(len(self.registro.desatualizados("contrato.docx", "outro")), 1)
+
+
+class RegistroBuscaTest(unittest.TestCase):
+    def setUp(self):
+        pasta = tempfile.TemporaryDirectory()
+        self.addCleanup(pasta.cleanup)
+        self.registro = RegistroContratos.da_pasta(Path(pasta.name))
+        self.addCleanup(self.registro.fechar)
+        for nome, atracao, valor in (("a", "Banda X", "R$ 1.500,00"), ("b", "Banda Xis", "2.000,00"),
+                                     ("c", "Orquestra", "R$ 900,00")):
+            self.registro.registrar(_snapshot(atracao, valor), Path(f"{nome}_v1.docx"))
+
+    def _bases(self, **filtros) -> list:
+        return sorted(c["base"] for c in self.registro.buscar(**filtros))
+
+    def test_atracao_pelo_comeco_sem_maiusculas(self):
+        self.assertEqual(self._bases(atracao="banda x"), ["a", "b"])
+        self.assertEqual(self._bases(atracao=" BANDA XIS "), ["b"])
+        self.assertEqual(self._bases(atracao="X"), [])
+
+    def test_filtro_de_valor(self):
+        self.assertEqual(self._bases(valor_min="1.500,00"), ["a", "b"])
+        self.assertEqual(self._bases(valor_max=150000), ["a", "c"])
+
+    def test_valor_invalido_levanta_erro(self):
+        for filtro in ("valor_min", "valor_max"):
+            with self.assertRaises(ValueError):
+                self.registro.buscar(**{filtro: "dois mil"})
+            with self.assertRaises(ValueError):
+                self.registro.contar(**{filtro: "dois mil"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Migração da pasta plana para o layout: contratos com deltas não são separados."""
+from pathlib import Path
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+
+from contratos.saida import migrar_saida
+from contratos.snapshots import carregar_snapshot, codificar_snapshot
+
+
+def _snapshot(atracao: str, versao: int) -> dict:
+    return {"values": {"evento_atracao_musical": atracao, "evento_data": "06/01/2025",
+                       "pagamento_valor_total": f"R$ {versao}.000,00"},
+            "som": "Contratante", "alimentacao": "Não", "versao": versao}
+
+
+class MigrarSaidaTest(unittest.TestCase):
+    def setUp(self):
+        pasta = tempfile.TemporaryDirectory()
+        self.addCleanup(pasta.cleanup)
+        self.saida = Path(pasta.name)
+
+    def _gravar(self, pasta: Path, atracao: str, versao: int) -> Path:
+        pasta.mkdir(parents=True, exist_ok=True)
+        caminho = pasta / f"Contrato_{atracao}_20250106_v{versao}.json"
+        conteudo = codificar_snapshot(_snapshot(atracao, versao), caminho)
+        caminho.write_text(json.dumps(conteudo, ensure_ascii=False), encoding="utf-8")
+        caminho.with_suffix(".docx").write_bytes(b"docx")
+        return caminho
+
+    def test_conflito_mantem_o_contrato_inteiro_na_raiz(self):
+        cadeia = [self._gravar(self.saida, "Banda_X", v) for v in (1, 2, 3)]
+        outro = [self._gravar(self.saida, "Banda_Y", v) for v in (1, 2)]
+        # a v2 da Banda X já foi gerada na subpasta (ex.: por outra máquina)
+        self._gravar(self.saida / "2025" / "01", "Banda_X", 2)
+
+        with contextlib.redirect_stderr(io.StringIO()) as erros:
+            movidos = migrar_saida(self.saida, "ano_mes")
+
+        self.assertEqual(movidos, 2)
+        self.assertIn("Contrato_Banda_X_20250106_v2", erros.getvalue())
+        for versao, caminho in enumerate(cadeia, start=1):
+            self.assertTrue(caminho.exists())
+            self.assertEqual(carregar_snapshot(caminho), _snapshot("Banda_X", versao))
+        self.assertFalse((self.saida / "2025" / "01" / cadeia[2].name).exists())
+        for versao, caminho in enumerate(outro, start=1):
+            movido = self.saida / "2025" / "01" / caminho.name
+            self.assertFalse(caminho.exists())
+            self.assertEqual(carregar_snapshot(movido), _snapshot("Banda_Y", versao))
+
+
+if __name__ == "__main__":
+    unittest.main()
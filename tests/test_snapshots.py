@@ -0,0 +1,68 @@
+"""Snapshots _vN.json gravados como delta: ida e volta, checkpoints e falta da versão anterior."""
+from pathlib import Path
+import json
+import shutil
+import tempfile
+import unittest
+
+from contratos.snapshots import CHECKPOINT_A_CADA, carregar_snapshot, codificar_snapshot
+
+
+def _snapshot(versao: int) -> dict:
+    values = {"evento_atracao_musical": "Banda X", "evento_data": "06/01/2025",
+              "pagamento_valor_total": f"R$ {versao}.000,00"}
+    if versao % 3 == 0:
+        values["evento_nome"] = f"Festa {versao}"  # aparece e some entre versões
+    return {"values": values, "som": "Banda" if versao % 2 else "Contratante",
+            "alimentacao": "Sim", "versao": versao}
+
+
+class SnapshotsTest(unittest.TestCase):
+    def setUp(self):
+        pasta = tempfile.TemporaryDirectory()
+        self.addCleanup(pasta.cleanup)
+        self.pasta = Path(pasta.name)
+
+    def _caminho(self, versao: int) -> Path:
+        return self.pasta / f"Contrato_Banda_X_20250106_v{versao}.json"
+
+    def _gravar(self, versao: int) -> dict:
+        caminho = self._caminho(versao)
+        conteudo = codificar_snapshot(_snapshot(versao), caminho)
+        caminho.write_text(json.dumps(conteudo, ensure_ascii=False), encoding="utf-8")
+        return conteudo
+
+    def test_ida_e_volta_com_checkpoints(self):
+        total = 2 * CHECKPOINT_A_CADA + 3
+        gravados = {v: self._gravar(v) for v in range(1, total + 1)}
+
+        for versao in range(1, total + 1):
+            self.assertEqual(carregar_snapshot(self._caminho(versao)), _snapshot(versao))
+
+        completos = [v for v, c in gravados.items() if "delta_de" not in c]
+        self.assertEqual(completos, [1, CHECKPOINT_A_CADA + 1, 2 * CHECKPOINT_A_CADA + 1])
+        self.assertTrue(all(c.get("profundidade", 0) < CHECKPOINT_A_CADA for c in gravados.values()))
+
+    def test_anterior_ausente_grava_completo(self):
+        self._gravar(1)
+        self._gravar(2)
+        self._caminho(2).unlink()
+
+        conteudo = self._gravar(3)
+
+        self.assertNotIn("delta_de", conteudo)
+        self.assertEqual(carregar_snapshot(self._caminho(3)), _snapshot(3))
+
+    def test_delta_fora_da_pasta(self):
+        self._gravar(1)
+        self.assertIn("delta_de", self._gravar(2))
+
+        outra = self.pasta / "copia"
+        outra.mkdir()
+        shutil.copy(self._caminho(2), outra)
+        with self.assertRaises(OSError):
+            carregar_snapshot(outra / self._caminho(2).name)
+
+
+if __name__ == "__main__":
+    unittest.main()
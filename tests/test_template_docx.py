@@ -0,0 +1,157 @@
+"""Motor de templates DOCX: placeholders quebrados entre runs e remontagem direta do zip."""
+import io
+import unittest
+import zipfile
+
+from docx import Document
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+from contratos.template_docx import TemplateCompilado, _dados_brutos
+
+CONTEXTO = {
+    "NOME": "Banda X", "LINK": "site", "INSERIDO": "sim", "CONTROLE": "valor",
+    "CABECALHO": "topo", "RODAPE": "pé", "INTERNO": "célula", "VALOR": " R$ 10,00 ",
+}
+
+
+def _run(texto: str, negrito: bool = False):
+    r = OxmlElement("w:r")
+    if negrito:
+        propriedades = OxmlElement("w:rPr")
+        propriedades.append(OxmlElement("w:b"))
+        r.append(propriedades)
+    t = OxmlElement("w:t")
+    t.text = texto
+    r.append(t)
+    return r
+
+
+def _paragrafo(container, *pedacos):
+    """Parágrafo com um run por pedaço; um pedaço (tag, [textos]) vira um elemento com runs dentro."""
+    p = container.add_paragraph()
+    for pedaco in pedacos:
+        if isinstance(pedaco, str):
+            p._p.append(_run(pedaco))
+            continue
+        tag, textos = pedaco
+        el = OxmlElement(tag)
+        if tag == "w:ins":
+            el.set(qn("w:id"), "1")
+            el.set(qn("w:author"), "Revisor")
+        destino = el
+        if tag == "w:sdt":
+            destino = OxmlElement("w:sdtContent")
+            el.append(destino)
+        for texto in textos:
+            destino.append(_run(texto))
+        p._p.append(el)
+    return p
+
+
+def _template_de_teste() -> bytes:
+    doc = Document()
+    p = doc.add_paragraph()
+    p._p.append(_run("Contratado: {{NO", negrito=True))
+    p._p.append(_run("ME}}."))
+    _paragrafo(doc, ("w:hyperlink", ["{{LI", "NK"]), "}} fim")
+    _paragrafo(doc, "antes {{INSE", ("w:ins", ["RIDO}}"]))
+    _paragrafo(doc, ("w:sdt", ["{{CONT", "ROLE}}"]))
+    _paragrafo(doc, "{{DESCO", "NHECIDA}} e {{VALOR}}")
+
+    secao = doc.sections[0]
+    _paragrafo(secao.header, "{{CABE", "CALHO}}")
+    _paragrafo(secao.footer, "{{", "RODAPE", "}}")
+
+    externa = doc.add_table(rows=1, cols=1)
+    interna = externa.cell(0, 0).add_table(rows=1, cols=1)
+    _paragrafo(interna.cell(0, 0), "{{INT", "ER", "NO}}")
+
+    saida = io.BytesIO()
+    doc.save(saida)
+    return saida.getvalue()
+
+
+def _textos(paragrafo) -> str:
+    """Texto de todos os <w:t> do parágrafo, inclusive em links, inserções e controles."""
+    return "".join(t.text or "" for t in paragrafo._p.xpath(".//w:t"))
+
+
+class PlaceholdersTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.dados = _template_de_teste()
+        cls.template = TemplateCompilado(cls.dados)
+        cls.doc = Document(io.BytesIO(cls.template.gerar_bytes(CONTEXTO)))
+
+    def test_chaves_encontradas_em_todas_as_partes(self):
+        self.assertEqual(self.template.chaves, set(CONTEXTO) | {"DESCONHECIDA"})
+
+    def test_token_quebrado_entre_runs(self):
+        p = self.doc.paragraphs[0]
+        self.assertEqual(_textos(p), "Contratado: Banda X.")
+        # o valor fica no primeiro run do token, com a formatação dele
+        self.assertEqual(p.runs[0].text, "Contratado: Banda X")
+        self.assertTrue(p.runs[0].bold)
+
+    def test_runs_em_hyperlink_ins_e_sdt(self):
+        textos = [_textos(p) for p in self.doc.paragraphs[1:4]]
+        self.assertEqual(textos, ["site fim", "antes sim", "valor"])
+
+    def test_placeholder_desconhecido_fica_como_esta(self):
+        self.assertEqual(_textos(self.doc.paragraphs[4]), "{{DESCONHECIDA}} e  R$ 10,00 ")
+
+    def test_cabecalho_rodape_e_tabela_aninhada(self):
+        secao = self.doc.sections[0]
+        self.assertEqual(_textos(secao.header.paragraphs[-1]), "topo")
+        self.assertEqual(_textos(secao.footer.paragraphs[-1]), "pé")
+        interna = self.doc.tables[0].cell(0, 0).tables[0]
+        self.assertEqual(_textos(interna.cell(0, 0).paragraphs[-1]), "célula")
+
+    def test_renderizacoes_nao_alteram_o_template(self):
+        self.template.gerar_bytes({"NOME": "Outra"})
+        doc = Document(io.BytesIO(self.template.gerar_bytes(CONTEXTO)))
+        self.assertEqual(_textos(doc.paragraphs[0]), "Contratado: Banda X.")
+
+
+class ZipTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # membro extra sem compressão e com nome não ASCII, como o Word não gera
+        origem = io.BytesIO(_template_de_teste())
+        with zipfile.ZipFile(origem, "a") as zf:
+            zf.writestr(zipfile.ZipInfo("customXml/anotação.bin", (2024, 5, 17, 10, 30, 8)),
+                        b"\x00" * 100, compress_type=zipfile.ZIP_STORED)
+        cls.dados = origem.getvalue()
+        cls.template = TemplateCompilado(cls.dados)
+        cls.gerado = cls.template.gerar_bytes(CONTEXTO)
+
+    def test_zip_valido(self):
+        with zipfile.ZipFile(io.BytesIO(self.gerado)) as zf:
+            self.assertIsNone(zf.testzip())
+        Document(io.BytesIO(self.gerado))
+
+    def test_membros_na_ordem_com_os_mesmos_metadados(self):
+        with zipfile.ZipFile(io.BytesIO(self.gerado)) as zf:
+            gerados = zf.infolist()
+        self.assertEqual([i.filename for i in gerados],
+                         [i.filename for i in self.template.membros])
+        for original, gerado in zip(self.template.membros, gerados):
+            self.assertEqual(gerado.date_time, original.date_time)
+
+    def test_partes_sem_placeholder_copiadas_byte_a_byte(self):
+        alteradas = set(self.template.partes)
+        self.assertIn("word/document.xml", alteradas)
+        originais = {info.filename: info for info in self.template.membros}
+        with zipfile.ZipFile(io.BytesIO(self.gerado)) as zf:
+            for info in zf.infolist():
+                if info.filename in alteradas:
+                    continue
+                original = originais[info.filename]
+                self.assertEqual(info.compress_type, original.compress_type)
+                self.assertEqual(_dados_brutos(self.gerado, info),
+                                 _dados_brutos(self.dados, original), info.filename)
+
+
+if __name__ == "__main__":
+    unittest.main()